@@ -48,15 +48,19 @@ def main() -> int:
         if line.strip()
     ]
 
+    # One batch shares attach validation, env and command setup across prompts.
+    # Outputs arrive lazily, so an invalid sample stops the batch before the
+    # remaining prompts are sent.
+    outputs = teacher.run_batch(
+        repo_dir=repo_dir,
+        prompts=prompts,
+        model_id=model_id,
+        agent=args.agent,
+        attach_url=args.attach,
+    )
+
     rows: List[Dict[str, Any]] = []
-    for i, prompt in enumerate(prompts):
-        assistant_text = teacher.run(
-            repo_dir=repo_dir,
-            prompt=prompt,
-            model_id=model_id,
-            agent=args.agent,
-            attach_url=args.attach,
-        )
+    for i, assistant_text in enumerate(outputs):
         payload = _validate_strict_sample(json.loads(assistant_text))
         payload["id"] = f"openhei_{i:06d}"
         payload["metadata"] = {
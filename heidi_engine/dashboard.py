@@ -71,6 +71,7 @@ from rich.table import Table
 from rich.text import Text
 
 from heidi_engine.state_machine import CANONICAL_AUTOTRAIN_DIR
+from heidi_engine.utils.io_jsonl import iter_jsonl_records
 
 # =============================================================================
 # CONFIGURATION - Adjust these for your needs
@@ -320,18 +321,15 @@ def load_new_events(run_id: str) -> List[Dict[str, Any]]:
         return []
 
     try:
-        with open(events_file) as f:
-            f.seek(last_event_position)
-            new_events = []
-            for line in f:
-                if line.strip():
-                    try:
-                        event = json.loads(line)
-                        new_events.append(event)
-                        events_cache.append(event)
-                    except json.JSONDecodeError:
-                        pass
-            last_event_position = f.tell()
+        # Rotated or truncated since the last read: start over
+        if events_file.stat().st_size < last_event_position:
+            last_event_position = 0
+
+        new_events = []
+        for end, event in iter_jsonl_records(str(events_file), last_event_position):
+            new_events.append(event)
+            events_cache.append(event)
+            last_event_position = end
         return new_events
     except Exception as e:
         console.print(f"[yellow]Warning: Failed to read events: {e}[/yellow]")
@@ -1151,17 +1149,19 @@ def list_runs() -> List[str]:
     """
     runs_dir = Path(AUTOTRAIN_DIR) / "runs"
 
-    if not runs_dir.exists():
+    # scandir gives is_dir() from the directory listing; one stat per run
+    try:
+        with os.scandir(runs_dir) as it:
+            run_dirs = [(entry.stat().st_mtime, entry) for entry in it if entry.is_dir()]
+    except OSError:
         return []
+    run_dirs.sort(key=lambda item: item[0], reverse=True)
 
-    runs = []
-    for run_path in sorted(runs_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
-        if not run_path.is_dir():
-            continue
-        if (run_path / "state.json").exists():
-            runs.append(run_path.name)
-
-    return runs
+    return [
+        entry.name
+        for _mtime, entry in run_dirs
+        if os.path.exists(os.path.join(entry.path, "state.json"))
+    ]
 
 
 def select_run() -> Optional[str]:
@@ -226,11 +226,14 @@ class PythonLoopRunner(LoopRunner):
 
     def _run_cmd(self, cmd: list, err_msg: str, check: bool = True):
         # We allow tests to mock subprocess.run, but here is the real invocation
+        # Output is captured as bytes; only stderr is ever read, and only on
+        # failure, so it is decoded once there instead of through a text layer.
         try:
-            res = subprocess.run(cmd, capture_output=True, text=True, check=check)
+            res = subprocess.run(cmd, capture_output=True, check=check)
             return res
         except subprocess.CalledProcessError as e:
-            msg = f"{err_msg}: {e.stderr}"
+            stderr = (e.stderr or b"").decode("utf-8", errors="replace")
+            msg = f"{err_msg}: {stderr}"
             telemetry.emit_event("pipeline_error", msg, "pipeline", self.current_round)
             self.current_state = "ERROR"
             raise RuntimeError(msg)
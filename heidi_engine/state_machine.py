@@ -9,13 +9,20 @@ PURPOSE:
 AUTOTRAIN_DIR: ~/.local/heidi-engine (canonical path - MUST NOT default to ./heidi_engine)
 """
 
+import copy
 import json
 import os
 import stat
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 CANONICAL_AUTOTRAIN_DIR = Path("~/.local/heidi-engine").expanduser()
 
@@ -105,11 +112,76 @@ PHASE_TRANSITIONS: Dict[Phase, Dict[Event, Phase]] = {
     },
 }
 
+# PHASE_TRANSITIONS flattened into a list indexed by
+# phase.value * _EVENT_STRIDE + event.value, so apply() dispatches with one
+# list index instead of two dict lookups. PHASE_TRANSITIONS stays the source
+# of truth.
+_EVENT_STRIDE = max(e.value for e in Event) + 1
+_TRANSITION_TABLE: List[Optional[Phase]] = [None] * (
+    (max(p.value for p in Phase) + 1) * _EVENT_STRIDE
+)
+for _phase, _transitions in PHASE_TRANSITIONS.items():
+    for _event, _target in _transitions.items():
+        _TRANSITION_TABLE[_phase.value * _EVENT_STRIDE + _event.value] = _target
+del _phase, _transitions, _event, _target
+
+# Status name recorded after a transition lands in each phase.
+_PHASE_TO_STATUS_NAME: Dict[Phase, str] = {p: Status.RUNNING.name for p in Phase}
+_PHASE_TO_STATUS_NAME[Phase.COMPLETE] = Status.COMPLETED.name
+_PHASE_TO_STATUS_NAME[Phase.ERROR] = Status.ERROR.name
+
 
 COLLECT_MODE_GATES: Set[Phase] = {
     Phase.TRAINING,
 }
 
+# COLLECT_MODE_GATES minus the phases where training is always allowed,
+# folded into a bitmask over Phase values for a single-AND check in apply().
+_COLLECT_GATED_MASK = 0
+for _phase in COLLECT_MODE_GATES - {Phase.COMPLETE, Phase.INITIALIZING}:
+    _COLLECT_GATED_MASK |= 1 << _phase.value
+del _phase
+
+# Keys a persisted state must carry to pass validate().
+_REQUIRED_KEYS = ("run_id", "mode", "phase", "status", "current_round")
+
+# Counter keys accepted by update_counters(); must match _default_counters().
+_COUNTER_KEYS = frozenset(
+    {
+        "teacher_generated",
+        "teacher_failed",
+        "raw_written",
+        "validated_ok",
+        "rejected_schema",
+        "rejected_secret",
+        "rejected_dedupe",
+        "test_pass",
+        "test_fail",
+        "train_step",
+        "train_loss",
+        "eval_json_parse_rate",
+        "eval_format_rate",
+    }
+)
+
+# Counters that are overwritten with the latest value instead of accumulated.
+_FLOAT_COUNTER_KEYS = frozenset({"train_loss"})
+
+# Usage keys accepted by update_usage(); must match _default_usage().
+_USAGE_KEYS = frozenset(
+    {
+        "requests_sent",
+        "input_tokens",
+        "output_tokens",
+        "rate_limits_hit",
+        "retries",
+        "estimated_cost_usd",
+    }
+)
+
+# Usage keys accumulated as floats rather than ints.
+_USAGE_FLOAT_KEYS = frozenset({"estimated_cost_usd"})
+
 
 class StateMachine:
     """
@@ -119,11 +191,15 @@ class StateMachine:
     not mutate state directly.
     """
 
+    __slots__ = ("autotrain_dir", "run_id", "_state", "_can_train_cache")
+
     def __init__(self, run_id: Optional[str] = None, autotrain_dir: Optional[Path] = None):
         self.autotrain_dir = autotrain_dir or CANONICAL_AUTOTRAIN_DIR
         self.run_id = run_id or self._generate_run_id()
 
         self._state: Dict[str, Any] = {}
+        # (mode name, phase name, result) of the last can_train() evaluation.
+        self._can_train_cache: Optional[Tuple[str, str, bool]] = None
         self._load_or_init()
 
     def _generate_run_id(self) -> str:
@@ -141,9 +217,14 @@ class StateMachine:
         state_file = self._get_state_path()
         if state_file.exists():
             try:
-                with open(state_file) as f:
-                    self._state = json.load(f)
+                with open(state_file, "rb") as f:
+                    raw = f.read()
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+                self._state = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 self.run_id = self._state.get("run_id", self.run_id)
+                # Backfill once here so hot update paths can index directly.
+                self._state.setdefault("counters", self._default_counters())
+                self._state.setdefault("usage", self._default_usage())
             except (json.JSONDecodeError, IOError):
                 self._initialize_default()
         else:
@@ -201,8 +282,9 @@ class StateMachine:
         temp_file = state_file.with_suffix(".tmp")
         self._state["updated_at"] = datetime.utcnow().isoformat()
 
+        # Compact: this runs on every counter/usage update.
         with open(temp_file, "w") as f:
-            json.dump(self._state, f, indent=2)
+            json.dump(self._state, f, separators=(",", ":"))
 
         os.replace(temp_file, state_file)
         os.chmod(state_file, stat.S_IRUSR | stat.S_IWUSR)
@@ -216,8 +298,13 @@ class StateMachine:
     def get_mode(self) -> Mode:
         return Mode[self._state.get("mode", Mode.IDLE.name)]
 
-    def get_state(self) -> Dict[str, Any]:
-        return self._state.copy()
+    def get_state(self) -> Mapping[str, Any]:
+        """Return a read-only live view of the state (no copy)."""
+        return MappingProxyType(self._state)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return an independent deep copy of the state for callers that mutate it."""
+        return copy.deepcopy(self._state)
 
     def apply(self, event: Event, **kwargs) -> Phase:
         """
@@ -227,25 +314,37 @@ class StateMachine:
         """
         current_phase = self.get_phase()
 
-        if event == Event.TRAIN_NOW:
-            mode = self.get_mode()
-            if mode == Mode.COLLECT and current_phase not in {Phase.COMPLETE, Phase.INITIALIZING}:
-                if current_phase in COLLECT_MODE_GATES:
-                    raise ValueError(f"Cannot TRAIN_NOW from {current_phase.name} in COLLECT mode")
+        if (
+            event == Event.TRAIN_NOW
+            and self._state.get("mode") == Mode.COLLECT.name
+            and _COLLECT_GATED_MASK & (1 << current_phase.value)
+        ):
+            raise ValueError(f"Cannot TRAIN_NOW from {current_phase.name} in COLLECT mode")
 
+        # Control requests that would not change anything skip the persist,
+        # so poll-driven callers don't rewrite state.json on every tick.
         if event == Event.REQUEST_STOP:
+            if self._state.get("stop_requested") and self._state.get("status") == Status.STOPPED.name:
+                return current_phase
             self._state["stop_requested"] = True
             self._state["status"] = Status.STOPPED.name
             self._persist()
             return current_phase
 
         if event == Event.REQUEST_PAUSE:
+            if self._state.get("pause_requested") and self._state.get("status") == Status.PAUSED.name:
+                return current_phase
             self._state["pause_requested"] = True
             self._state["status"] = Status.PAUSED.name
             self._persist()
             return current_phase
 
         if event == Event.REQUEST_RESUME:
+            if (
+                not self._state.get("pause_requested")
+                and self._state.get("status") == Status.RUNNING.name
+            ):
+                return current_phase
             self._state["pause_requested"] = False
             self._state["status"] = Status.RUNNING.name
             self._persist()
@@ -257,8 +356,7 @@ class StateMachine:
             self._persist()
             return Phase.ERROR
 
-        transitions = PHASE_TRANSITIONS.get(current_phase, {})
-        new_phase = transitions.get(event)
+        new_phase = _TRANSITION_TABLE[current_phase.value * _EVENT_STRIDE + event.value]
 
         if new_phase is None:
             raise ValueError(f"Illegal transition: {event.name} from {current_phase.name}")
@@ -266,13 +364,7 @@ class StateMachine:
         self._state["phase"] = new_phase.name
         self._state["last_event"] = event.name
         self._state["last_transition"] = f"{current_phase.name} -> {new_phase.name}"
-
-        if new_phase == Phase.COMPLETE:
-            self._state["status"] = Status.COMPLETED.name
-        elif new_phase == Phase.ERROR:
-            self._state["status"] = Status.ERROR.name
-        else:
-            self._state["status"] = Status.RUNNING.name
+        self._state["status"] = _PHASE_TO_STATUS_NAME[new_phase]
 
         self._persist()
         return new_phase
@@ -287,39 +379,50 @@ class StateMachine:
         return self._state["current_round"]
 
     def update_counters(self, delta: Dict[str, Any]) -> None:
-        counters = self._state.get("counters", self._default_counters())
+        counters = self._state["counters"]
         for key, value in delta.items():
-            if key in counters:
-                if key == "train_loss":
-                    counters[key] = float(value)
-                else:
-                    counters[key] += int(value)
-        self._state["counters"] = counters
+            if key not in _COUNTER_KEYS:
+                continue
+            if key in _FLOAT_COUNTER_KEYS:
+                counters[key] = float(value)
+            else:
+                counters[key] = counters.get(key, 0) + int(value)
         self._persist()
 
     def update_usage(self, delta: Dict[str, Any]) -> None:
-        usage = self._state.get("usage", self._default_usage())
+        usage = self._state["usage"]
         for key, value in delta.items():
-            if key in usage:
-                usage[key] += int(value) if isinstance(usage[key], int) else float(value)
-        self._state["usage"] = usage
+            if key not in _USAGE_KEYS:
+                continue
+            if key in _USAGE_FLOAT_KEYS:
+                usage[key] = usage.get(key, 0.0) + float(value)
+            else:
+                usage[key] = usage.get(key, 0) + int(value)
         self._persist()
 
     def can_train(self) -> bool:
         """Check if training is allowed in current mode/phase."""
-        mode = self.get_mode()
-        phase = self.get_phase()
+        mode_name = self._state.get("mode", Mode.IDLE.name)
+        phase_name = self._state.get("phase", Phase.INITIALIZING.name)
+        cache = self._can_train_cache
+        if cache is not None and cache[0] == mode_name and cache[1] == phase_name:
+            return cache[2]
 
+        mode = Mode[mode_name]
         if mode == Mode.TRAIN:
-            return True
-        if mode == Mode.COLLECT:
-            return phase in {Phase.COMPLETE, Phase.INITIALIZING}
-        return False
+            result = True
+        elif mode == Mode.COLLECT:
+            result = Phase[phase_name] in {Phase.COMPLETE, Phase.INITIALIZING}
+        else:
+            result = False
+
+        self._can_train_cache = (mode_name, phase_name, result)
+        return result
 
     def validate(self) -> bool:
         """Validate state schema."""
-        required = {"run_id", "mode", "phase", "status", "current_round"}
-        return required.issubset(self._state.keys())
+        state = self._state
+        return all(key in state for key in _REQUIRED_KEYS)
 
 
 def get_autotrain_dir() -> Path:
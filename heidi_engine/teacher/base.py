@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional, Protocol
+from typing import Callable, Dict, Iterator, Optional, Protocol, Sequence
 
 
 class TeacherBackend(Protocol):
@@ -18,20 +17,47 @@ class TeacherBackend(Protocol):
     ) -> str:
         """Run the teacher and return final assistant text."""
 
+    def run_batch(
+        self,
+        *,
+        repo_dir: str,
+        prompts: Sequence[str],
+        model_id: str,
+        agent: str,
+        attach_url: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Run the teacher once per prompt, lazily, yielding the final texts in order."""
+
+
+def _make_openhei() -> TeacherBackend:
+    # Lazy-import to avoid any optional deps until the backend is requested.
+    from .openhei_teacher import OpenHeiTeacher
+
+    return OpenHeiTeacher()
+
 
-@dataclass(frozen=True)
 class TeacherRegistry:
-    backends: Dict[str, TeacherBackend]
+    """Maps backend names to factories; instances are built on first get()."""
+
+    __slots__ = ("backends", "_instances")
+
+    def __init__(self, backends: Dict[str, Callable[[], TeacherBackend]]) -> None:
+        self.backends = backends
+        self._instances: Dict[str, TeacherBackend] = {}
+
+    def __repr__(self) -> str:
+        return f"TeacherRegistry(backends={self.backends!r})"
 
     @classmethod
     def from_env(cls) -> "TeacherRegistry":
-        # Lazy-import to avoid any optional deps at import time.
-        from .openhei_teacher import OpenHeiTeacher
-
-        openhei = OpenHeiTeacher()
-        return cls(backends={openhei.name: openhei})
+        return cls(backends={"openhei": _make_openhei})
 
     def get(self, name: str) -> TeacherBackend:
-        if name not in self.backends:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        factory = self.backends.get(name)
+        if factory is None:
             raise KeyError(f"Unknown teacher backend: {name}")
-        return self.backends[name]
+        instance = self._instances[name] = factory()
+        return instance
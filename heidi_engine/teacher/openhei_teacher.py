@@ -1,57 +1,168 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import errno
+import hashlib
+import http.client
 import json
 import os
 import random
-import socket
+import re
 import shlex
+import socket
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
-from urllib.parse import quote
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote, urlsplit
 
 from heidi_engine.telemetry import redact_secrets
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# JSON codec for the hot parse/encode paths. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catch the stdlib exception either way.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 class OpenHeiTeacherError(RuntimeError):
     pass
 
 
+class _OpenHeiStreamError(OpenHeiTeacherError):
+    """An error event in the CLI's JSONL stream (raised in fail-fast mode)."""
+
+
 def _bool_env(name: str, default: str = "0") -> bool:
     return os.environ.get(name, default).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+# One case-insensitive scan classifies an error message; each named group is a
+# category. Matching is by substring, as with the previous `in` checks.
+_ERROR_CLASS_RE = re.compile(
+    r"(?P<session_not_found>session not found)"
+    r"|(?P<retryable>429|too many requests|rate limit|usage limit|timeout|timed out"
+    r"|temporarily unavailable|502|503|504|bad gateway)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=128)
+def _classify_error(text: str) -> FrozenSet[str]:
+    """Return the set of error categories present in text."""
+
+    return frozenset(m.lastgroup for m in _ERROR_CLASS_RE.finditer(text))
+
+
 def _contains_session_not_found(text: str) -> bool:
-    return "session not found" in (text or "").lower()
+    return bool(text) and "session_not_found" in _classify_error(text)
 
 
 def _is_retryable_error(text: str) -> bool:
-    lower = (text or "").lower()
-    if not lower:
-        return False
-    if "429" in lower or "too many requests" in lower or "rate limit" in lower:
-        return True
-    if "usage limit" in lower:
-        return True
-    if "timeout" in lower or "timed out" in lower or "temporarily unavailable" in lower:
-        return True
-    if "502" in lower or "503" in lower or "504" in lower or "bad gateway" in lower:
-        return True
-    return False
+    return bool(text) and "retryable" in _classify_error(text)
+
+
+_BACKOFF_CAP_SEC = 30.0
+_BACKOFF_JITTER = 0.5
+
+# OS-level errnos that signal a read timeout rather than a broken connection.
+_TIMEOUT_ERRNOS = frozenset({errno.ETIMEDOUT, errno.EAGAIN, errno.EWOULDBLOCK})
+
+
+@lru_cache(maxsize=8)
+def _backoff_table(base: float) -> Tuple[float, ...]:
+    # Capped exponential delays for the first attempts; retries rarely go further.
+    return tuple(min(base * (1 << i), _BACKOFF_CAP_SEC) for i in range(8))
+
+
+def _compute_backoff(attempt: int, base: float) -> float:
+    """Truncated exponential backoff with multiplicative jitter.
+
+    min(cap, base * 2**attempt) * (1 + U(0, jitter)). The random module
+    reseeds itself in forked children, so parallel workers don't share jitter.
+    """
+
+    table = _backoff_table(base)
+    delay = table[attempt] if attempt < len(table) else min(base * 2**attempt, _BACKOFF_CAP_SEC)
+    return delay * (1.0 + random.uniform(0.0, _BACKOFF_JITTER))
 
 
 def _sleep_backoff(base: float, attempt: int) -> None:
-    # Exponential backoff with jitter to avoid synchronized retry storms.
-    delay = base * (2**attempt)
-    delay = min(delay, 60.0)
-    delay += random.uniform(0.0, base)
-    time.sleep(delay)
+    time.sleep(_compute_backoff(attempt, base))
+
+
+@lru_cache(maxsize=32)
+def _split_model_id(model_id: str) -> Tuple[str, str]:
+    """Split "provider/model" into (provider_id, model_name)."""
+
+    if "/" not in model_id:
+        raise OpenHeiTeacherError(f"Invalid model id (expected provider/model): {model_id!r}")
+    provider_id, model_name = model_id.split("/", 1)
+    return provider_id, model_name
+
+
+@lru_cache(maxsize=8)
+def _parse_cli(cli_raw: str) -> Tuple[str, ...]:
+    """Split an OPENHEI_CLI value into argv parts, defaulting to `openhei`."""
+
+    cli_raw = cli_raw.strip() or "openhei"
+    try:
+        cli_parts = tuple(shlex.split(cli_raw))
+    except ValueError:
+        cli_parts = ()
+    return cli_parts or ("openhei",)
+
+
+@lru_cache(maxsize=16)
+def _cmd_prefix(
+    cli_parts: Tuple[str, ...], repo_dir: str, model_id: str, agent: str
+) -> Tuple[str, ...]:
+    """Return the `openhei run` argv without --attach, built once per configuration."""
+
+    cmd = [*cli_parts, "run", "--format", "json", "--dir", repo_dir, "--model", model_id]
+
+    # OpenHei distinguishes primary agents vs subagents. Subagents like
+    # "general" can trigger failures when using `--attach`, so treat them
+    # as "use default primary agent" by omitting the flag.
+    if agent and agent not in {"general", "explore"}:
+        cmd.extend(["--agent", agent])
+    return tuple(cmd)
 
 
 def _doc_url(attach_url: str) -> str:
@@ -63,69 +174,185 @@ def _doc_url(attach_url: str) -> str:
     return url + "/doc"
 
 
+# Successful attach validations are recorded on disk for this long, so parallel
+# workers and later processes skip the probe.
+_ATTACH_CACHE_TTL_SEC = 300.0
+
+
+def _attach_cache_marker(doc: str) -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = hashlib.blake2b(doc.encode("utf-8"), digest_size=8).hexdigest()
+    return Path(base) / "heidi" / "attach" / key
+
+
+def _attach_cache_fresh(marker: Path) -> bool:
+    try:
+        return time.time() - marker.stat().st_mtime < _ATTACH_CACHE_TTL_SEC
+    except OSError:
+        return False
+
+
+def _probe_attach_url(doc: str, *, timeout_sec: float) -> None:
+    """GET {doc} and raise unless it returns HTTP 200. Never cached."""
+
+    # Goes through the shared connection pool so the validated keep-alive
+    # connection is reused by the first API request.
+    origin, target = _split_url(doc)
+    try:
+        conn, resp, _ = _send(origin, target, "GET", None, {}, timeout_sec=timeout_sec)
+        try:
+            resp.read()
+        except BaseException:
+            conn.close()
+            raise
+    except socket.timeout as e:
+        raise OpenHeiTeacherError(f"OPENHEI_ATTACH validation failed: GET {doc} timed out") from e
+    except (OSError, http.client.HTTPException) as e:
+        raise OpenHeiTeacherError(
+            f"OPENHEI_ATTACH validation failed: GET {doc} failed ({e})"
+        ) from e
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _POOL.release(origin, conn)
+
+    if resp.status != 200:
+        raise OpenHeiTeacherError(
+            f"OPENHEI_ATTACH validation failed: GET {doc} returned HTTP {resp.status}"
+        )
+
+
 @lru_cache(maxsize=32)
 def validate_openhei_attach_url(attach_url: str, *, timeout_sec: float = 2.5) -> None:
     """Fail-fast if OPENHEI_ATTACH doesn't look reachable.
 
     Contract: GET {OPENHEI_ATTACH}/doc returns HTTP 200.
-    This is cached per-process to avoid per-sample network calls.
+    Successes are cached per-process, and on disk (under the user cache dir)
+    for _ATTACH_CACHE_TTL_SEC so other processes skip the probe. Concurrent
+    first validations of one URL are serialized on a lock file, so only one
+    of them probes.
     """
 
     doc = _doc_url(attach_url)
     if not doc:
         raise OpenHeiTeacherError("OPENHEI_ATTACH is empty")
 
-    req = Request(doc, method="GET")
-    try:
-        with urlopen(req, timeout=timeout_sec) as resp:  # nosec - URL comes from env
-            status = getattr(resp, "status", None) or 200
-            if int(status) != 200:
-                raise OpenHeiTeacherError(
-                    f"OPENHEI_ATTACH validation failed: GET {doc} returned HTTP {status}"
-                )
-    except HTTPError as e:
-        raise OpenHeiTeacherError(
-            f"OPENHEI_ATTACH validation failed: GET {doc} returned HTTP {e.code}"
-        ) from e
-    except URLError as e:
-        raise OpenHeiTeacherError(
-            f"OPENHEI_ATTACH validation failed: GET {doc} failed ({e.reason})"
-        ) from e
-    except TimeoutError as e:
-        raise OpenHeiTeacherError(f"OPENHEI_ATTACH validation failed: GET {doc} timed out") from e
-
+    marker = _attach_cache_marker(doc)
+    if _attach_cache_fresh(marker):
+        return
 
-def _iter_jsonl_lines(text: str) -> Iterable[dict]:
-    for raw in text.splitlines():
-        line = raw.strip()
-        if not line:
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        lock_fd: Optional[int] = os.open(str(marker) + ".lock", os.O_CREAT | os.O_RDWR, 0o600)
+    except OSError:
+        # Unwritable cache dir: validate without the shared cache.
+        lock_fd = None
+    try:
+        if lock_fd is not None and fcntl is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            # Another process may have validated while this one waited.
+            if _attach_cache_fresh(marker):
+                return
+        _probe_attach_url(doc, timeout_sec=timeout_sec)
+        if lock_fd is not None:
+            try:
+                marker.touch()
+            except OSError:
+                pass
+    finally:
+        if lock_fd is not None:
+            # Closing the descriptor releases the flock.
+            os.close(lock_fd)
+
+
+def _iter_jsonl_lines(lines: Iterable[Union[str, bytes]]) -> Iterable[dict]:
+    for line in lines:
+        # Both JSON parsers skip surrounding whitespace (including the line
+        # terminator), so lines are parsed as-is instead of strip()-copied.
+        if not line or line.isspace():
             continue
         try:
-            yield json.loads(line)
-        except json.JSONDecodeError:
+            yield _json_loads(line)
+        except ValueError:
+            # JSONDecodeError, or invalid UTF-8 in a bytes line.
             # Fail-closed: JSON output is a contract.
             raise OpenHeiTeacherError("openhei --format json emitted non-JSON line")
 
 
+def _iter_lines(text: Union[str, bytes]) -> Iterator[Union[str, bytes]]:
+    """Yield the "\n"-terminated lines of text as slices, one at a time.
+
+    Unlike splitlines() nothing is materialized up front, and unlike
+    io.StringIO the text isn't copied into a second buffer first; each slice
+    can be freed once parsed. A "\r" before the "\n" is left to the parser.
+    """
+
+    find = text.find
+    sep = "\n" if isinstance(text, str) else b"\n"
+    pos = 0
+    n = len(text)
+    while pos < n:
+        nl = find(sep, pos)
+        end = n if nl < 0 else nl + 1
+        yield text[pos:end]
+        pos = end
+
+
+def _join_stripped(parts: List[str]) -> str:
+    """Return "".join(parts).strip(), building the joined text only once.
+
+    Whitespace is stripped from the outermost non-blank parts before joining,
+    instead of copying the whole (possibly megabytes long) result again.
+    """
+
+    lo, hi = 0, len(parts)
+    while lo < hi and (not parts[lo] or parts[lo].isspace()):
+        lo += 1
+    while hi > lo and (not parts[hi - 1] or parts[hi - 1].isspace()):
+        hi -= 1
+    if lo == hi:
+        return ""
+    if hi - lo == 1:
+        return parts[lo].strip()
+    return "".join([parts[lo].lstrip(), *parts[lo + 1 : hi - 1], parts[hi - 1].rstrip()])
+
+
 def parse_openhei_jsonl_events(stdout: str) -> str:
-    """Parse `openhei run --format json` JSONL and return final text.
+    """Parse a complete `openhei run --format json` stdout and return final text.
+
+    See parse_openhei_jsonl_stream() for the contract.
+    """
+
+    return parse_openhei_jsonl_stream(_iter_lines(stdout))
+
+
+def parse_openhei_jsonl_stream(
+    lines: Iterable[Union[str, bytes]], *, fail_fast: bool = False
+) -> str:
+    """Parse `openhei run --format json` JSONL lines and return final text.
 
 Rules (Path B contract):
   - Collect events where `type == 'text'` and `part.time.end` exists.
   - Concatenate `part.text` in order.
   - If any error event is present, fail-closed.
   - If no completed text parts exist, fail-closed.
+
+With fail_fast, the first error event raises immediately (without reading
+the rest of lines) instead of after the whole stream.
   """
 
     parts: List[str] = []
     errors: List[str] = []
 
-    for event in _iter_jsonl_lines(stdout):
+    for event in _iter_jsonl_lines(lines):
         event_type = event.get("type")
 
         if event_type == "error":
             msg = event.get("message") or event.get("error") or "openhei error"
             errors.append(str(msg))
+            if fail_fast:
+                break
             continue
 
         # Some versions wrap errors inside a session object.
@@ -133,6 +360,8 @@ Rules (Path B contract):
             sess = event.get("session") or {}
             if isinstance(sess, dict) and sess.get("error"):
                 errors.append(str(sess.get("error")))
+                if fail_fast:
+                    break
             continue
 
         if event_type != "text":
@@ -151,12 +380,226 @@ Rules (Path B contract):
             parts.append(text)
 
     if errors:
-        raise OpenHeiTeacherError("openhei stream error: " + " | ".join(errors[:3]))
+        raise _OpenHeiStreamError("openhei stream error: " + " | ".join(errors[:3]))
 
     if not parts:
         raise OpenHeiTeacherError("openhei stream contained no completed text parts")
 
-    return "".join(parts).strip()
+    return _join_stripped(parts)
+
+
+def _cli_env() -> Mapping[Any, Any]:
+    """Return the environment for the openhei CLI.
+
+    Uses the bytes environment where the OS has one, so exec can pass it
+    through without re-encoding every variable.
+    """
+
+    if os.supports_bytes_environ:
+        env: Dict[Any, Any] = os.environb.copy()
+        env.setdefault(b"NO_COLOR", b"1")
+        env.setdefault(b"OPENHEI_NO_TUI", b"1")
+    else:
+        env = os.environ.copy()
+        env.setdefault("NO_COLOR", "1")
+        env.setdefault("OPENHEI_NO_TUI", "1")
+    return env
+
+
+def _run_openhei_cli(
+    cmd: Sequence[str],
+    *,
+    stdin_bytes: bytes,
+    env: Mapping[Any, Any],
+    timeout_sec: float,
+    max_stdout_chars: int,
+) -> Tuple[int, str, Optional[str], Optional[OpenHeiTeacherError], bool]:
+    """Run the openhei CLI once, parsing its JSONL stdout as it is produced.
+
+    Pipes are binary: stdin_bytes is written as-is and stdout lines go to the
+    JSON parser undecoded, so max_stdout_chars is counted in bytes.
+
+    Returns (returncode, stderr, text, parse_error, terminated); exactly one of
+    text and parse_error is set. On the first error event parse_error is that
+    stream error and, if the CLI is still running, it is terminated; terminated
+    says whether returncode is the result of that. Raises subprocess.TimeoutExpired if the
+    process had to be killed at the deadline, and OpenHeiTeacherError if
+    stdout exceeds max_stdout_chars.
+    """
+
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    ) as proc:
+        timed_out = threading.Event()
+        stderr_chunks: List[bytes] = []
+
+        def kill_on_timeout() -> None:
+            if proc.poll() is None:
+                timed_out.set()
+                proc.kill()
+
+        def feed_stdin() -> None:
+            try:
+                proc.stdin.write(stdin_bytes)
+                proc.stdin.close()
+            except OSError:
+                # The CLI exited (or was killed) before reading all of stdin.
+                pass
+
+        def drain_stderr() -> None:
+            stderr_chunks.append(proc.stderr.read())
+
+        stdout_chars = 0
+        exceeded = False
+
+        def limited_stdout() -> Iterable[bytes]:
+            nonlocal stdout_chars, exceeded
+            for line in proc.stdout:
+                stdout_chars += len(line)
+                if stdout_chars > max_stdout_chars:
+                    exceeded = True
+                    raise OpenHeiTeacherError(
+                        f"openhei stdout exceeded limit (> {max_stdout_chars} chars)"
+                    )
+                yield line
+
+        timer = threading.Timer(timeout_sec, kill_on_timeout)
+        helpers = [
+            threading.Thread(target=feed_stdin, daemon=True),
+            threading.Thread(target=drain_stderr, daemon=True),
+        ]
+        timer.start()
+        for t in helpers:
+            t.start()
+
+        text: Optional[str] = None
+        parse_error: Optional[OpenHeiTeacherError] = None
+        terminated = False
+        try:
+            try:
+                text = parse_openhei_jsonl_stream(limited_stdout(), fail_fast=True)
+            except _OpenHeiStreamError as e:
+                # The run has already failed closed; stop the CLI now rather
+                # than waiting for (and buffering) the rest of its output.
+                parse_error = e
+                if proc.poll() is None:
+                    proc.terminate()
+                    terminated = True
+            except OpenHeiTeacherError as e:
+                if exceeded:
+                    raise
+                parse_error = e
+                # Let the CLI run to completion so its exit status and stderr
+                # still take precedence over the parse failure.
+                while proc.stdout.read(65536):
+                    pass
+            proc.wait()
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            timer.cancel()
+            for t in helpers:
+                t.join()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout_sec)
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    return proc.returncode, stderr, text, parse_error, terminated
+
+
+def _encode_prompt(prompt: str) -> bytes:
+    # OpenHei Path-B: prompt is provided via stdin (no --prompt flag).
+    # Encoded once and reused by every attempt.
+    stdin_text = prompt if prompt.endswith("\n") else (prompt + "\n")
+    return stdin_text.encode("utf-8")
+
+
+async def _arun_openhei_cli(
+    cmd: Sequence[str],
+    *,
+    stdin_bytes: bytes,
+    env: Mapping[Any, Any],
+    timeout_sec: float,
+    max_stdout_chars: int,
+) -> Tuple[int, str, Optional[str], Optional[OpenHeiTeacherError], bool]:
+    """asyncio counterpart of _run_openhei_cli(), with the same contract.
+
+    stdin, stdout and stderr are serviced by the event loop instead of helper
+    threads. stdout lines are collected (bounded by max_stdout_chars) and
+    parsed once the process exits, so the CLI is never terminated early and
+    terminated is always False.
+    """
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        # A single JSONL line may carry the whole completion.
+        limit=max_stdout_chars + 1,
+    )
+
+    async def feed_stdin() -> None:
+        try:
+            proc.stdin.write(stdin_bytes)
+            await proc.stdin.drain()
+            proc.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            # The CLI exited (or was killed) before reading all of stdin.
+            pass
+
+    async def read_stdout() -> List[bytes]:
+        lines: List[bytes] = []
+        stdout_chars = 0
+        while True:
+            try:
+                line = await proc.stdout.readline()
+            except ValueError as e:
+                # A line longer than the stream limit is over max_stdout_chars.
+                raise OpenHeiTeacherError(
+                    f"openhei stdout exceeded limit (> {max_stdout_chars} chars)"
+                ) from e
+            if not line:
+                return lines
+            stdout_chars += len(line)
+            if stdout_chars > max_stdout_chars:
+                raise OpenHeiTeacherError(
+                    f"openhei stdout exceeded limit (> {max_stdout_chars} chars)"
+                )
+            lines.append(line)
+
+    async def communicate() -> Tuple[List[bytes], bytes]:
+        _, lines, stderr = await asyncio.gather(feed_stdin(), read_stdout(), proc.stderr.read())
+        await proc.wait()
+        return lines, stderr
+
+    try:
+        lines, stderr_bytes = await asyncio.wait_for(communicate(), timeout_sec)
+    except asyncio.TimeoutError as e:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout_sec) from e
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+        raise
+
+    text: Optional[str] = None
+    parse_error: Optional[OpenHeiTeacherError] = None
+    try:
+        text = parse_openhei_jsonl_stream(lines)
+    except OpenHeiTeacherError as e:
+        parse_error = e
+    stderr = stderr_bytes.decode("utf-8", errors="replace")
+    return proc.returncode, stderr, text, parse_error, False
 
 
 def _api_url(base: str, path: str) -> str:
@@ -167,96 +610,267 @@ def _api_url(base: str, path: str) -> str:
     return b + p
 
 
+# (scheme, host, port) identifying a pooled HTTP origin.
+_Origin = Tuple[str, str, int]
+
+
+@lru_cache(maxsize=64)
+def _split_url(url: str) -> Tuple[_Origin, str]:
+    """Split an absolute URL into its pool origin and request target."""
+
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "").lower()
+    if scheme not in {"http", "https"}:
+        raise OpenHeiTeacherError(f"Unsupported OpenHei API URL scheme: {url!r}")
+    try:
+        port = parts.port
+    except ValueError as e:
+        raise OpenHeiTeacherError(f"Invalid OpenHei API URL: {url!r}") from e
+    host = parts.hostname
+    if not host:
+        raise OpenHeiTeacherError(f"Invalid OpenHei API URL: {url!r}")
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    return (scheme, host, port or (443 if scheme == "https" else 80)), target
+
+
+class _ConnectionPool:
+    """Idle keep-alive http.client connections, keyed by origin.
+
+    Connections are handed out exclusively and only returned once their
+    response has been fully read, so each one is used by a single thread at a
+    time.
+    """
+
+    def __init__(self, max_idle_per_origin: int = 4) -> None:
+        self._idle: Dict[_Origin, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._max_idle = max_idle_per_origin
+
+    def acquire(
+        self, origin: _Origin, timeout_sec: float
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused) for origin, creating one if none is idle."""
+
+        with self._lock:
+            idle = self._idle.get(origin)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            scheme, host, port = origin
+            conn_cls = (
+                http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            )
+            return conn_cls(host, port, timeout=timeout_sec), False
+        conn.timeout = timeout_sec
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout_sec)
+        return conn, True
+
+    def release(self, origin: _Origin, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(origin, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+
+_POOL = _ConnectionPool()
+
+
+def _send(
+    origin: _Origin,
+    target: str,
+    method: str,
+    body: Optional[bytes],
+    headers: Dict[str, str],
+    *,
+    timeout_sec: float,
+) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse, socket.socket]:
+    """Send a request on a pooled connection and return it with its response.
+
+    The connection's socket is returned too: once a response that closes the
+    connection is read, conn.sock is None but the response still reads from it.
+    """
+
+    while True:
+        conn, reused = _POOL.acquire(origin, timeout_sec)
+        try:
+            sent = False
+            conn.request(method, target, body=body, headers=headers)
+            sent = True
+            sock = conn.sock
+            return conn, conn.getresponse(), sock
+        except ConnectionError as e:
+            conn.close()
+            # The server may have dropped an idle keep-alive connection; retry
+            # on a fresh one. Failures on a fresh connection are real errors.
+            # Once the request is sent, only a close before any response byte
+            # shows it went unprocessed; a reset after that may follow a
+            # processed POST (e.g. a message), which must not be sent twice.
+            if reused and (not sent or isinstance(e, http.client.RemoteDisconnected)):
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+
+
 def _http_json(method: str, url: str, payload: Optional[dict], *, timeout_sec: float) -> Any:
+    origin, target = _split_url(url)
+    headers = {"Accept": "application/json"}
     data = None
     if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-    req = Request(url, method=method)
-    req.add_header("Accept", "application/json")
-    if data is not None:
-        req.add_header("Content-Type", "application/json")
+        data = _json_dumps_bytes(payload)
+        headers["Content-Type"] = "application/json"
     try:
-        with urlopen(req, data=data, timeout=timeout_sec) as resp:  # nosec
-            text = resp.read().decode("utf-8", errors="replace")
-    except HTTPError as e:
-        text = (e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else "")
-        raise OpenHeiTeacherError(f"OpenHei API error: {e.code} {text[:500]}") from e
-    except URLError as e:
-        raise OpenHeiTeacherError(f"OpenHei API request failed: {e.reason}") from e
-    except TimeoutError as e:
+        conn, resp, _ = _send(origin, target, method, data, headers, timeout_sec=timeout_sec)
+        try:
+            raw = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+    except socket.timeout as e:
         raise OpenHeiTeacherError(f"OpenHei API request timed out: {url}") from e
+    except (OSError, http.client.HTTPException) as e:
+        raise OpenHeiTeacherError(f"OpenHei API request failed: {e}") from e
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _POOL.release(origin, conn)
+
+    if not 200 <= resp.status < 300:
+        text = raw[:2000].decode("utf-8", errors="replace")
+        raise OpenHeiTeacherError(f"OpenHei API error: {resp.status} {text[:500]}")
 
     try:
-        return json.loads(text) if text else {}
+        return _json_loads(raw) if raw else {}
     except json.JSONDecodeError as e:
+        text = raw[:2000].decode("utf-8", errors="replace")
         raise OpenHeiTeacherError(f"OpenHei API returned non-JSON: {text[:500]}") from e
 
 
-def _http_stream(method: str, url: str, *, timeout_sec: float):
-    req = Request(url, method=method)
-    req.add_header("Accept", "text/event-stream")
+@contextmanager
+def _http_stream(
+    method: str,
+    url: str,
+    *,
+    timeout_sec: float,
+    on_connect: Optional[Callable[[socket.socket], None]] = None,
+) -> Iterator[http.client.HTTPResponse]:
+    """Open a streaming request; on_connect gets its socket once the status is OK.
+
+    Shutting that socket down from another thread ends the stream for a reader
+    blocked on it.
+    """
+
+    origin, target = _split_url(url)
     try:
-        return urlopen(req, timeout=timeout_sec)  # nosec - URL comes from env
-    except HTTPError as e:
-        text = (e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else "")
-        raise OpenHeiTeacherError(f"OpenHei API error: {e.code} {text[:500]}") from e
-    except URLError as e:
-        raise OpenHeiTeacherError(f"OpenHei API request failed: {e.reason}") from e
-    except TimeoutError as e:
+        conn, resp, sock = _send(
+            origin, target, method, None, {"Accept": "text/event-stream"}, timeout_sec=timeout_sec
+        )
+    except socket.timeout as e:
         raise OpenHeiTeacherError(f"OpenHei API request timed out: {url}") from e
+    except (OSError, http.client.HTTPException) as e:
+        raise OpenHeiTeacherError(f"OpenHei API request failed: {e}") from e
+
+    try:
+        if not 200 <= resp.status < 300:
+            text = resp.read(4096).decode("utf-8", errors="replace")
+            raise OpenHeiTeacherError(f"OpenHei API error: {resp.status} {text[:500]}")
+        if on_connect is not None:
+            on_connect(sock)
+        yield resp
+    finally:
+        # An event stream is never read to the end, so its connection can't go
+        # back to the pool.
+        resp.close()
+        conn.close()
 
 
-def _iter_sse_data_messages(lines: Iterable[bytes]) -> Iterable[str]:
-    """Yield SSE `data:` payloads (joined by \n) per event."""
+# The only SSE field the collector consumes; every other line is skipped.
+_SSE_DATA_PREFIX = b"data:"
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
 
-    data_lines: List[str] = []
-    for raw in lines:
-        try:
-            line = raw.decode("utf-8", errors="replace")
-        except Exception:
-            line = str(raw)
-        line = line.rstrip("\r\n")
+
+def _iter_sse_data_messages(stream: BinaryIO) -> Iterable[bytes]:
+    """Yield SSE `data:` payloads (joined by \n) per event, as raw bytes.
+
+    Lines are pulled with stream.readline() (buffered, in C) and classified on
+    bytes; payloads are handed to the JSON parser undecoded.
+    """
+
+    readline = stream.readline
+    # Events almost always carry a single data: line, which is yielded as-is;
+    # `rest` only fills for multi-line events and is reused between them.
+    first: Optional[bytes] = None
+    rest: List[bytes] = []
+    while True:
+        raw = readline()
+        if not raw:
+            break
+        line = raw.rstrip(b"\r\n")
 
         # Blank line delimits an event.
-        if line == "":
-            if data_lines:
-                yield "\n".join(data_lines)
-                data_lines = []
+        if not line:
+            if first is not None:
+                if rest:
+                    yield b"\n".join([first, *rest])
+                    rest.clear()
+                else:
+                    yield first
+                first = None
             continue
 
-        if line.startswith(":"):
-            # Comment / keepalive.
-            continue
-        if line.startswith("data:"):
-            data_lines.append(line[5:].lstrip())
-            continue
+        if line[:_SSE_DATA_PREFIX_LEN] == _SSE_DATA_PREFIX:
+            payload = line[_SSE_DATA_PREFIX_LEN:].lstrip()
+            if first is None:
+                first = payload
+            else:
+                rest.append(payload)
 
-        # Ignore other SSE fields: event:, id:, retry:
+        # Ignore comments/keepalives (":") and other SSE fields: event:, id:, retry:
 
-    if data_lines:
-        yield "\n".join(data_lines)
+    if first is not None:
+        yield b"\n".join([first, *rest]) if rest else first
 
 
-def _iter_sse_json_events(lines: Iterable[bytes]) -> Iterable[Dict[str, Any]]:
-    for payload in _iter_sse_data_messages(lines):
+def _iter_sse_json_events(stream: BinaryIO) -> Iterable[Dict[str, Any]]:
+    for payload in _iter_sse_data_messages(stream):
         payload = payload.strip()
         if not payload:
             continue
         try:
-            event = json.loads(payload)
-        except json.JSONDecodeError:
-            continue
+            event = _json_loads(payload)
+        except ValueError:
+            # Invalid UTF-8 (or JSON): decode leniently and retry once.
+            try:
+                event = json.loads(payload.decode("utf-8", errors="replace"))
+            except json.JSONDecodeError:
+                continue
         if isinstance(event, dict):
+            # Interned types hit the identity fast path in the handler table.
+            et = event.get("type")
+            if type(et) is str:
+                event["type"] = sys.intern(et)
             yield event
 
 
+@lru_cache(maxsize=256)
+def _redact_cached(text: str) -> str:
+    # Streams repeat the same status/error message; redact each distinct one once.
+    return redact_secrets(text)
+
+
 def _format_openhei_error(err: Any) -> str:
     if isinstance(err, dict):
         # Common patterns include {type, message} or {code, message}.
         msg = err.get("message") or err.get("error") or ""
         if isinstance(msg, str) and msg.strip():
-            return redact_secrets(msg.strip())
-    return redact_secrets(json.dumps(err, ensure_ascii=False)[:2000])
+            return _redact_cached(msg.strip())
+    return _redact_cached(json.dumps(err, ensure_ascii=False)[:2000])
 
 
 class _AssistantTextCollector:
@@ -264,9 +878,12 @@ class _AssistantTextCollector:
         self.session_id = session_id
         self.message_id = message_id
         self._part_order: List[str] = []
-        self._text_by_part: Dict[str, str] = {}
+        # Text chunks per part; joined only in text() to keep accumulation linear.
+        self._text_by_part: Dict[str, List[str]] = {}
         self._completed = False
         self._last_relevant_t = time.monotonic()
+        # Clock reading for the event being fed; handlers stamp activity with it.
+        self._now = self._last_relevant_t
         self._error: Optional[str] = None
 
     @property
@@ -286,123 +903,153 @@ class _AssistantTextCollector:
             return
         self.message_id = message_id
 
-    def feed(self, event: Dict[str, Any]) -> None:
+    def feed(self, event: Dict[str, Any], now: Optional[float] = None) -> None:
+        """Consume one event; `now` lets the caller share its clock reading."""
+
+        self._now = time.monotonic() if now is None else now
         et = event.get("type")
+        if et == "message.part.delta":
+            # Deltas dominate a streamed response; skip the table lookup.
+            props = event.get("properties")
+            self._on_part_delta(event, props if isinstance(props, dict) else event)
+            return
+
+        handler = self._HANDLERS.get(et)
+        if handler is None:
+            return
         # OpenHei event shapes vary between transports/versions. Newer SSE events
         # carry a `properties` object. Older/alternate shapes may put fields at
         # the top-level. Accept both by normalizing `props` to a dict view of
         # event properties.
         props = event.get("properties")
         if not isinstance(props, dict):
-            # Fallback to using the event dict itself (excluding `type`). This
-            # keeps compatibility with non-wrapped events that include sessionID,
-            # messageID, part, info, etc. as top-level keys.
-            props = {k: v for k, v in event.items() if k != "type"}
-
-        if et in {"session.status", "session.idle"}:
-            sess = props.get("sessionID")
-            if sess == self.session_id:
-                # Keep-alive progress; useful when providers are rate-limiting.
-                self._last_relevant_t = time.monotonic()
-                status = props.get("status")
-                if et == "session.status" and isinstance(status, dict) and status.get("type") == "retry":
-                    msg = status.get("message")
-                    if isinstance(msg, str) and _is_retryable_error(msg):
-                        self._error = redact_secrets(msg.strip())
+            # Fallback to reading fields from the event dict itself. This keeps
+            # compatibility with non-wrapped events that include sessionID,
+            # messageID, part, info, etc. as top-level keys. The event is used
+            # as-is without copying; its `type` is the event type, which
+            # _on_part_updated ignores when the event stands in for the part.
+            props = event
+        handler(self, event, props)
+
+    def _on_session_status(self, event: Dict[str, Any], props: Dict[str, Any]) -> None:
+        # Handles both `session.status` and `session.idle`.
+        sess = props.get("sessionID")
+        if sess == self.session_id:
+            # Keep-alive progress; useful when providers are rate-limiting.
+            self._last_relevant_t = self._now
+            status = props.get("status")
+            if (
+                event.get("type") == "session.status"
+                and isinstance(status, dict)
+                and status.get("type") == "retry"
+            ):
+                msg = status.get("message")
+                if isinstance(msg, str) and _is_retryable_error(msg):
+                    self._error = _redact_cached(msg.strip())
+
+    def _on_session_error(self, event: Dict[str, Any], props: Dict[str, Any]) -> None:
+        sess = props.get("sessionID")
+        if sess == self.session_id:
+            self._error = _format_openhei_error(props.get("error"))
+
+    def _on_message_updated(self, event: Dict[str, Any], props: Dict[str, Any]) -> None:
+        # `info` may be nested or at top-level depending on server version.
+        info = props.get("info") if isinstance(props.get("info"), dict) else event.get("info") or props
+        if not isinstance(info, dict):
             return
-
-        if et == "session.error":
-            sess = props.get("sessionID")
-            if sess == self.session_id:
-                self._error = _format_openhei_error(props.get("error"))
+        if info.get("sessionID") != self.session_id:
+            return
+        if info.get("role") != "assistant":
+            return
+        mid = info.get("id")
+        if isinstance(mid, str) and mid:
+            self._set_message_id_if_needed(mid)
+        if self.message_id and mid != self.message_id:
             return
 
-        if et == "message.updated":
-            # `info` may be nested or at top-level depending on server version.
-            info = props.get("info") if isinstance(props.get("info"), dict) else event.get("info") or props
-            if not isinstance(info, dict):
-                return
-            if info.get("sessionID") != self.session_id:
-                return
-            if info.get("role") != "assistant":
-                return
-            mid = info.get("id")
-            if isinstance(mid, str) and mid:
-                self._set_message_id_if_needed(mid)
-            if self.message_id and mid != self.message_id:
-                return
+        self._last_relevant_t = self._now
+        time_obj = info.get("time")
+        if isinstance(time_obj, dict) and time_obj.get("completed") is not None:
+            self._completed = True
 
-            self._last_relevant_t = time.monotonic()
-            time_obj = info.get("time")
-            if isinstance(time_obj, dict) and time_obj.get("completed") is not None:
-                self._completed = True
+    def _on_part_delta(self, event: Dict[str, Any], props: Dict[str, Any]) -> None:
+        # support both nested `properties` and flat event shapes
+        sess = props.get("sessionID")
+        if sess != self.session_id:
+            return
+        mid = props.get("messageID")
+        if isinstance(mid, str) and mid:
+            self._set_message_id_if_needed(mid)
+        if self.message_id and mid != self.message_id:
+            return
+        if props.get("field") != "text":
             return
 
-        if et == "message.part.delta":
-            # support both nested `properties` and flat event shapes
-            sess = props.get("sessionID")
-            if sess != self.session_id:
-                return
-            mid = props.get("messageID")
-            if isinstance(mid, str) and mid:
-                self._set_message_id_if_needed(mid)
-            if self.message_id and mid != self.message_id:
-                return
-            if props.get("field") != "text":
-                return
-
-            part_id = props.get("partID")
-            delta = props.get("delta")
-            if not isinstance(part_id, str) or not part_id:
-                return
-            if not isinstance(delta, str) or not delta:
-                return
-            if part_id not in self._text_by_part:
-                self._part_order.append(part_id)
-                self._text_by_part[part_id] = ""
-            self._text_by_part[part_id] += delta
-            self._last_relevant_t = time.monotonic()
+        part_id = props.get("partID")
+        delta = props.get("delta")
+        if not isinstance(part_id, str) or not part_id:
+            return
+        if not isinstance(delta, str) or not delta:
+            return
+        chunks = self._text_by_part.get(part_id)
+        if chunks is None:
+            self._part_order.append(part_id)
+            chunks = self._text_by_part[part_id] = []
+        chunks.append(delta)
+        self._last_relevant_t = self._now
+
+    def _on_part_updated(self, event: Dict[str, Any], props: Dict[str, Any]) -> None:
+        # `part` may be nested or provided at top-level.
+        part = props.get("part") if isinstance(props.get("part"), dict) else event.get("part") or props
+        if not isinstance(part, dict):
+            return
+        if part.get("sessionID") != self.session_id:
+            return
+        mid = part.get("messageID")
+        if isinstance(mid, str) and mid:
+            self._set_message_id_if_needed(mid)
+        if self.message_id and mid != self.message_id:
             return
 
-        if et == "message.part.updated":
-            # `part` may be nested or provided at top-level.
-            part = props.get("part") if isinstance(props.get("part"), dict) else event.get("part") or props
-            if not isinstance(part, dict):
-                return
-            if part.get("sessionID") != self.session_id:
-                return
-            mid = part.get("messageID")
-            if isinstance(mid, str) and mid:
-                self._set_message_id_if_needed(mid)
-            if self.message_id and mid != self.message_id:
-                return
+        # A flat event without a `part` object is read as the part itself, but
+        # its `type` names the event, not the part.
+        ptype = part.get("type") if part is not event else None
+        part_id = part.get("id")
+        if not isinstance(part_id, str) or not part_id:
+            return
 
-            ptype = part.get("type")
-            part_id = part.get("id")
-            if not isinstance(part_id, str) or not part_id:
-                return
+        if ptype == "text":
+            text = part.get("text")
+            if isinstance(text, str):
+                if part_id not in self._text_by_part:
+                    self._part_order.append(part_id)
+                self._text_by_part[part_id] = [text]
+                self._last_relevant_t = self._now
+            time_obj = part.get("time")
+            if isinstance(time_obj, dict) and time_obj.get("end") is not None:
+                self._completed = True
+            return
 
-            if ptype == "text":
-                text = part.get("text")
-                if isinstance(text, str):
-                    if part_id not in self._text_by_part:
-                        self._part_order.append(part_id)
-                    self._text_by_part[part_id] = text
-                    self._last_relevant_t = time.monotonic()
-                time_obj = part.get("time")
-                if isinstance(time_obj, dict) and time_obj.get("end") is not None:
-                    self._completed = True
-                return
+        if ptype == "step-finish":
+            self._last_relevant_t = self._now
+            self._completed = True
 
-            if ptype == "step-finish":
-                self._last_relevant_t = time.monotonic()
-                self._completed = True
-                return
+    # Event type -> handler; events of any other type are ignored.
+    _HANDLERS = {
+        "session.status": _on_session_status,
+        "session.idle": _on_session_status,
+        "session.error": _on_session_error,
+        "message.updated": _on_message_updated,
+        "message.part.delta": _on_part_delta,
+        "message.part.updated": _on_part_updated,
+    }
 
     def text(self) -> str:
         if not self._part_order:
             return ""
-        return "".join(self._text_by_part.get(pid, "") for pid in self._part_order).strip()
+        return _join_stripped(
+            [chunk for pid in self._part_order for chunk in self._text_by_part.get(pid, ())]
+        )
 
 
 def _api_run_once(
@@ -414,9 +1061,7 @@ def _api_run_once(
     agent: str,
     timeout_sec: float,
 ) -> str:
-    if "/" not in model_id:
-        raise OpenHeiTeacherError(f"Invalid model id (expected provider/model): {model_id!r}")
-    provider_id, model_name = model_id.split("/", 1)
+    provider_id, model_name = _split_model_id(model_id)
 
     session = _http_json(
         "POST",
@@ -439,55 +1084,221 @@ def _api_run_once(
     overall_deadline = time.monotonic() + float(timeout_sec)
     inactivity_timeout = min(30.0, max(5.0, float(timeout_sec) / 10.0))
 
-    message_sent = False
     read_timeout = min(60.0, max(5.0, float(timeout_sec) / 5.0))
 
+    # The message POST runs on its own pooled connection in a worker thread so
+    # the SSE reader can drain deltas while the server is still handling it.
+    message_thread: Optional[threading.Thread] = None
+    message_errors: List[OpenHeiTeacherError] = []
+    # The connected stream's socket; a failed POST shuts it down so a reader
+    # blocked on an idle stream sees EOF instead of waiting for read_timeout.
+    stream_socks: List[socket.socket] = []
+    wake_lock = threading.Lock()
+    message_url = _api_url(
+        attach_url, f"/session/{quote(session_id)}/message?directory={quote(repo_dir)}"
+    )
+    message_payload = {
+        "messageID": msg_id,
+        "model": {"providerID": provider_id, "modelID": model_name},
+        "agent": agent or "",
+        "parts": [{"type": "text", "text": prompt}],
+    }
+
+    def post_message() -> None:
+        try:
+            _http_json("POST", message_url, message_payload, timeout_sec=timeout_sec)
+        except OpenHeiTeacherError as e:
+            with wake_lock:
+                message_errors.append(e)
+                for sock in stream_socks:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+
+    def stream_connected(sock: socket.socket) -> None:
+        with wake_lock:
+            # Checked under the lock so a POST failing during the reconnect
+            # is raised here rather than missed by the new stream.
+            if message_errors:
+                raise message_errors[0]
+            stream_socks[:] = [sock]
+
     while True:
         now = time.monotonic()
         if now >= overall_deadline:
             raise OpenHeiTeacherError("OpenHei SSE timed out waiting for assistant output")
+        if message_errors:
+            raise message_errors[0]
         if collector.error:
             raise OpenHeiTeacherError(f"OpenHei SSE error: {collector.error}")
         if collector.message_id and (now - collector.last_relevant_t) > inactivity_timeout:
             raise OpenHeiTeacherError("OpenHei SSE inactive while waiting for completion")
 
-        with _http_stream("GET", stream_url, timeout_sec=read_timeout) as resp:
-            if not message_sent:
+        with _http_stream(
+            "GET", stream_url, timeout_sec=read_timeout, on_connect=stream_connected
+        ) as resp:
+            if message_thread is None:
                 # Send message after stream is connected to avoid missing early deltas.
                 # Include directory query parameter for API parity with OpenHei clients.
-                _http_json(
-                    "POST",
-                    _api_url(attach_url, f"/session/{quote(session_id)}/message?directory={quote(repo_dir)}"),
-                    {
-                        "messageID": msg_id,
-                        "model": {"providerID": provider_id, "modelID": model_name},
-                        "agent": agent or "",
-                        "parts": [{"type": "text", "text": prompt}],
-                    },
-                    timeout_sec=timeout_sec,
-                )
-                message_sent = True
+                message_thread = threading.Thread(target=post_message, daemon=True)
+                message_thread.start()
 
             try:
                 for event in _iter_sse_json_events(resp):
-                    collector.feed(event)
+                    # One clock read per event serves both the collector's
+                    # activity stamp and the deadline check below.
+                    now = time.monotonic()
+                    collector.feed(event, now)
+                    if message_errors:
+                        raise message_errors[0]
                     if collector.error:
                         raise OpenHeiTeacherError(f"OpenHei SSE error: {collector.error}")
                     if collector.completed:
                         text = collector.text()
                         if not text:
                             raise OpenHeiTeacherError("OpenHei SSE contained no completed assistant text")
+                        # The POST normally returns right after completion; wait
+                        # briefly so its connection goes back to the pool.
+                        message_thread.join(
+                            timeout=max(0.0, min(5.0, overall_deadline - time.monotonic()))
+                        )
                         return text
-                    if time.monotonic() >= overall_deadline:
+                    if now >= overall_deadline:
                         raise OpenHeiTeacherError("OpenHei SSE timed out waiting for assistant output")
-            except (socket.timeout, OSError) as e:
-                # urllib/httpclient can raise OSError("cannot read from timed out object") after a timeout.
-                msg = str(e).lower()
-                if "timed out" in msg or "timeout" in msg:
+            except socket.timeout:
+                # Read timeout: reconnect the stream and re-check the deadlines.
+                # The timed-out response is closed on exit and never read again.
+                continue
+            except OSError as e:
+                if e.errno in _TIMEOUT_ERRNOS:
                     continue
                 raise
 
 
+def _free_local_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class _OpenHeiWorker:
+    """A long-lived `openhei serve` process used as a local attach endpoint.
+
+    `openhei run` handles one prompt per process (it reads stdin to EOF), so
+    the persistent worker is the CLI's own server: it is started once and
+    every prompt then goes over the HTTP attach API. The process is restarted
+    if it exits. Workers are shared per CLI through `_shared_worker` and
+    terminated at interpreter exit.
+    """
+
+    def __init__(self, cli_parts: Tuple[str, ...], *, startup_timeout_sec: float = 20.0) -> None:
+        self._cli_parts = cli_parts
+        self._startup_timeout_sec = startup_timeout_sec
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._url = ""
+
+    def url(self) -> str:
+        """Return the worker's base URL, starting it first if it isn't running."""
+
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            return self._url
+
+    def _start(self) -> None:
+        port = _free_local_port()
+        url = f"http://127.0.0.1:{port}"
+        cmd = [*self._cli_parts, "serve", "--hostname", "127.0.0.1", "--port", str(port)]
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=_cli_env(),
+            )
+        except FileNotFoundError as e:
+            raise OpenHeiTeacherError("openhei binary not found in PATH") from e
+
+        deadline = time.monotonic() + self._startup_timeout_sec
+        while True:
+            if proc.poll() is not None:
+                raise OpenHeiTeacherError(
+                    f"openhei serve exited during startup (code {proc.returncode})"
+                )
+            try:
+                # Probed directly: a cached success may predate this process.
+                _probe_attach_url(_doc_url(url), timeout_sec=1.0)
+                break
+            except OpenHeiTeacherError:
+                if time.monotonic() >= deadline:
+                    proc.kill()
+                    proc.wait()
+                    raise OpenHeiTeacherError(
+                        f"openhei serve not ready after {self._startup_timeout_sec}s"
+                    )
+                time.sleep(0.25)
+
+        self._proc = proc
+        self._url = url
+
+    def close(self) -> None:
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+_WORKERS: Dict[Tuple[str, ...], _OpenHeiWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def _shared_worker(cli_parts: Tuple[str, ...]) -> _OpenHeiWorker:
+    """Return the process-wide worker for `cli_parts`, creating it on first use.
+
+    Repo dir, model and agent travel with each request, so one `openhei serve`
+    per CLI serves every OpenHeiTeacher in the process.
+    """
+
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(cli_parts)
+        if worker is None:
+            worker = _WORKERS[cli_parts] = _OpenHeiWorker(cli_parts)
+        return worker
+
+
+@atexit.register
+def _shutdown_workers() -> None:
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+@dataclass(frozen=True)
+class _RunPlan:
+    """Settings OpenHeiTeacher resolves once and shares across prompts."""
+
+    repo_dir: str
+    model_id: str
+    agent: str
+    strict_attach: bool
+    attach_url: Optional[str]
+    use_http: bool
+    env: Mapping[Any, Any]
+    cmd_attach: Optional[Tuple[str, ...]]
+    cmd_no_attach: Tuple[str, ...]
+
+
 @dataclass
 class OpenHeiTeacher:
     name: str = "openhei"
@@ -495,6 +1306,39 @@ class OpenHeiTeacher:
     max_stdout_chars: int = 5_000_000
     retries: int = 2
     retry_backoff_sec: float = 2.0
+    _worker: Optional[_OpenHeiWorker] = field(default=None, init=False, repr=False, compare=False)
+    _env_cache: Optional[Mapping[Any, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The worker process and the cached environment belong to this
+        # process; an unpickled copy starts its own.
+        state = self.__dict__.copy()
+        state["_worker"] = None
+        state["_env_cache"] = None
+        return state
+
+    def _get_env(self) -> Mapping[Any, Any]:
+        """Return the CLI environment, built on first use and then reused."""
+
+        if self._env_cache is None:
+            self._env_cache = _cli_env()
+        return self._env_cache
+
+    def close(self) -> None:
+        """Release the shared `openhei serve` worker.
+
+        The worker may be serving other teachers, so it keeps running until
+        interpreter exit.
+        """
+
+        self._worker = None
+
+    def _serve_url(self) -> str:
+        if self._worker is None:
+            self._worker = _shared_worker(_parse_cli(os.environ.get("OPENHEI_CLI") or ""))
+        return self._worker.url()
 
     def run(
         self,
@@ -505,146 +1349,159 @@ class OpenHeiTeacher:
         agent: str,
         attach_url: Optional[str] = None,
     ) -> str:
+        plan = self._plan(repo_dir, model_id, agent, attach_url)
+        return self._run_prompt(plan, prompt)
+
+    def run_batch(
+        self,
+        *,
+        repo_dir: str,
+        prompts: Sequence[str],
+        model_id: str,
+        agent: str,
+        attach_url: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Run several prompts against one teacher configuration.
+
+        Attach resolution and validation, the CLI environment and command
+        lines are set up once (before the first text is requested) and shared
+        by every prompt. Yields one final assistant text per prompt, in order.
+        Each prompt runs only when its text is requested, so a caller that
+        rejects an output stops the batch there; the first failing prompt
+        raises.
+        """
+
+        plan = self._plan(repo_dir, model_id, agent, attach_url)
+        return (self._run_prompt(plan, prompt) for prompt in prompts)
+
+    async def arun(
+        self,
+        *,
+        repo_dir: str,
+        prompt: str,
+        model_id: str,
+        agent: str,
+        attach_url: Optional[str] = None,
+    ) -> str:
+        """Async run(): CLI attempts run as asyncio subprocesses.
+
+        Many prompts can be awaited concurrently (e.g. with asyncio.gather)
+        from one event loop without a thread per process. Setup and HTTP
+        attach runs use blocking sockets and are moved to a worker thread.
+        """
+
+        plan = await asyncio.to_thread(self._plan, repo_dir, model_id, agent, attach_url)
+        if plan.use_http:
+            text = await asyncio.to_thread(self._run_http, plan, prompt)
+            if text is not None:
+                return text
+
+        stdin_bytes = _encode_prompt(prompt)
+        ladder = self._cmd_ladder(plan)
+        cmd, retries = next(ladder)
+        while True:
+            try:
+                return await self._arun_cmd(plan, cmd, stdin_bytes, retries=retries)
+            except OpenHeiTeacherError as e:
+                cmd, retries = ladder.throw(e)
+
+    def _plan(
+        self, repo_dir: str, model_id: str, agent: str, attach_url: Optional[str]
+    ) -> _RunPlan:
         strict_attach = _bool_env("OPENHEI_ATTACH_STRICT", "0")
         attach_url = (attach_url or "").strip() or None
-        if attach_url:
+        if not attach_url and _bool_env("OPENHEI_SERVE", "0"):
+            # Send prompts to a persistent local `openhei serve` instead of
+            # spawning `openhei run` per call. The worker probes its own URL
+            # when it starts; its random port must not enter the disk cache.
+            attach_url = self._serve_url()
+        elif attach_url:
             validate_openhei_attach_url(attach_url)
 
-        # Prefer HTTP attach API when available (no need for openhei CLI).
-        use_http = attach_url and _bool_env("OPENHEI_ATTACH_HTTP", "1")
-        if use_http and attach_url:
-            last_err: Optional[str] = None
-            for attempt in range(self.retries + 1):
-                try:
-                    return _api_run_once(
-                        attach_url=attach_url,
-                        repo_dir=repo_dir,
-                        prompt=prompt,
-                        model_id=model_id,
-                        agent=agent,
-                        timeout_sec=float(self.timeout_sec),
-                    )
-                except OpenHeiTeacherError as e:
-                    last_err = str(e)
-                    if strict_attach:
-                        raise
-                    # Stale attach contexts should be retried once, then fall back to non-attach mode.
-                    if _contains_session_not_found(last_err):
-                        if attempt == 0:
-                            continue
-                        break
-                    if attempt < self.retries and _is_retryable_error(last_err):
-                        _sleep_backoff(self.retry_backoff_sec, attempt)
-                        continue
-                    raise
+        cli_parts = _parse_cli(os.environ.get("OPENHEI_CLI") or "")
 
-            # Non-strict attach fallback: try non-attach mode (CLI) after a stale session.
-            # This matches the attach semantics even if the environment lacks the CLI.
-            use_http = False
+        prefix = _cmd_prefix(cli_parts, repo_dir, model_id, agent)
 
-        # OpenHei Path-B: prompt is provided via stdin (no --prompt flag).
-        stdin_text = prompt if prompt.endswith("\n") else (prompt + "\n")
+        return _RunPlan(
+            repo_dir=repo_dir,
+            model_id=model_id,
+            agent=agent,
+            strict_attach=strict_attach,
+            attach_url=attach_url,
+            # Prefer HTTP attach API when available (no need for openhei CLI).
+            use_http=bool(attach_url) and _bool_env("OPENHEI_ATTACH_HTTP", "1"),
+            # Built once per teacher and shared, unmodified, by every prompt and attempt.
+            env=self._get_env(),
+            cmd_attach=(*prefix, "--attach", attach_url) if attach_url else None,
+            cmd_no_attach=prefix,
+        )
 
-        env = os.environ.copy()
-        env.setdefault("NO_COLOR", "1")
-        env.setdefault("OPENHEI_NO_TUI", "1")
+    def _run_http(self, plan: _RunPlan, prompt: str) -> Optional[str]:
+        """Run one prompt over the HTTP attach API.
 
-        cli_raw = (os.environ.get("OPENHEI_CLI") or "openhei").strip() or "openhei"
-        try:
-            cli_parts = shlex.split(cli_raw)
-        except ValueError:
-            cli_parts = ["openhei"]
-        if not cli_parts:
-            cli_parts = ["openhei"]
-
-        def build_cmd(maybe_attach: Optional[str]) -> list[str]:
-            cmd = [
-                *cli_parts,
-                "run",
-                "--format",
-                "json",
-                "--dir",
-                repo_dir,
-                "--model",
-                model_id,
-            ]
-
-            # OpenHei distinguishes primary agents vs subagents. Subagents like
-            # "general" can trigger failures when using `--attach`, so treat them
-            # as "use default primary agent" by omitting the flag.
-            if agent and agent not in {"general", "explore"}:
-                cmd.extend(["--agent", agent])
-            if maybe_attach:
-                cmd.extend(["--attach", maybe_attach])
-            return cmd
-
-        def run_cmd(cmd: list[str], *, retries: int) -> str:
-            last_err: Optional[str] = None
-            for attempt in range(retries + 1):
-                try:
-                    res = subprocess.run(
-                        cmd,
-                        input=stdin_text,
-                        capture_output=True,
-                        text=True,
-                        timeout=self.timeout_sec,
-                        env=env,
-                    )
-                except FileNotFoundError as e:
-                    raise OpenHeiTeacherError("openhei binary not found in PATH") from e
-                except subprocess.TimeoutExpired as e:
-                    last_err = f"openhei timeout after {self.timeout_sec}s"
-                    if attempt < retries:
-                        _sleep_backoff(self.retry_backoff_sec, attempt)
-                        continue
-                    raise OpenHeiTeacherError(last_err) from e
+        Returns None when a stale attach session should fall back to the CLI.
+        """
 
-                stdout = res.stdout or ""
-                stderr = redact_secrets(res.stderr or "")
+        for attempt in range(self.retries + 1):
+            try:
+                return _api_run_once(
+                    attach_url=plan.attach_url or "",
+                    repo_dir=plan.repo_dir,
+                    prompt=prompt,
+                    model_id=plan.model_id,
+                    agent=plan.agent,
+                    timeout_sec=float(self.timeout_sec),
+                )
+            except OpenHeiTeacherError as e:
+                last_err = str(e)
+                if plan.strict_attach:
+                    raise
+                # Stale attach contexts should be retried once, then fall back to non-attach mode.
+                if _contains_session_not_found(last_err):
+                    if attempt == 0:
+                        continue
+                    break
+                if attempt < self.retries and _is_retryable_error(last_err):
+                    _sleep_backoff(self.retry_backoff_sec, attempt)
+                    continue
+                raise
+        return None
 
-                if len(stdout) > self.max_stdout_chars:
-                    raise OpenHeiTeacherError(
-                        f"openhei stdout exceeded limit ({len(stdout)} chars > {self.max_stdout_chars})"
-                    )
+    def _run_prompt(self, plan: _RunPlan, prompt: str) -> str:
+        if plan.use_http:
+            text = self._run_http(plan, prompt)
+            if text is not None:
+                return text
+            # Non-strict attach fallback: try non-attach mode (CLI) after a stale session.
+            # This matches the attach semantics even if the environment lacks the CLI.
 
-                if res.returncode != 0:
-                    last_err = (stderr.strip() or "openhei run failed")[:2000]
-                    # Session-not-found indicates attach context is invalid; do not keep retrying blindly.
-                    if _contains_session_not_found(last_err):
-                        raise OpenHeiTeacherError(last_err)
-                    if attempt < retries:
-                        if _is_retryable_error(last_err):
-                            _sleep_backoff(self.retry_backoff_sec, attempt)
-                        else:
-                            _sleep_backoff(self.retry_backoff_sec / 2.0, attempt)
-                        continue
-                    raise OpenHeiTeacherError(last_err)
+        stdin_bytes = _encode_prompt(prompt)
+        ladder = self._cmd_ladder(plan)
+        cmd, retries = next(ladder)
+        while True:
+            try:
+                return self._run_cmd(plan, cmd, stdin_bytes, retries=retries)
+            except OpenHeiTeacherError as e:
+                cmd, retries = ladder.throw(e)
 
-                try:
-                    return parse_openhei_jsonl_events(stdout)
-                except OpenHeiTeacherError as e:
-                    last_err = str(e)
-                    if _contains_session_not_found(last_err):
-                        raise
-                    if attempt < retries:
-                        if _is_retryable_error(last_err):
-                            _sleep_backoff(self.retry_backoff_sec, attempt)
-                        else:
-                            _sleep_backoff(self.retry_backoff_sec / 2.0, attempt)
-                        continue
-                    raise
+    def _cmd_ladder(
+        self, plan: _RunPlan
+    ) -> Generator[Tuple[Tuple[str, ...], int], OpenHeiTeacherError, None]:
+        """Yield the (cmd, retries) CLI attempts to make for one prompt, in order.
 
-            raise OpenHeiTeacherError(last_err or "openhei run failed")
+        The caller runs each attempt (with _run_cmd or _arun_cmd) and throws
+        its OpenHeiTeacherError back in: the ladder either yields the next
+        attempt or re-raises the error as final. Shared by run() and arun().
+        """
 
         # Attach-first, with specific recovery for stale attach sessions.
-        if attach_url:
-            cmd_attach = build_cmd(attach_url)
+        if plan.cmd_attach is not None:
             try:
-                return run_cmd(cmd_attach, retries=self.retries)
+                yield plan.cmd_attach, self.retries
             except OpenHeiTeacherError as e:
                 if not _contains_session_not_found(str(e)):
                     raise
-                if strict_attach:
+                if plan.strict_attach:
                     raise
 
                 print(
@@ -652,7 +1509,7 @@ class OpenHeiTeacher:
                     file=sys.stderr,
                 )
                 try:
-                    return run_cmd(cmd_attach, retries=0)
+                    yield plan.cmd_attach, 0
                 except OpenHeiTeacherError as e2:
                     if not _contains_session_not_found(str(e2)):
                         raise
@@ -661,8 +1518,99 @@ class OpenHeiTeacher:
                         "[WARN] OpenHei attach still failing; falling back to non-attach mode.",
                         file=sys.stderr,
                     )
-                    cmd_no_attach = build_cmd(None)
-                    return run_cmd(cmd_no_attach, retries=self.retries)
 
         # Non-attach mode.
-        return run_cmd(build_cmd(None), retries=self.retries)
+        yield plan.cmd_no_attach, self.retries
+
+    def _cli_timeout_delay(
+        self, attempt: int, retries: int, exc: subprocess.TimeoutExpired
+    ) -> float:
+        """Backoff before retrying a timed-out CLI attempt; raises on the last one."""
+
+        if attempt < retries:
+            return _compute_backoff(attempt, self.retry_backoff_sec)
+        raise OpenHeiTeacherError(f"openhei timeout after {self.timeout_sec}s") from exc
+
+    def _cli_outcome(
+        self,
+        attempt: int,
+        retries: int,
+        returncode: int,
+        raw_stderr: str,
+        text: Optional[str],
+        parse_error: Optional[OpenHeiTeacherError],
+        terminated: bool,
+    ) -> Tuple[Optional[str], float]:
+        """Classify one finished CLI attempt.
+
+        Returns (text, 0.0) on success or (None, backoff) to retry; raises when
+        the error is final.
+        """
+
+        # When we terminated the CLI at a stream error event, the exit status
+        # is our own doing and the event is the error to report. Otherwise the
+        # CLI's exit status and stderr take precedence, as for any other run.
+        if returncode != 0 and not terminated:
+            stderr = redact_secrets(raw_stderr or "")
+            last_err = (stderr.strip() or "openhei run failed")[:2000]
+            # Session-not-found indicates attach context is invalid; do not keep retrying blindly.
+            if _contains_session_not_found(last_err) or attempt >= retries:
+                raise OpenHeiTeacherError(last_err)
+        elif parse_error is None:
+            return text, 0.0
+        else:
+            last_err = str(parse_error)
+            if _contains_session_not_found(last_err) or attempt >= retries:
+                raise parse_error
+
+        if _is_retryable_error(last_err):
+            return None, _compute_backoff(attempt, self.retry_backoff_sec)
+        return None, _compute_backoff(attempt, self.retry_backoff_sec / 2.0)
+
+    def _run_cmd(
+        self, plan: _RunPlan, cmd: Sequence[str], stdin_bytes: bytes, *, retries: int
+    ) -> str:
+        for attempt in range(retries + 1):
+            try:
+                outcome = _run_openhei_cli(
+                    cmd,
+                    stdin_bytes=stdin_bytes,
+                    env=plan.env,
+                    timeout_sec=self.timeout_sec,
+                    max_stdout_chars=self.max_stdout_chars,
+                )
+            except FileNotFoundError as e:
+                raise OpenHeiTeacherError("openhei binary not found in PATH") from e
+            except subprocess.TimeoutExpired as e:
+                delay = self._cli_timeout_delay(attempt, retries, e)
+            else:
+                text, delay = self._cli_outcome(attempt, retries, *outcome)
+                if text is not None:
+                    return text
+            time.sleep(delay)
+
+        raise OpenHeiTeacherError("openhei run failed")
+
+    async def _arun_cmd(
+        self, plan: _RunPlan, cmd: Sequence[str], stdin_bytes: bytes, *, retries: int
+    ) -> str:
+        for attempt in range(retries + 1):
+            try:
+                outcome = await _arun_openhei_cli(
+                    cmd,
+                    stdin_bytes=stdin_bytes,
+                    env=plan.env,
+                    timeout_sec=self.timeout_sec,
+                    max_stdout_chars=self.max_stdout_chars,
+                )
+            except FileNotFoundError as e:
+                raise OpenHeiTeacherError("openhei binary not found in PATH") from e
+            except subprocess.TimeoutExpired as e:
+                delay = self._cli_timeout_delay(attempt, retries, e)
+            else:
+                text, delay = self._cli_outcome(attempt, retries, *outcome)
+                if text is not None:
+                    return text
+            await asyncio.sleep(delay)
+
+        raise OpenHeiTeacherError("openhei run failed")
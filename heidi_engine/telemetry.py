@@ -56,6 +56,7 @@ CONFIG VALIDATION:
 """
 
 import atexit
+import gzip
 import json
 import os
 import re
@@ -64,20 +65,45 @@ import sys
 import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
 
 from heidi_engine.state_machine import CANONICAL_AUTOTRAIN_DIR
+from heidi_engine.utils.io_jsonl import iter_jsonl_records
 
 try:
     import requests
 except ImportError:
     requests = None
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
 # Store remote states in memory
-_remote_states: Dict[str, Any] = {}
+# (least recently reported first; capped at MAX_REMOTE_STATES, see
+# _store_remote_state)
+_remote_states: "OrderedDict[str, Any]" = OrderedDict()
+_remote_states_lock = threading.Lock()
 
 # =============================================================================
 # CONFIGURATION - Adjust these for your needs
@@ -107,6 +133,23 @@ EVENT_LOG_MAX_SIZE_MB = int(os.environ.get("EVENT_LOG_MAX_SIZE_MB", "100"))
 # Number of rotated log files to keep
 EVENT_LOG_RETENTION = int(os.environ.get("EVENT_LOG_RETENTION", "5"))
 
+# State write-behind interval in seconds
+# TUNABLE: Counter/usage updates reach state.json at most this often (and on
+# every event flush); lower for fresher dashboards, raise for fewer rewrites
+STATE_FLUSH_SEC = float(os.environ.get("STATE_FLUSH_SEC", "1.0"))
+
+# Dashboard reporter: unchanged state is re-sent only this often (seconds)
+# TUNABLE: Lower if the dashboard should notice a silent worker sooner
+REPORTER_HEARTBEAT_SEC = float(os.environ.get("REPORTER_HEARTBEAT_SEC", "60"))
+
+# GPU summary served by /status is refreshed at most this often (seconds)
+# TUNABLE: VRAM/utilization rarely change meaningfully faster than this
+GPU_POLL_INTERVAL_SECONDS = float(os.environ.get("GPU_POLL_INTERVAL_SECONDS", "5"))
+
+# Remote run states kept by the status server's /report endpoint
+# TUNABLE: Runs that haven't reported for longest are dropped past this count
+MAX_REMOTE_STATES = int(os.environ.get("MAX_REMOTE_STATES", "10000"))
+
 # =============================================================================
 # EVENT SCHEMA VERSION (FROZEN - DO NOT CHANGE)
 # =============================================================================
@@ -114,36 +157,40 @@ EVENT_LOG_RETENTION = int(os.environ.get("EVENT_LOG_RETENTION", "5"))
 EVENT_VERSION = "1.0"
 
 # Allowed fields for event schema (enforce strict schema)
-ALLOWED_EVENT_FIELDS: Set[str] = {
-    "event_version",
-    "ts",
-    "run_id",
-    "round",
-    "stage",
-    "level",
-    "event_type",
-    "message",
-    "counters_delta",
-    "usage_delta",
-    "artifact_paths",
-    "prev_hash",
-}
+ALLOWED_EVENT_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "event_version",
+        "ts",
+        "run_id",
+        "round",
+        "stage",
+        "level",
+        "event_type",
+        "message",
+        "counters_delta",
+        "usage_delta",
+        "artifact_paths",
+        "prev_hash",
+    }
+)
 
 # Allowed fields for HTTP status response (redacted, no secrets)
-ALLOWED_STATUS_FIELDS: Set[str] = {
-    "run_id",
-    "status",
-    "current_round",
-    "current_stage",
-    "stop_requested",
-    "pause_requested",
-    "counters",
-    "usage",
-    "gpu_summary",
-    "last_event_ts",
-    "health",
-    "updated_at",
-}
+ALLOWED_STATUS_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "run_id",
+        "status",
+        "current_round",
+        "current_stage",
+        "stop_requested",
+        "pause_requested",
+        "counters",
+        "usage",
+        "gpu_summary",
+        "last_event_ts",
+        "health",
+        "updated_at",
+    }
+)
 
 
 # =============================================================================
@@ -157,7 +204,7 @@ SECRET_PATTERNS = [
     (r"glpat-[a-zA-Z0-9\-]{20,}", "[GITLAB_TOKEN]"),
     (r"s[k]-[a-zA-Z0-9]{20,}", "[OPENAI_KEY]"),
     (r"Bearer\s+[\w\-]{20,}", "[BEARER_TOKEN]"),
-    (r'(?i)(api[_-]?key|apikey|secret[_-]?key)\s*[:=]\s*["\']?[\w\-]{20,}', "[API_KEY]"),
+    (r'(api[_-]?key|apikey|secret[_-]?key)\s*[:=]\s*["\']?[\w\-]{20,}', "[API_KEY]"),
     (r"A[K]IA[0-9A-Z]{16}", "[AWS_KEY]"),
     (r"-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----", "[PRIVATE_KEY]"),
     (r"-----BEGIN\s+OPENSSH\s+PRIVATE\s+KEY-----", "[SSH_KEY]"),
@@ -167,6 +214,94 @@ SECRET_PATTERNS = [
     (r'token[_-]?(id|key)?\s*[:=]\s*["\']?[\w\-]{20,}', "[TOKEN]"),
 ]
 
+# Case-folded substrings at least one of which occurs in any SECRET_PATTERNS
+# match. ASCII text containing none of them can't hold a secret, so the regex
+# scan is skipped. Only for ASCII text: under IGNORECASE the regex also
+# matches e.g. "ı"/"İ" against "i", which casefold() doesn't fold. Extend this
+# when adding a pattern.
+_SECRET_TRIGGERS = ("ghp_", "glpat-", "sk-", "bearer", "api", "secret", "akia", "begin", "token")
+
+# All SECRET_PATTERNS as one case-insensitive alternation, so redaction is a
+# single pass over the text. Group g<i> identifies the matching pattern; at a
+# given position the earliest pattern in the list wins.
+_SECRET_RE = re.compile(
+    "|".join(f"(?P<g{i}>{pattern})" for i, (pattern, _) in enumerate(SECRET_PATTERNS)),
+    re.IGNORECASE,
+)
+_SECRET_REPLACEMENTS = {f"g{i}": replacement for i, (_, replacement) in enumerate(SECRET_PATTERNS)}
+
+
+def _secret_replacement(match: "re.Match[str]") -> str:
+    return _SECRET_REPLACEMENTS[match.lastgroup]
+
+
+# ASCII texts at least this long are scanned with Hyperscan when it is
+# installed; below it the compiled regex is cheaper than the scan setup.
+# The database is byte-oriented (no UTF8/UCP), so \s, \w and caseless
+# matching only agree with _SECRET_RE on ASCII text.
+HYPERSCAN_MIN_LENGTH = 4096
+
+
+def _compile_secret_db() -> Any:
+    """Compile SECRET_PATTERNS into a Hyperscan block-mode database, if available."""
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=[pattern.encode("ascii") for pattern, _ in SECRET_PATTERNS],
+            ids=list(range(len(SECRET_PATTERNS))),
+            elements=len(SECRET_PATTERNS),
+            flags=[flags] * len(SECRET_PATTERNS),
+        )
+    except Exception:
+        # A pattern Hyperscan can't compile keeps redaction on the regex path.
+        return None
+    return db
+
+
+_SECRET_DB = _compile_secret_db()
+_SECRET_REPLACEMENT_BYTES = [replacement.encode("ascii") for _, replacement in SECRET_PATTERNS]
+
+
+def _redact_secrets_hyperscan(text: str) -> str:
+    """
+    Redact SECRET_PATTERNS with one DFA scan over the bytes of ASCII text.
+
+    Hyperscan reports every (pattern, start, end) match. They are resolved
+    like the regex path: leftmost start first, the earliest pattern at that
+    start, its longest match, and no overlaps.
+    """
+    data = text.encode("utf-8")
+    best: Dict[int, tuple] = {}
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        current = best.get(start)
+        if (
+            current is None
+            or pattern_id < current[0]
+            or (pattern_id == current[0] and end > current[1])
+        ):
+            best[start] = (pattern_id, end)
+
+    _SECRET_DB.scan(data, match_event_handler=on_match)
+    if not best:
+        return text
+
+    out = bytearray()
+    pos = 0
+    for start in sorted(best):
+        if start < pos:
+            continue
+        pattern_id, end = best[start]
+        out += data[pos:start]
+        out += _SECRET_REPLACEMENT_BYTES[pattern_id]
+        pos = end
+    out += data[pos:]
+    return out.decode("utf-8")
+
+
 # ANSI escape sequence pattern for stripping
 ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
@@ -176,14 +311,19 @@ MAX_ERROR_LENGTH = 200
 MAX_PATH_LENGTH = 100
 
 
+def _has_secret_trigger(text: str) -> bool:
+    folded = text.casefold()
+    return any(trigger in folded for trigger in _SECRET_TRIGGERS)
+
+
 def redact_secrets(text: str) -> str:
     """
     Redact secrets from text before writing to logs.
 
     HOW IT WORKS:
-        - Iterates through SECRET_PATTERNS
-        - Replaces matches with placeholder
         - Strips ANSI escape sequences
+        - Returns early if ASCII text has no _SECRET_TRIGGERS substring
+        - Replaces SECRET_PATTERNS matches with their placeholder in one pass
 
     SECURITY:
         - Never logs actual secrets
@@ -195,11 +335,15 @@ def redact_secrets(text: str) -> str:
     # Strip ANSI first
     text = ANSI_ESCAPE.sub("", text)
 
-    # Redact secrets
-    for pattern, replacement in SECRET_PATTERNS:
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    # Cheap prefilter: most text (e.g. CLI stderr) has no candidate at all.
+    # Non-ASCII text always gets the regex (see _SECRET_TRIGGERS).
+    if text.isascii() and not _has_secret_trigger(text):
+        return text
 
-    return text
+    # Redact secrets
+    if _SECRET_DB is not None and len(text) >= HYPERSCAN_MIN_LENGTH and text.isascii():
+        return _redact_secrets_hyperscan(text)
+    return _SECRET_RE.sub(_secret_replacement, text)
 
 
 def truncate_string(text: str, max_length: int) -> str:
@@ -211,6 +355,15 @@ def truncate_string(text: str, max_length: int) -> str:
     return text
 
 
+# Value types sanitize_for_log() passes through unchanged.
+_PRIMITIVE_TYPES = frozenset({int, float, bool, type(None)})
+
+
+def _all_primitive(values: Any) -> bool:
+    """True if every value is exactly an int, float, bool or None (one shallow walk)."""
+    return all(type(v) in _PRIMITIVE_TYPES for v in values)
+
+
 def sanitize_for_log(value: Any, max_length: int = MAX_MESSAGE_LENGTH) -> Any:
     """
     Sanitize value for logging.
@@ -219,17 +372,47 @@ def sanitize_for_log(value: Any, max_length: int = MAX_MESSAGE_LENGTH) -> Any:
         - Redacts secrets
         - Truncates long strings
         - Converts to safe types
+        - Copies all-numeric dicts/lists without recursing into them
     """
     if isinstance(value, str):
-        return truncate_string(redact_secrets(value), max_length)
+        return _sanitize_str(value, max_length)
     elif isinstance(value, dict):
+        if _all_primitive(value.values()):
+            # Counters/usage payloads: nothing to redact, so no recursion.
+            return value.copy()
         return {k: sanitize_for_log(v, max_length) for k, v in value.items()}
     elif isinstance(value, list):
+        if _all_primitive(value):
+            return value.copy()
         return [sanitize_for_log(v, max_length) for v in value]
     elif isinstance(value, (int, float, bool, type(None))):
         return value
     else:
-        return truncate_string(redact_secrets(str(value)), max_length)
+        return _sanitize_str(str(value), max_length)
+
+
+def _sanitize_numeric_delta(delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the numeric values of a counters/usage delta.
+
+    Deltas are added into state, so they must be numeric-valued; anything
+    else is dropped here. That leaves nothing to redact, so no recursion.
+    """
+    return {k: v for k, v in delta.items() if isinstance(v, (int, float))}
+
+
+def _sanitize_str(value: str, max_length: int) -> str:
+    """
+    Redact and truncate one string for logging.
+
+    Short ASCII strings without a secret trigger (the common case) are
+    returned after the ANSI strip alone, skipping the redact/truncate calls and
+    their intermediate strings.
+    """
+    text = ANSI_ESCAPE.sub("", value)
+    if len(text) <= max_length and text.isascii() and not _has_secret_trigger(text):
+        return text
+    return truncate_string(redact_secrets(text), max_length)
 
 
 def sanitize_artifact_paths(paths: List[str]) -> List[str]:
@@ -243,12 +426,95 @@ def sanitize_artifact_paths(paths: List[str]) -> List[str]:
 # GLOBAL STATE
 # =============================================================================
 
+
+class _Event:
+    """
+    One buffered event, held until flush_events serializes it.
+
+    Slots instead of a per-event dict: the fields are fixed by the schema, so
+    each buffered event is a small fixed-size object and a misspelled field is
+    an AttributeError rather than a silently written key. event_version is
+    the same for every event and is added by to_dict().
+    """
+
+    __slots__ = (
+        "ts",
+        "run_id",
+        "round",
+        "stage",
+        "level",
+        "event_type",
+        "message",
+        "counters_delta",
+        "usage_delta",
+        "artifact_paths",
+    )
+
+    def __init__(
+        self,
+        ts: str,
+        run_id: str,
+        round: Optional[int],
+        stage: Optional[str],
+        level: str,
+        event_type: str,
+        message: str,
+        counters_delta: Dict[str, Any],
+        usage_delta: Dict[str, Any],
+        artifact_paths: List[str],
+    ) -> None:
+        self.ts = ts
+        self.run_id = run_id
+        self.round = round
+        self.stage = stage
+        self.level = level
+        self.event_type = event_type
+        self.message = message
+        self.counters_delta = counters_delta
+        self.usage_delta = usage_delta
+        self.artifact_paths = artifact_paths
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the event in schema form, in schema field order."""
+        event: Dict[str, Any] = {
+            "event_version": EVENT_VERSION,
+            "ts": self.ts,
+            "run_id": self.run_id,
+            "round": self.round,
+            "stage": self.stage,
+            "level": self.level,
+            "event_type": self.event_type,
+            "message": self.message,
+            "counters_delta": self.counters_delta,
+            "usage_delta": self.usage_delta,
+            "artifact_paths": self.artifact_paths,
+        }
+        # Only these two come from state and may be None there.
+        if self.round is None:
+            del event["round"]
+        if self.stage is None:
+            del event["stage"]
+        return event
+
+
 # Event batch buffer - flushed periodically or on exit
-_event_buffer: List[Dict[str, Any]] = []
+_event_buffer: List[_Event] = []
 
 # Lock for thread-safe operations
 _lock = threading.RLock()
 
+# Serializes event-log writers so batches land in order; taken before _lock,
+# never while holding it
+_flush_lock = threading.Lock()
+
+# Background flusher: woken when a batch fills or state deltas are due
+_flusher: Optional[threading.Thread] = None
+_flush_wakeup = threading.Event()
+_flusher_stop = threading.Event()
+
+# (run_id, ts) of the last event this process emitted; see get_last_event_ts
+_last_event: Tuple[Optional[str], Optional[str]] = (None, None)
+
 # Whether telemetry has been initialized
 _initialized = False
 
@@ -354,22 +620,52 @@ def get_run_dir(run_id: Optional[str] = None) -> Path:
     """
     if run_id is None:
         run_id = get_run_id()
-    return Path(AUTOTRAIN_DIR) / "runs" / run_id
+    return _run_path(AUTOTRAIN_DIR, run_id, "")
+
+
+@lru_cache(maxsize=64)
+def _run_path(autotrain_dir: str, run_id: str, name: str) -> Path:
+    """Build a run path once per (dir, run, file); name "" is the run dir."""
+    run_dir = Path(autotrain_dir) / "runs" / run_id
+    return run_dir / name if name else run_dir
 
 
 def get_events_path(run_id: Optional[str] = None) -> Path:
     """Get the event log file path."""
-    return get_run_dir(run_id) / "events.jsonl"
+    return _run_path(AUTOTRAIN_DIR, get_run_id() if run_id is None else run_id, "events.jsonl")
 
 
 def get_state_path(run_id: Optional[str] = None) -> Path:
     """Get the state file path."""
-    return get_run_dir(run_id) / "state.json"
+    return _run_path(AUTOTRAIN_DIR, get_run_id() if run_id is None else run_id, "state.json")
 
 
 def get_config_path(run_id: Optional[str] = None) -> Path:
     """Get the config file path."""
-    return get_run_dir(run_id) / "config.json"
+    return _run_path(AUTOTRAIN_DIR, get_run_id() if run_id is None else run_id, "config.json")
+
+
+# Last formatted UTC timestamp and the time.time() it was taken at
+_ts_cache: Tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+
+    HOW IT WORKS:
+        - Same format as datetime.utcnow().isoformat()
+        - Calls within 1 ms of the last formatted value reuse it, so a
+          burst of events (and their state saves) formats the time once
+    """
+    global _ts_cache
+    now = time.time()
+    cached_at, text = _ts_cache
+    if 0.0 <= now - cached_at < 0.001:
+        return text
+    text = datetime.utcfromtimestamp(now).isoformat()
+    _ts_cache = (now, text)
+    return text
 
 
 def get_run_id() -> str:
@@ -408,6 +704,41 @@ DEFAULT_PRICING = {
 }
 
 
+def _pricing_file_key() -> Tuple[str, int]:
+    """Return (path, mtime_ns) of the pricing file; mtime_ns is -1 if it is absent."""
+    pricing_file = (
+        Path(PRICING_CONFIG_PATH) if PRICING_CONFIG_PATH else get_run_dir() / "pricing.json"
+    )
+    try:
+        return str(pricing_file), pricing_file.stat().st_mtime_ns
+    except OSError:
+        return str(pricing_file), -1
+
+
+@lru_cache(maxsize=8)
+def _load_pricing(pricing_file: str, mtime_ns: int) -> Dict[str, Dict[str, float]]:
+    # Keyed on the file's mtime, so an edited pricing.json is re-read.
+    pricing = DEFAULT_PRICING.copy()
+
+    if mtime_ns >= 0:
+        try:
+            with open(pricing_file) as f:
+                custom = json.load(f)
+                pricing.update(custom)
+        except Exception as e:
+            print(f"[WARN] Failed to load pricing config: {e}", file=sys.stderr)
+
+    return pricing
+
+
+@lru_cache(maxsize=256)
+def _get_rates(pricing_file: str, mtime_ns: int, model: str) -> Optional[Tuple[float, float]]:
+    pricing = _load_pricing(pricing_file, mtime_ns)
+    if model not in pricing:
+        return None
+    return pricing[model].get("input", 0), pricing[model].get("output", 0)
+
+
 def load_pricing_config() -> Dict[str, Dict[str, float]]:
     """
     Load pricing configuration from file or use defaults.
@@ -416,28 +747,14 @@ def load_pricing_config() -> Dict[str, Dict[str, float]]:
         - First checks for pricing.json in run directory
         - Falls back to DEFAULT_PRICING
         - Allows user to customize pricing per model
+        - Parsed once per pricing file version (path + mtime)
 
     TUNABLE:
         - Create pricing.json to override default prices
         - Format: {"model_name": {"input": 0.5, "output": 1.5}}
         - Prices are per 1M tokens
     """
-    pricing = DEFAULT_PRICING.copy()
-
-    # Check for pricing config file
-    pricing_file = (
-        Path(PRICING_CONFIG_PATH) if PRICING_CONFIG_PATH else get_run_dir() / "pricing.json"
-    )
-
-    if pricing_file.exists():
-        try:
-            with open(pricing_file) as f:
-                custom = json.load(f)
-                pricing.update(custom)
-        except Exception as e:
-            print(f"[WARN] Failed to load pricing config: {e}", file=sys.stderr)
-
-    return pricing
+    return _load_pricing(*_pricing_file_key()).copy()
 
 
 def estimate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
@@ -445,7 +762,7 @@ def estimate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
     Estimate API cost based on token usage and model.
 
     HOW IT WORKS:
-        - Looks up model in pricing config
+        - Looks up model in pricing config (rates are cached per model)
         - Calculates cost: (input_tokens/1M * input_price) + (output_tokens/1M * output_price)
         - Returns 0 if model not found (tokens still tracked)
 
@@ -453,13 +770,12 @@ def estimate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
         - Add models to DEFAULT_PRICING or pricing.json
         - Adjust prices for your API provider
     """
-    pricing = load_pricing_config()
+    rates = _get_rates(*_pricing_file_key(), model)
 
-    if model not in pricing:
+    if rates is None:
         return 0.0
 
-    input_price = pricing[model].get("input", 0)
-    output_price = pricing[model].get("output", 0)
+    input_price, output_price = rates
 
     cost = (input_tokens / 1_000_000) * input_price + (output_tokens / 1_000_000) * output_price
 
@@ -489,6 +805,11 @@ CONFIG_SCHEMA = {
     "OUT_DIR": {"type": str, "required": False},
 }
 
+# Resolved once so validation only walks the fields a config actually sets
+_REQUIRED_CONFIG_FIELDS = tuple(
+    key for key, schema in CONFIG_SCHEMA.items() if schema.get("required", False)
+)
+
 
 def validate_config(config: Dict[str, Any]) -> None:
     """
@@ -507,19 +828,13 @@ def validate_config(config: Dict[str, Any]) -> None:
     """
     errors = []
 
-    # Check for unknown fields
-    for key in config.keys():
-        if key not in CONFIG_SCHEMA:
+    # One pass over the supplied fields; unknown ones are reported as found
+    for key, value in config.items():
+        schema = CONFIG_SCHEMA.get(key)
+        if schema is None:
             errors.append(f"Unknown config field: {key}")
-
-    # Validate known fields
-    for key, schema in CONFIG_SCHEMA.items():
-        if key not in config:
-            if schema.get("required", False):
-                errors.append(f"Missing required config field: {key}")
             continue
 
-        value = config[key]
         expected_type = schema["type"]
 
         # Check type
@@ -537,6 +852,10 @@ def validate_config(config: Dict[str, Any]) -> None:
         if "allowed" in schema and value not in schema["allowed"]:
             errors.append(f"Invalid value for {key}: {value}. Allowed: {schema['allowed']}")
 
+    for key in _REQUIRED_CONFIG_FIELDS:
+        if key not in config:
+            errors.append(f"Missing required config field: {key}")
+
     if errors:
         raise ValueError("Config validation failed:\n  - " + "\n  - ".join(errors))
 
@@ -593,6 +912,8 @@ def init_telemetry(
     if config:
         validate_config(config)
 
+    _start_flusher()
+
     with _lock:
         if run_id:
             RUN_ID = run_id
@@ -607,7 +928,9 @@ def init_telemetry(
 
         # Check if we should resume existing run
         if state_file.exists() and not force:
-            # Resume from existing state - just reopen
+            # Resume from existing state, folding in deltas a crashed
+            # process left in its WAL
+            _recover_state_wals(run_id)
             _initialized = True
             return run_id
 
@@ -627,7 +950,7 @@ def init_telemetry(
         }
 
         # Save initial state atomically
-        save_state(state, run_id)
+        save_state(state, run_id, durable=True)
 
         # Save config if provided (but not to state.json)
         if config:
@@ -659,6 +982,7 @@ def get_state(run_id: Optional[str] = None) -> Dict[str, Any]:
     HOW IT WORKS:
         - Reads state.json file
         - Returns empty state if file doesn't exist
+        - Applies this process's counter/usage deltas not yet flushed
 
     ARGS:
         run_id: Run to read (defaults to current run)
@@ -666,6 +990,16 @@ def get_state(run_id: Optional[str] = None) -> Dict[str, Any]:
     RETURNS:
         State dictionary
     """
+    state = _load_state(run_id)
+    pending = _pending_state.get(run_id or get_run_id())
+    if pending:
+        for kind, delta, model in pending:
+            _apply_state_delta(state, kind, delta, model)
+    return state
+
+
+def _load_state(run_id: Optional[str] = None) -> Dict[str, Any]:
+    """Read state.json as written, without pending deltas."""
     state_file = get_state_path(run_id)
 
     if not state_file.exists():
@@ -677,16 +1011,65 @@ def get_state(run_id: Optional[str] = None) -> Dict[str, Any]:
         }
 
     try:
-        with open(state_file) as f:
-            state = json.load(f)
-            # Resolve status from on-disk metadata
-            state["status"] = resolve_status(state)
-            return state
+        state = _read_json_file(state_file)
+        # Resolve status from on-disk metadata
+        state["status"] = resolve_status(state)
+        return state
     except Exception as e:
         print(f"[WARN] Failed to load state: {e}", file=sys.stderr)
         return {"status": "error", "error": str(e)}
 
 
+# Control fields of each state.json last parsed by read_status_only(), keyed
+# by the file's (st_ino, st_size, st_mtime_ns); every save replaces the file,
+# so an unchanged signature means unchanged content
+_status_cache: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+
+def read_status_only(run_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read just the run's control fields from state.json, for poll loops.
+
+    HOW IT WORKS:
+        - One stat of state.json; if it hasn't changed since the last call,
+          the cached fields are returned without opening the file
+        - Otherwise parses it and keeps only status (resolved),
+          stop_requested and pause_requested
+        - Reflects state.json as written (control fields are written through,
+          so this process's pending counter deltas don't affect them)
+
+    ARGS:
+        run_id: Run to read (defaults to current run)
+
+    RETURNS:
+        Dict with status, stop_requested, pause_requested
+    """
+    state_file = get_state_path(run_id)
+    try:
+        st = os.stat(state_file)
+    except FileNotFoundError:
+        return {"status": "idle", "stop_requested": False, "pause_requested": False}
+
+    key = (st.st_ino, st.st_size, st.st_mtime_ns)
+    cached = _status_cache.get(state_file)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+
+    try:
+        state = _read_json_file(state_file)
+    except Exception as e:
+        print(f"[WARN] Failed to load state: {e}", file=sys.stderr)
+        return {"status": "error", "stop_requested": False, "pause_requested": False}
+
+    fields = {
+        "status": resolve_status(state),
+        "stop_requested": state.get("stop_requested", False),
+        "pause_requested": state.get("pause_requested", False),
+    }
+    _status_cache[state_file] = (key, fields)
+    return dict(fields)
+
+
 def resolve_status(state: Dict[str, Any]) -> str:
     """
     Resolve run status from on-disk metadata.
@@ -743,55 +1126,112 @@ def resolve_status(state: Dict[str, Any]) -> str:
     return "idle"
 
 
-def save_state(state: Dict[str, Any], run_id: Optional[str] = None) -> None:
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    return _loads(path.read_bytes())
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj as compact UTF-8 JSON (see dump_state_pretty for humans)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson rejects go through the stdlib encoder below.
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dump_state_pretty(run_id: Optional[str] = None) -> str:
+    """Return the run's state as indented JSON for CLI inspection."""
+    return json.dumps(get_state(run_id), indent=2)
+
+
+def save_state(
+    state: Dict[str, Any], run_id: Optional[str] = None, *, durable: bool = False
+) -> None:
     """
     Save state to state.json atomically.
 
     HOW IT WORKS:
-        - Writes to temp file first
-        - Uses os.rename for atomic update
+        - Writes to a per-writer temp file (mode 0600) with os.open/os.write
+        - Uses os.replace for atomic update
         - Prevents corruption from partial writes
+        - durable=True also fsyncs the file and directory before returning
 
     TUNABLE:
-        - N/A - just saves state
+        - Pass durable=True where losing the write to a crash matters
+          (run init, status changes, stop/pause flags); counter/usage
+          flushes skip the fsyncs, so a crash can lose their last few
+          seconds (the WAL appends are not fsynced either)
 
     ARGS:
         state: State dictionary to save
         run_id: Run ID (defaults to current)
+        durable: Flush the write to stable storage
     """
     run_id = run_id or get_run_id()
     state_file = get_state_path(run_id)
-    temp_file = state_file.with_suffix(".tmp")
+    # Per writer, so concurrent processes/threads never share a temp file
+    temp_file = state_file.with_name(f"state.{os.getpid()}.{threading.get_ident()}.tmp")
 
     # Update timestamp
-    state["updated_at"] = datetime.utcnow().isoformat()
+    state["updated_at"] = _now_iso()
 
-    # Write to temp file
-    with open(temp_file, "w") as f:
-        json.dump(state, f, indent=2)
+    # Write to temp file with raw fd calls (no buffered file object)
+    data = memoryview(_json_bytes(state))
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
 
     # Atomic rename
     os.replace(temp_file, state_file)
 
+    if durable:
+        dir_fd = os.open(state_file.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
-def update_counters(delta: Dict[str, Any], run_id: Optional[str] = None) -> None:
-    """
-    Update counters with incremental values.
 
-    HOW IT WORKS:
-        - Loads current state
-        - Adds delta values to counters
-        - Saves state atomically
+# =============================================================================
+# STATE WRITE-BEHIND
+# =============================================================================
 
-    TUNABLE:
-        - Pass negative values to decrement
+# Counter/usage deltas not yet folded into state.json, per run, in arrival
+# order as (kind, delta, model). Several pipeline processes update the same
+# run, so deltas rather than absolute values are held, and a flush applies
+# them to a fresh read of state.json.
+_pending_state: Dict[str, List[Tuple[str, Dict[str, Any], Optional[str]]]] = {}
 
-    ARGS:
-        delta: Dictionary of counter name -> value to add
-        run_id: Run ID (defaults to current)
-    """
-    state = get_state(run_id)
-    counters = state.get("counters", get_default_counters())
+# Monotonic time of the last flush_state()
+_state_flushed_at = 0.0
+
+# Append-only descriptors for this process's state WALs, by path
+_wal_fds: Dict[Path, int] = {}
+
+# Sequence number of the last record appended to each WAL, by path
+_wal_seqs: Dict[Path, int] = {}
+
+# Distinguishes this process's WALs from those of an earlier process that
+# had the same pid, whose applied sequence numbers may linger in state.json
+_WAL_TOKEN = uuid.uuid4().hex[:8]
+
+
+def _wal_path(run_id: str) -> Path:
+    """This process's write-ahead log of pending deltas for run_id."""
+    return get_state_path(run_id).with_name(f"state.{os.getpid()}.{_WAL_TOKEN}.wal")
+
+
+def _apply_counters_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Add counter increments to state["counters"] in place."""
+    counters = state.setdefault("counters", get_default_counters())
 
     for key, value in delta.items():
         if key not in counters:
@@ -802,8 +1242,190 @@ def update_counters(delta: Dict[str, Any], run_id: Optional[str] = None) -> None
     if "train_loss" in delta and isinstance(delta["train_loss"], float):
         counters["train_loss"] = delta["train_loss"]
 
-    state["counters"] = counters
-    save_state(state, run_id)
+
+def _apply_usage_delta(
+    state: Dict[str, Any], delta: Dict[str, Any], model: Optional[str] = None
+) -> None:
+    """Add usage increments to state["usage"] in place and re-estimate cost."""
+    usage = state.setdefault("usage", get_default_usage())
+
+    # Add deltas
+    for key, value in delta.items():
+        if key not in usage:
+            usage[key] = 0
+        usage[key] += value
+
+    # Recalculate cost if we have model
+    if model:
+        cost = estimate_cost(usage.get("input_tokens", 0), usage.get("output_tokens", 0), model)
+        usage["estimated_cost_usd"] = cost
+
+
+def _apply_state_delta(
+    state: Dict[str, Any], kind: str, delta: Dict[str, Any], model: Optional[str]
+) -> None:
+    if kind == "counters":
+        _apply_counters_delta(state, delta)
+    else:
+        _apply_usage_delta(state, delta, model)
+
+
+def _queue_state_delta(
+    run_id: Optional[str], kind: str, delta: Dict[str, Any], model: Optional[str] = None
+) -> None:
+    """
+    Record a counter/usage delta without rewriting state.json.
+
+    HOW IT WORKS:
+        - Appends the delta as one JSON line to this process's state WAL,
+          numbered so a replay can skip what state.json already includes
+        - Holds it in memory until the next flush_state()
+        - Flushes once STATE_FLUSH_SEC has passed since the last flush
+    """
+    for value in delta.values():
+        # Checked now: a bad value queued here would break every later read
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"{kind} delta values must be numeric, not {type(value).__name__}")
+
+    run_id = run_id or get_run_id()
+    with _lock:
+        path = _wal_path(run_id)
+        fd = _wal_fds.get(path)
+        if fd is None:
+            fd = _wal_fds[path] = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        seq = _wal_seqs[path] = _wal_seqs.get(path, 0) + 1
+        os.write(fd, _event_line({"seq": seq, "kind": kind, "delta": delta, "model": model}))
+        _pending_state.setdefault(run_id, []).append((kind, dict(delta), model))
+
+        state_due = time.monotonic() - _state_flushed_at >= STATE_FLUSH_SEC
+
+    if state_due:
+        _request_flush(flush_state)
+
+
+def _store_state(state: Dict[str, Any], run_id: str, *, durable: bool = False) -> None:
+    """Save a state read via get_state() and drop the deltas it now includes."""
+    path = _wal_path(run_id)
+    wal_seq = state.get("wal_seq")
+    if wal_seq:
+        # A WAL that no longer exists has nothing left to replay; its entry
+        # would otherwise outlive its process for the rest of the run
+        for name in [n for n in wal_seq if not (path.parent / n).exists()]:
+            del wal_seq[name]
+    if run_id in _pending_state and path in _wal_seqs:
+        # Recorded in the same write, so a WAL left untruncated by a crash
+        # right after it is not applied twice by _recover_state_wals
+        state.setdefault("wal_seq", {})[path.name] = _wal_seqs[path]
+    save_state(state, run_id, durable=durable)
+    if _pending_state.pop(run_id, None) is not None:
+        fd = _wal_fds.get(path)
+        if fd is not None:
+            os.ftruncate(fd, 0)
+
+
+def flush_state() -> None:
+    """
+    Fold pending counter/usage deltas into state.json.
+
+    HOW IT WORKS:
+        - Re-reads state.json for each run with pending deltas
+        - Applies the deltas in order and saves once per run
+        - Truncates this process's WAL for that run
+        - Called on a STATE_FLUSH_SEC cadence, by flush_events and on exit
+    """
+    global _state_flushed_at
+
+    with _lock:
+        _state_flushed_at = time.monotonic()
+        for run_id in list(_pending_state):
+            try:
+                _store_state(get_state(run_id), run_id)
+            except Exception as e:
+                print(f"[ERROR] Failed to write state: {e}", file=sys.stderr)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _recover_state_wals(run_id: str) -> None:
+    """
+    Replay state WALs left behind by processes that exited without flushing.
+
+    HOW IT WORKS:
+        - Finds state.<pid>[.<token>].wal files whose pid is no longer running
+        - Applies their deltas to state.json, stopping at a torn last line
+          and skipping records at or below the WAL's applied sequence number
+          (a crash between a flush and its WAL truncation leaves those)
+        - Records the WAL's last sequence number, then removes the WAL
+          (the next save drops that entry; see _store_state)
+    """
+    with _lock:
+        wal_dir = get_state_path(run_id).parent
+        for path in wal_dir.glob("state.*.wal"):
+            try:
+                pid = int(path.name.split(".")[1])
+            except ValueError:
+                continue
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+
+            state = get_state(run_id)
+            wal_seq = state.setdefault("wal_seq", {})
+            applied = last = wal_seq.get(path.name, 0)
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    seq = record.get("seq")
+                    if seq is not None:
+                        if seq <= applied:
+                            continue
+                        last = seq
+                    _apply_state_delta(state, record["kind"], record["delta"], record["model"])
+            wal_seq[path.name] = last
+            _store_state(state, run_id, durable=True)
+            path.unlink()
+
+
+@atexit.register
+def _shutdown_state() -> None:
+    flush_state()
+    with _lock:
+        for path, fd in _wal_fds.items():
+            os.close(fd)
+            if path.exists() and path.stat().st_size == 0:
+                path.unlink()
+        _wal_fds.clear()
+
+
+def update_counters(delta: Dict[str, Any], run_id: Optional[str] = None) -> None:
+    """
+    Update counters with incremental values.
+
+    HOW IT WORKS:
+        - Queues the delta (see _queue_state_delta)
+        - state.json picks it up at the next flush_state()
+        - get_state() in this process sees it immediately
+
+    TUNABLE:
+        - Pass negative values to decrement
+
+    ARGS:
+        delta: Dictionary of counter name -> value to add
+        run_id: Run ID (defaults to current)
+    """
+    _queue_state_delta(run_id, "counters", delta)
 
 
 def update_usage(
@@ -813,10 +1435,9 @@ def update_usage(
     Update usage statistics with incremental values.
 
     HOW IT WORKS:
-        - Loads current state
-        - Adds delta values to usage
-        - Recalculates cost estimate
-        - Saves state atomically
+        - Queues the delta (see _queue_state_delta)
+        - Cost estimate is recalculated when the delta is applied
+        - state.json picks it up at the next flush_state()
 
     TUNABLE:
         - Add new usage fields as needed
@@ -827,22 +1448,7 @@ def update_usage(
         model: Model name for cost estimation
         run_id: Run ID (defaults to current)
     """
-    state = get_state(run_id)
-    usage = state.get("usage", get_default_usage())
-
-    # Add deltas
-    for key, value in delta.items():
-        if key not in usage:
-            usage[key] = 0
-        usage[key] += value
-
-    # Recalculate cost if we have model
-    if model:
-        cost = estimate_cost(usage.get("input_tokens", 0), usage.get("output_tokens", 0), model)
-        usage["estimated_cost_usd"] = cost
-
-    state["usage"] = usage
-    save_state(state, run_id)
+    _queue_state_delta(run_id, "usage", delta, model)
 
 
 def set_status(
@@ -867,18 +1473,20 @@ def set_status(
         round_num: Current round number
         run_id: Run ID (defaults to current)
     """
-    state = get_state(run_id)
+    run_id = run_id or get_run_id()
+    with _lock:
+        state = get_state(run_id)
 
-    if status:
-        state["status"] = status
+        if status:
+            state["status"] = status
 
-    if stage:
-        state["current_stage"] = stage
+        if stage:
+            state["current_stage"] = stage
 
-    if round_num is not None:
-        state["current_round"] = round_num
+        if round_num is not None:
+            state["current_round"] = round_num
 
-    save_state(state, run_id)
+        _store_state(state, run_id, durable=True)
 
 
 def sm_apply_event(event_name: str, **kwargs) -> Optional[str]:
@@ -951,6 +1559,15 @@ def sm_can_train() -> bool:
     return _state_machine.can_train()
 
 
+def _set_state_flag(key: str, value: bool, run_id: Optional[str]) -> None:
+    """Write one control flag to state.json immediately (read by other processes)."""
+    run_id = run_id or get_run_id()
+    with _lock:
+        state = get_state(run_id)
+        state[key] = value
+        _store_state(state, run_id, durable=True)
+
+
 def request_stop(run_id: Optional[str] = None) -> None:
     """
     Request graceful stop.
@@ -966,9 +1583,7 @@ def request_stop(run_id: Optional[str] = None) -> None:
     ARGS:
         run_id: Run ID (defaults to current)
     """
-    state = get_state(run_id)
-    state["stop_requested"] = True
-    save_state(state, run_id)
+    _set_state_flag("stop_requested", True, run_id)
 
 
 def request_pause(run_id: Optional[str] = None) -> None:
@@ -986,9 +1601,7 @@ def request_pause(run_id: Optional[str] = None) -> None:
     ARGS:
         run_id: Run ID (defaults to current)
     """
-    state = get_state(run_id)
-    state["pause_requested"] = True
-    save_state(state, run_id)
+    _set_state_flag("pause_requested", True, run_id)
 
 
 def clear_pause(run_id: Optional[str] = None) -> None:
@@ -1005,9 +1618,7 @@ def clear_pause(run_id: Optional[str] = None) -> None:
     ARGS:
         run_id: Run ID (defaults to current)
     """
-    state = get_state(run_id)
-    state["pause_requested"] = False
-    save_state(state, run_id)
+    _set_state_flag("pause_requested", False, run_id)
 
 
 def check_stop_requested(run_id: Optional[str] = None) -> bool:
@@ -1015,7 +1626,7 @@ def check_stop_requested(run_id: Optional[str] = None) -> bool:
     Check if stop has been requested.
 
     HOW IT WORKS:
-        - Reads stop_requested flag from state
+        - Reads stop_requested via read_status_only (no parse if unchanged)
         - Called by pipeline scripts to check for stop
 
     TUNABLE:
@@ -1027,8 +1638,7 @@ def check_stop_requested(run_id: Optional[str] = None) -> bool:
     RETURNS:
         True if stop requested
     """
-    state = get_state(run_id)
-    return state.get("stop_requested", False)
+    return read_status_only(run_id)["stop_requested"]
 
 
 def check_pause_requested(run_id: Optional[str] = None) -> bool:
@@ -1036,7 +1646,7 @@ def check_pause_requested(run_id: Optional[str] = None) -> bool:
     Check if pause has been requested.
 
     HOW IT WORKS:
-        - Reads pause_requested flag from state
+        - Reads pause_requested via read_status_only (no parse if unchanged)
         - Called by pipeline scripts to check for pause
 
     TUNABLE:
@@ -1048,8 +1658,7 @@ def check_pause_requested(run_id: Optional[str] = None) -> bool:
     RETURNS:
         True if pause requested
     """
-    state = get_state(run_id)
-    return state.get("pause_requested", False)
+    return read_status_only(run_id)["pause_requested"]
 
 
 # =============================================================================
@@ -1079,11 +1688,9 @@ def emit_event(
         - Rejects unknown fields
 
     HOW IT WORKS:
-        1. Creates event with all provided fields
-        2. Validates against schema
-        3. Sanitizes sensitive data
-        4. Adds to event buffer
-        5. Flushes buffer when it reaches TELEMETRY_BATCH size
+        1. Builds the event from schema fields only, sanitizing each value
+        2. Adds to event buffer
+        3. Flushes buffer when it reaches TELEMETRY_BATCH size
 
     ARGS:
         event_type: Type of event (stage_start, stage_end, progress, error, etc.)
@@ -1091,61 +1698,50 @@ def emit_event(
         level: Log level (info, warn, error, success)
         stage: Pipeline stage (generate, validate, train, eval)
         round_num: Current round number
-        counters_delta: Counter increments to apply
-        usage_delta: Usage increments to apply
+        counters_delta: Counter increments to apply (numeric values only)
+        usage_delta: Usage increments to apply (numeric values only)
         artifact_paths: Files created by this event
         error: Error message (if level=error)
         model: Model name (for cost estimation)
         run_id: Run ID (defaults to current)
     """
-    global _event_buffer
+    global _event_buffer, _last_event
 
     if not _initialized:
         init_telemetry(run_id)
 
     run_id = get_run_id()
 
-    # Get current state for context
-    state = get_state(run_id)
-
-    # Build event with schema version
-    event = {
-        "event_version": EVENT_VERSION,
-        "ts": datetime.utcnow().isoformat(),
-        "run_id": run_id,
-        "round": round_num if round_num is not None else state.get("current_round", 0),
-        "stage": stage or state.get("current_stage", "unknown"),
-        "level": level,
-        "event_type": event_type,
-        "message": message,
-        "counters_delta": counters_delta or {},
-        "usage_delta": usage_delta or {},
-        "artifact_paths": artifact_paths or [],
-        "error": error,
-    }
-
-    # Remove None values
-    event = {k: v for k, v in event.items() if v is not None}
-
-    # Enforce schema: only allow known fields
-    event = {k: v for k, v in event.items() if k in ALLOWED_EVENT_FIELDS}
-
-    # Sanitize all string fields
-    event["message"] = sanitize_for_log(event.get("message", ""), MAX_MESSAGE_LENGTH)
-    if "error" in event:
-        event["error"] = sanitize_for_log(event.get("error", ""), MAX_ERROR_LENGTH)
-    if "artifact_paths" in event:
-        event["artifact_paths"] = sanitize_artifact_paths(event.get("artifact_paths", []))
-
-    # Sanitize counters_delta and usage_delta
-    if "counters_delta" in event:
-        event["counters_delta"] = sanitize_for_log(event["counters_delta"], 100)
-    if "usage_delta" in event:
-        event["usage_delta"] = sanitize_for_log(event["usage_delta"], 100)
+    # Read state only for the context the caller didn't supply; counter and
+    # usage deltas below are queued without touching state.json
+    state: Dict[str, Any] = {}
+    if round_num is None or not stage:
+        state = _load_state(run_id)
+
+    # Deltas are numeric-only (see _sanitize_numeric_delta); the filtered
+    # copies go both into the event and into state
+    counters_delta = _sanitize_numeric_delta(counters_delta) if counters_delta else {}
+    usage_delta = _sanitize_numeric_delta(usage_delta) if usage_delta else {}
+
+    # Build the event from schema fields only, sanitizing each value as it is
+    # set. (error is not part of the frozen schema and is never written.)
+    event = _Event(
+        ts=_now_iso(),
+        run_id=run_id,
+        round=round_num if round_num is not None else state.get("current_round", 0),
+        stage=stage or state.get("current_stage", "unknown"),
+        level=level,
+        event_type=event_type,
+        message=sanitize_for_log(message or "", MAX_MESSAGE_LENGTH),
+        counters_delta=counters_delta,
+        usage_delta=usage_delta,
+        artifact_paths=sanitize_artifact_paths(artifact_paths or []),
+    )
 
     # Add to buffer
     with _lock:
         _event_buffer.append(event)
+        _last_event = (run_id, event.ts)
 
         # Update counters and usage if provided
         if counters_delta:
@@ -1154,9 +1750,103 @@ def emit_event(
         if usage_delta:
             update_usage(usage_delta, model, run_id)
 
-        # Flush if batch is full
-        if len(_event_buffer) >= TELEMETRY_BATCH:
-            flush_events()
+        batch_full = len(_event_buffer) >= TELEMETRY_BATCH
+
+    # Flush if batch is full: handed to the flusher thread when it runs
+    if batch_full:
+        _request_flush(flush_events)
+
+
+# Append-only descriptor for the current events file, reused across flushes,
+# with the (st_dev, st_ino) of the file it was opened on.
+_events_fd: Optional[int] = None
+_events_fd_path: Optional[Path] = None
+_events_fd_id: Optional[Tuple[int, int]] = None
+
+# Page-cache release for the write-only event log (POSIX only): once this many
+# bytes have been appended past the last release, pages up to the end minus
+# a tail kept for readers (dashboard, get_last_event_ts) are dropped
+_FADVISE = hasattr(os, "posix_fadvise")
+_EVENTS_FADVISE_STEP = 8 * 1024 * 1024
+_EVENTS_FADVISE_TAIL = 64 * 1024
+_events_fadvised_to = 0
+
+
+def _close_events_fd() -> None:
+    global _events_fd, _events_fd_path, _events_fd_id, _events_fadvised_to
+    if _events_fd is not None:
+        try:
+            os.close(_events_fd)
+        except OSError:
+            pass
+    _events_fd = None
+    _events_fd_path = None
+    _events_fd_id = None
+    _events_fadvised_to = 0
+
+
+def _release_events_pages(fd: int, end: int) -> None:
+    """Tell the kernel the log's pages before end - tail won't be read again."""
+    global _events_fadvised_to
+    upto = end - _EVENTS_FADVISE_TAIL
+    if not _FADVISE or upto - _events_fadvised_to < _EVENTS_FADVISE_STEP:
+        return
+    try:
+        os.posix_fadvise(
+            fd, _events_fadvised_to, upto - _events_fadvised_to, os.POSIX_FADV_DONTNEED
+        )
+    except OSError:
+        return
+    _events_fadvised_to = upto
+
+
+def _get_events_fd(events_file: Path) -> Tuple[int, int]:
+    """
+    Return an O_APPEND descriptor for events_file and the file's current size.
+
+    The cached descriptor is reused only while it still refers to the file at
+    events_file, so a rotation (by this or another process) or a new run dir
+    opens the new file. One stat of the path answers both that and the
+    rotation size check; the descriptor's own identity is recorded at open.
+    """
+    global _events_fd, _events_fd_path, _events_fd_id
+
+    if _events_fd is not None and _events_fd_path == events_file:
+        try:
+            st = os.stat(events_file)
+            if (st.st_dev, st.st_ino) == _events_fd_id:
+                return _events_fd, st.st_size
+        except OSError:
+            pass
+
+    _close_events_fd()
+    events_file.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(events_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    fst = os.fstat(fd)
+    # Set restrictive permissions (the file may predate this process); only
+    # on open, and only when they differ
+    if stat.S_IMODE(fst.st_mode) != stat.S_IRUSR | stat.S_IWUSR:
+        os.fchmod(fd, stat.S_IRUSR | stat.S_IWUSR)
+    if _FADVISE:
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    _events_fd = fd
+    _events_fd_path = events_file
+    _events_fd_id = (fst.st_dev, fst.st_ino)
+    return fd, fst.st_size
+
+
+def _event_line(event: Dict[str, Any]) -> bytes:
+    """Serialize one event as a UTF-8 JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson rejects go through the stdlib encoder below.
+            pass
+    return (json.dumps(event) + "\n").encode("utf-8")
 
 
 def flush_events() -> None:
@@ -1164,9 +1854,13 @@ def flush_events() -> None:
     Flush event buffer to disk with rotation support.
 
     HOW IT WORKS:
-        - Writes all buffered events to events.jsonl
-        - Uses file append for performance
-        - Called automatically when batch is full or on exit
+        - Serializes all buffered events to one block of JSON lines
+        - Appends it to events.jsonl with os.write on an O_APPEND descriptor
+          that is kept open between flushes
+        - Called by the flusher thread when a batch fills, every second, and
+          on exit; safe to call directly (e.g. tests, CLI)
+        - Swaps the buffer out under _lock and writes outside it
+        - Flushes pending state deltas with the batch
         - Rotates log file when max size exceeded
         - Maintains retention count of old files
 
@@ -1178,33 +1872,89 @@ def flush_events() -> None:
     if not _event_buffer:
         return
 
-    with _lock:
-        if not _event_buffer:
+    with _flush_lock:
+        # Swap the buffer out so emitters only wait for the swap, not the write
+        with _lock:
+            batch, _event_buffer = _event_buffer, []
+        if not batch:
             return
 
         events_file = get_events_path()
 
         try:
+            data = b"".join(_event_line(event.to_dict()) for event in batch)
+            fd, size = _get_events_fd(events_file)
+
             # Check if rotation needed
-            if events_file.exists():
-                size_mb = events_file.stat().st_size / (1024 * 1024)
-                if size_mb >= EVENT_LOG_MAX_SIZE_MB:
-                    _rotate_events_log(events_file)
+            if size and size >= EVENT_LOG_MAX_SIZE_MB * 1024 * 1024:
+                _close_events_fd()
+                _rotate_events_log(events_file)
+                fd, size = _get_events_fd(events_file)
+
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            _release_events_pages(fd, size + len(data))
 
-            # Ensure parent directory exists with proper permissions
-            events_file.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            print(f"[ERROR] Failed to write events: {e}", file=sys.stderr)
 
-            with open(events_file, "a") as f:
-                for event in _event_buffer:
-                    f.write(json.dumps(event) + "\n")
+        flush_state()
 
-            # Set restrictive permissions
-            os.chmod(events_file, stat.S_IRUSR | stat.S_IWUSR)
 
+def _flusher_loop() -> None:
+    while not _flusher_stop.is_set():
+        _flush_wakeup.wait(1.0)
+        _flush_wakeup.clear()
+        try:
+            flush_events()
+            if _pending_state:
+                flush_state()
         except Exception as e:
-            print(f"[ERROR] Failed to write events: {e}", file=sys.stderr)
+            print(f"[ERROR] Telemetry flush failed: {e}", file=sys.stderr)
+
 
-        _event_buffer = []
+def _start_flusher() -> None:
+    """
+    Start the background flusher thread (idempotent).
+
+    HOW IT WORKS:
+        - A daemon thread waits on _flush_wakeup (1s timeout) and runs
+          flush_events/flush_state, so emit_event only appends in memory
+        - At exit the thread is stopped and joined, then a final
+          synchronous flush writes whatever is left
+    """
+    global _flusher
+
+    with _lock:
+        if _flusher is not None and _flusher.is_alive():
+            return
+        first_start = _flusher is None
+        _flusher_stop.clear()
+        _flusher = threading.Thread(target=_flusher_loop, name="telemetry-flusher", daemon=True)
+        _flusher.start()
+    if first_start:
+        atexit.register(_stop_flusher)
+
+
+def _stop_flusher() -> None:
+    global _flusher
+
+    thread, _flusher = _flusher, None
+    if thread is not None:
+        _flusher_stop.set()
+        _flush_wakeup.set()
+        thread.join(timeout=5)
+    flush_events()
+
+
+def _request_flush(flush: Callable[[], None]) -> None:
+    """Wake the flusher thread, or run flush inline if none is running here."""
+    thread = _flusher
+    if thread is not None and thread.is_alive():
+        _flush_wakeup.set()
+    else:
+        flush()
 
 
 def _rotate_events_log(events_file: Path) -> None:
@@ -1370,12 +2120,25 @@ def stage_context(stage: str, round_num: int, message: str, **kwargs):
 
 
 def get_last_event_ts() -> Optional[str]:
-    """Get timestamp of last event."""
+    """
+    Get timestamp of last event.
+
+    HOW IT WORKS:
+        - Returns the ts of the last event emitted by this process for the
+          current run, without touching the events file
+        - Otherwise (e.g. a standalone status server) reads it from the
+          tail of events.jsonl
+    """
+    last_run_id, last_ts = _last_event
+    if last_ts is not None and last_run_id == get_run_id():
+        return last_ts
+
     try:
         events_file = get_events_path()
-        if events_file.exists() and events_file.stat().st_size > 0:
+        size = events_file.stat().st_size
+        if size > 0:
             with open(events_file, "rb") as f:
-                f.seek(-500, 2)  # Read last 500 bytes
+                f.seek(max(size - 500, 0))  # Read last 500 bytes
                 lines = f.read().decode().strip().split("\n")
                 if lines:
                     last_line = lines[-1]
@@ -1386,48 +2149,209 @@ def get_last_event_ts() -> Optional[str]:
     return None
 
 
+def iter_events(run_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the run's logged events in order (current events.jsonl only).
+
+    HOW IT WORKS:
+        - Reads through a read-only mmap of events.jsonl (see
+          iter_jsonl_records), so large logs aren't copied line by line
+        - Skips a partially written last line
+    """
+    events_file = get_events_path(run_id)
+    if not events_file.exists():
+        return
+    for _, event in iter_jsonl_records(str(events_file)):
+        yield event
+
+
 def redact_state(state: Dict[str, Any]) -> Dict[str, Any]:
     """Redact state to only allowed fields."""
     redacted = {}
-    for key in ALLOWED_STATUS_FIELDS:
-        if key in state:
-            value = state[key]
-            # Sanitize any nested secrets
+    # Walk the state (in its own order) against the frozenset allow-list
+    for key, value in state.items():
+        if key in ALLOWED_STATUS_FIELDS:
+            # Sanitize any nested secrets; all-numeric dicts (counters,
+            # usage, gpu_summary) take sanitize_for_log's copy-only path
             if isinstance(value, dict):
-                value = {k: sanitize_for_log(v, 100) for k, v in value.items()}
+                value = sanitize_for_log(value, 100)
             redacted[key] = value
     return redacted
 
 
+# Dashboard reporter thread, and the event that stops it (see stop_reporter)
+_reporter: Optional[threading.Thread] = None
+_reporter_stop = threading.Event()
+
+
+def _reporter_loop(dashboard_url: str) -> None:
+    error_count = 0
+    telemetry_pass = os.environ.get("TELEMETRY_PASS")
+
+    # One session for the life of the loop: posts reuse a kept-alive
+    # connection instead of a new TCP (and TLS) handshake every 5s
+    session = requests.Session()
+    session.auth = ("admin", telemetry_pass) if telemetry_pass else None
+    session.headers["Content-Type"] = "application/json"
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Last payload the dashboard accepted, and when
+    last_payload = b""
+    last_sent = 0.0
+
+    while not _reporter_stop.is_set():
+        try:
+            state = get_state()
+            # Redact before sending
+            redacted = redact_state(state)
+            # Add run_id to top level if not present
+            if "run_id" not in redacted:
+                redacted["run_id"] = get_run_id()
+
+            # Encoded here rather than via json=, which goes through stdlib json
+            payload = _json_bytes(redacted)
+            now = time.monotonic()
+            if payload != last_payload or now - last_sent >= REPORTER_HEARTBEAT_SEC:
+                response = session.post(f"{dashboard_url}/report", data=payload, timeout=5)
+                if response.ok:
+                    last_payload, last_sent = payload, now
+            error_count = 0
+        except Exception:
+            error_count += 1
+        # Backoff after repeated failures; returns at once on stop_reporter()
+        _reporter_stop.wait(30 if error_count > 5 else 5)
+
+
 def start_reporter(dashboard_url: str):
-    """Start background thread to push state to central dashboard."""
+    """
+    Start background thread to push state to central dashboard.
+
+    HOW IT WORKS:
+        - Every 5s, redacts the run's state and encodes it
+        - Posts it only if it differs from the last accepted post, or
+          REPORTER_HEARTBEAT_SEC has passed since then, so an idle run
+          costs the dashboard nothing between heartbeats
+        - Waits on _reporter_stop between ticks (30s after repeated
+          failures), so stop_reporter() ends the thread immediately
+        - Does nothing if the reporter is already running
+    """
+    global _reporter
+
     if not requests:
         return
 
-    def reporter_loop():
-        error_count = 0
-        telemetry_pass = os.environ.get("TELEMETRY_PASS")
-        auth = ("admin", telemetry_pass) if telemetry_pass else None
+    with _lock:
+        if _reporter is not None and _reporter.is_alive():
+            return
+        _reporter_stop.clear()
+        _reporter = threading.Thread(
+            target=_reporter_loop, args=(dashboard_url,), name="telemetry-reporter", daemon=True
+        )
+        _reporter.start()
+
+
+def stop_reporter() -> None:
+    """Stop the dashboard reporter thread, if running, without waiting out its interval."""
+    global _reporter
+
+    thread, _reporter = _reporter, None
+    if thread is not None:
+        _reporter_stop.set()
+        thread.join(timeout=5)
 
-        while True:
-            try:
-                state = get_state()
-                # Redact before sending
-                redacted = redact_state(state)
-                # Add run_id to top level if not present
-                if "run_id" not in redacted:
-                    redacted["run_id"] = get_run_id()
-
-                requests.post(f"{dashboard_url}/report", json=redacted, timeout=5, auth=auth)
-                error_count = 0
-            except Exception:
-                error_count += 1
-                if error_count > 5:
-                    time.sleep(30)  # Backoff
-            time.sleep(5)
-
-    thread = threading.Thread(target=reporter_loop, daemon=True)
-    thread.start()
+
+# Last GPU summary and the monotonic time it was taken
+_gpu_cache: Tuple[float, Dict[str, Any]] = (0.0, {})
+_gpu_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _nvml_handle() -> Any:
+    """Open NVML once and return GPU 0's handle, or None to use nvidia-smi."""
+    if pynvml is None:
+        return None
+    try:
+        pynvml.nvmlInit()
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+    except Exception:
+        return None
+    atexit.register(pynvml.nvmlShutdown)
+    return handle
+
+
+def _query_gpu_summary() -> Dict[str, Any]:
+    handle = _nvml_handle()
+    if handle is not None:
+        try:
+            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+            return {
+                "vram_used_mb": mem.used // (1024 * 1024),
+                "vram_total_mb": mem.total // (1024 * 1024),
+                "util_pct": util.gpu,
+            }
+        except Exception:
+            # Fall back to nvidia-smi below
+            pass
+
+    try:
+        import subprocess
+
+        result = subprocess.run(
+            [
+                "nvidia-smi",
+                "--query-gpu=memory.used,memory.total,utilization.gpu",
+                "--format=csv,noheader,nounits",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            parts = result.stdout.strip().split(",")
+            if len(parts) >= 2:
+                return {
+                    "vram_used_mb": int(parts[0].strip()),
+                    "vram_total_mb": int(parts[1].strip()),
+                    "util_pct": int(parts[2].strip()) if len(parts) > 2 else 0,
+                }
+    except Exception:
+        pass
+    return {"available": False}
+
+
+def _store_remote_state(run_id: str, data: Dict[str, Any]) -> None:
+    """Record a reported state, evicting the least recently reported runs."""
+    with _remote_states_lock:
+        _remote_states[run_id] = data
+        _remote_states.move_to_end(run_id)
+        while len(_remote_states) > MAX_REMOTE_STATES:
+            _remote_states.popitem(last=False)
+
+
+def get_gpu_summary() -> Dict[str, Any]:
+    """
+    Get minimal GPU info without exposing sensitive data.
+
+    HOW IT WORKS:
+        - Reads GPU 0 through a persistent NVML handle when pynvml is
+          installed and NVML initializes, else runs nvidia-smi
+        - Queries at most once per GPU_POLL_INTERVAL_SECONDS and serves the
+          cached summary in between, so /status polling doesn't fork a
+          process per request
+        - Concurrent callers wait for the one query in flight
+    """
+    global _gpu_cache
+
+    with _gpu_lock:
+        taken_at, summary = _gpu_cache
+        now = time.monotonic()
+        if not summary or now - taken_at >= GPU_POLL_INTERVAL_SECONDS:
+            summary = _query_gpu_summary()
+            _gpu_cache = (now, summary)
+        return summary
 
 
 def start_http_server(port: int = 7779) -> None:
@@ -1444,7 +2368,7 @@ def start_http_server(port: int = 7779) -> None:
 
     try:
         import threading
-        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
     except ImportError:
         print("[WARN] HTTP server not available", file=sys.stderr)
         return
@@ -1452,32 +2376,9 @@ def start_http_server(port: int = 7779) -> None:
     # Use existing helper functions
     # (get_gpu_summary, get_last_event_ts, redact_state are defined in outer scope)
 
-    def get_gpu_summary() -> Dict[str, Any]:
-        """Get minimal GPU info without exposing sensitive data."""
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=memory.used,memory.total,utilization.gpu",
-                    "--format=csv,noheader,nounits",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                parts = result.stdout.strip().split(",")
-                if len(parts) >= 2:
-                    return {
-                        "vram_used_mb": int(parts[0].strip()),
-                        "vram_total_mb": int(parts[1].strip()),
-                        "util_pct": int(parts[2].strip()) if len(parts) > 2 else 0,
-                    }
-        except Exception:
-            pass
-        return {"available": False}
+    # dashboard.html is read once here, not per request
+    dashboard_path = Path(__file__).parent / "dashboard.html"
+    dashboard_body = dashboard_path.read_bytes() if dashboard_path.exists() else None
 
     class StateHandler(BaseHTTPRequestHandler):
         """HTTP handler with security restrictions."""
@@ -1487,32 +2388,51 @@ def start_http_server(port: int = 7779) -> None:
             self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
             self.send_header("Access-Control-Allow-Headers", "Content-Type")
 
+        def _send_json(self, body: bytes) -> None:
+            # Larger bodies (/runs with many runs) go out gzipped to clients
+            # that accept it; level 1 costs far less than the bytes it saves
+            gzipped = len(body) > 1024 and "gzip" in self.headers.get("Accept-Encoding", "")
+            if gzipped:
+                body = gzip.compress(body, compresslevel=1)
+            self.send_response(200)
+            self._send_cors_headers()
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Vary", "Accept-Encoding")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
         def do_GET(self):
-            if self.path == "/health":
+            url = urlsplit(self.path)
+            path = url.path
+
+            if path == "/health":
                 self.send_response(200)
                 self._send_cors_headers()
                 self.send_header("Content-Type", "application/json")
                 self.end_headers()
-                self.wfile.write(json.dumps({"health": "ok"}).encode())
+                self.wfile.write(b'{"health":"ok"}')
                 return
 
-            if self.path == "/":
+            if path == "/":
                 # Serve dashboard.html if it exists
-                dashboard_path = Path(__file__).parent / "dashboard.html"
-                if dashboard_path.exists():
+                if dashboard_body is not None:
                     self.send_response(200)
                     self._send_cors_headers()
                     self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(dashboard_body)))
                     self.end_headers()
-                    with open(dashboard_path, "rb") as f:
-                        self.wfile.write(f.read())
+                    self.wfile.write(dashboard_body)
                     return
 
             # List all runs (local + remote)
-            if self.path == "/runs":
+            if path == "/runs":
                 local_runs = list_runs()
                 # Merge remote states
-                all_runs = local_runs + list(_remote_states.values())
+                with _remote_states_lock:
+                    all_runs = local_runs + list(_remote_states.values())
                 # Deduplicate by run_id (prefer local)
                 seen_ids = set()
                 unique_runs = []
@@ -1524,26 +2444,23 @@ def start_http_server(port: int = 7779) -> None:
                         unique_runs.append(redacted_run)
                         seen_ids.add(run.get("run_id"))
 
-                self.send_response(200)
-                self._send_cors_headers()
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps(unique_runs).encode())
+                self._send_json(_json_bytes(unique_runs))
                 return
 
             # Get specific run status
-            if self.path.startswith("/status"):
-                query_run_id = None
-                if "?run_id=" in self.path:
-                    try:
-                        query_run_id = self.path.split("?run_id=")[1].split("&")[0]
-                    except IndexError:
-                        pass
+            if path == "/status":
+                query_run_id = parse_qs(url.query).get("run_id", [None])[0]
 
                 # Check remote states first if run_id provided
-                if query_run_id and query_run_id in _remote_states:
-                    state = _remote_states[query_run_id]
-                else:
+                state = None
+                if query_run_id:
+                    with _remote_states_lock:
+                        state = _remote_states.get(query_run_id)
+                    if state is not None:
+                        # Augmented below: keep the stored report as posted,
+                        # and /runs iterating it unaffected
+                        state = dict(state)
+                if state is None:
                     # Default to local state if no ID or ID not found remotely
                     # If ID is local, get_state takes argument
                     state = get_state(query_run_id)
@@ -1561,11 +2478,7 @@ def start_http_server(port: int = 7779) -> None:
                 # Redact to allowed fields only
                 redacted = redact_state(state)
 
-                self.send_response(200)
-                self._send_cors_headers()
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps(redacted).encode())
+                self._send_json(_json_bytes(redacted))
                 return
 
             # Unknown endpoint
@@ -1578,11 +2491,11 @@ def start_http_server(port: int = 7779) -> None:
                 try:
                     content_length = int(self.headers.get("Content-Length", 0))
                     body = self.rfile.read(content_length)
-                    data = json.loads(body)
+                    data = _loads(body)
                     run_id = data.get("run_id")
                     if run_id:
                         # Store in memory
-                        _remote_states[run_id] = data
+                        _store_remote_state(run_id, data)
                         self.send_response(200)
                         self._send_cors_headers()
                         self.end_headers()
@@ -1610,10 +2523,17 @@ def start_http_server(port: int = 7779) -> None:
         def log_message(self, format, *args):
             pass  # Suppress logging
 
+    class StatusServer(ThreadingHTTPServer):
+        # Listen backlog: socketserver's default of 5 refuses connections
+        # when many reporters post at once
+        request_queue_size = 128
+
     def run_server():
         try:
             # SECURITY: Bind to 0.0.0.0 for multi-machine support
-            server = HTTPServer(("127.0.0.1", port), StateHandler)
+            # One thread per connection, so a slow reporter or /status call
+            # (nvidia-smi) doesn't hold up the others
+            server = StatusServer(("127.0.0.1", port), StateHandler)
             print(f"[INFO] HTTP status server running on http://0.0.0.0:{port}")
             server.serve_forever()
         except Exception as e:
@@ -1634,13 +2554,33 @@ def start_http_server(port: int = 7779) -> None:
 # =============================================================================
 
 
+# Each run's parsed state.json as last read by list_runs(), keyed by the
+# file's (st_ino, st_size, st_mtime_ns) like _status_cache
+_runs_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+# Changed state.json files list_runs() reads concurrently; on network
+# filesystems each read is a round trip, so they overlap rather than queue
+_RUNS_READ_WORKERS = 16
+
+
+def _load_run_state(state_file: str) -> Optional[Dict[str, Any]]:
+    try:
+        return _read_json_file(Path(state_file))
+    except Exception:
+        return None
+
+
 def list_runs() -> List[Dict[str, Any]]:
     """
     List all runs in the heidi_engine directory.
 
     HOW IT WORKS:
-        - Scans runs/ subdirectories
-        - Returns basic info for each run
+        - Scans runs/ subdirectories with one stat per run directory
+        - Returns basic info for each run, newest first
+        - Only state.json files whose stat signature changed since the last
+          call are read and parsed again, so polling /runs on a host with
+          many finished runs costs stats, not reads
+        - Those reads run on up to _RUNS_READ_WORKERS threads
 
     TUNABLE:
         - N/A
@@ -1648,27 +2588,51 @@ def list_runs() -> List[Dict[str, Any]]:
     RETURNS:
         List of run info dictionaries
     """
+    global _runs_cache
+
     runs_dir = Path(AUTOTRAIN_DIR) / "runs"
 
-    if not runs_dir.exists():
+    try:
+        with os.scandir(runs_dir) as it:
+            run_dirs = [(entry.stat().st_mtime, entry.path) for entry in it if entry.is_dir()]
+    except OSError:
         return []
+    run_dirs.sort(key=lambda item: item[0], reverse=True)
 
-    runs = []
-
-    for run_path in sorted(runs_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
-        if not run_path.is_dir():
+    # (state_file, signature, cached entry if still current), newest first
+    found = []
+    for _mtime, run_path in run_dirs:
+        state_file = os.path.join(run_path, "state.json")
+        try:
+            st = os.stat(state_file)
+        except OSError:
             continue
 
-        state_file = run_path / "state.json"
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        cached = _runs_cache.get(state_file)
+        found.append((state_file, key, cached if cached is not None and cached[0] == key else None))
 
-        if state_file.exists():
-            try:
-                with open(state_file) as f:
-                    state = json.load(f)
-                    runs.append(state)
-            except Exception:
-                pass
+    changed = [state_file for state_file, _key, cached in found if cached is None]
+    if len(changed) > 1:
+        with ThreadPoolExecutor(max_workers=min(_RUNS_READ_WORKERS, len(changed))) as pool:
+            loaded = dict(zip(changed, pool.map(_load_run_state, changed)))
+    else:
+        loaded = {state_file: _load_run_state(state_file) for state_file in changed}
 
+    runs = []
+    cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+    for state_file, key, cached in found:
+        if cached is None:
+            state = loaded[state_file]
+            if state is None:
+                continue
+            cached = (key, state)
+        cache[state_file] = cached
+        runs.append(dict(cached[1]))
+
+    # Rebuilt each call, so deleted runs drop out
+    _runs_cache = cache
     return runs
 
 
@@ -1755,10 +2719,10 @@ def main():
             start_http_server(HTTP_STATUS_PORT)
 
     elif args.command == "status":
-        state = get_state(args.run_id)
         if args.json:
-            print(json.dumps(state, indent=2))
+            print(dump_state_pretty(args.run_id))
         else:
+            state = get_state(args.run_id)
             print(f"Run: {state.get('run_id')}")
             print(f"Status: {state.get('status')}")
             print(f"Stage: {state.get('current_stage')}")
@@ -1,4 +1,6 @@
 import os
+import threading
+from collections import OrderedDict
 
 from flask import Flask, jsonify, request
 from flask_httpauth import HTTPBasicAuth
@@ -8,8 +10,11 @@ app = Flask(__name__)
 socketio = SocketIO(app, cors_allowed_origins="*")
 auth = HTTPBasicAuth()
 
-# In-memory store for remote states (similar to telemetry.py)
-_remote_states = {}
+# In-memory store for remote states (similar to telemetry.py), least recently
+# reported first and capped at MAX_REMOTE_STATES
+MAX_REMOTE_STATES = int(os.environ.get('MAX_REMOTE_STATES', '10000'))
+_remote_states = OrderedDict()
+_remote_states_lock = threading.Lock()
 
 @auth.verify_password
 def verify(username, password):
@@ -30,8 +35,12 @@ def report():
         if not run_id:
             return jsonify({"error": "missing run_id"}), 400
 
-        # Store state
-        _remote_states[run_id] = data
+        # Store state, evicting the runs that haven't reported for longest
+        with _remote_states_lock:
+            _remote_states[run_id] = data
+            _remote_states.move_to_end(run_id)
+            while len(_remote_states) > MAX_REMOTE_STATES:
+                _remote_states.popitem(last=False)
 
         # Broadcast via WebSocket for real-time dashboard updates
         socketio.emit('state_update', data)
@@ -43,7 +52,9 @@ def report():
 @app.route('/runs', methods=['GET'])
 def list_runs():
     # This would ideally merge with local runs, but for now returns active remote ones
-    return jsonify(list(_remote_states.values()))
+    with _remote_states_lock:
+        runs = list(_remote_states.values())
+    return jsonify(runs)
 
 @app.route('/status', methods=['GET'])
 def get_status():
@@ -51,7 +62,8 @@ def get_status():
     if not run_id:
         return jsonify({"error": "missing run_id"}), 400
 
-    state = _remote_states.get(run_id)
+    with _remote_states_lock:
+        state = _remote_states.get(run_id)
     if not state:
         return jsonify({"error": "run not found"}), 404
 
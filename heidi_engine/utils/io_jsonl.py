@@ -1,44 +1,55 @@
 import json
+import mmap
 import os
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as one UTF-8 JSON line, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson rejects go through the stdlib encoder below.
+            pass
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+# Write buffer for save_jsonl
+_WRITE_BUFFER_SIZE = 1 << 20
 
 SCHEMA_VERSION = "1.0"
-REQUIRED_KEYS = {
+REQUIRED_KEYS = frozenset({
     "event_version", "ts", "run_id", "round", "stage", "level",
     "event_type", "message", "counters_delta", "usage_delta",
     "artifact_paths", "prev_hash"
-}
+})
 
-def load_jsonl(path: str, is_journal: bool = False) -> List[Dict[str, Any]]:
+def iter_jsonl(path: str, is_journal: bool = False) -> Iterator[Dict[str, Any]]:
     """
-    Load samples from JSONL file.
+    Yield samples from a JSONL file one line at a time.
     If is_journal=True, enforces Phase 6 Zero-Trust Journal validation (12 keys).
-    """
-    samples = []
 
-    with open(path, "r") as f:
+    Only the current line is held in memory, so single-pass callers can
+    validate or reduce a large file without loading all of it.
+    """
+    with open(path, "rb") as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if not line:
                 continue
 
             try:
-                sample = json.loads(line)
-
-                if is_journal:
-                    # Zero-Trust Validation (Lane D)
-                    missing = REQUIRED_KEYS - set(sample.keys())
-                    if missing:
-                        print(f"[FATAL] Line {line_num}: Missing keys: {missing}", file=sys.stderr)
-                        sys.exit(1)
-
-                    if sample["event_version"] != SCHEMA_VERSION:
-                        print(f"[FATAL] Line {line_num}: Unsupported schema version {sample['event_version']}", file=sys.stderr)
-                        sys.exit(1)
-
-                samples.append(sample)
-            except json.JSONDecodeError as e:
+                sample = _loads(line)
+            except ValueError as e:
                 if is_journal:
                     print(f"[FATAL] Line {line_num}: JSON parse error: {e}", file=sys.stderr)
                     sys.exit(1)
@@ -46,7 +57,72 @@ def load_jsonl(path: str, is_journal: bool = False) -> List[Dict[str, Any]]:
                 print(f"[WARN] Line {line_num}: JSON parse error: {e}", file=sys.stderr)
                 continue
 
-    return samples
+            if is_journal:
+                # Zero-Trust Validation (Lane D)
+                # issubset probes the dict directly; the diff is only built to report it
+                if not REQUIRED_KEYS.issubset(sample):
+                    missing = {key for key in REQUIRED_KEYS if key not in sample}
+                    print(f"[FATAL] Line {line_num}: Missing keys: {missing}", file=sys.stderr)
+                    sys.exit(1)
+
+                if sample["event_version"] != SCHEMA_VERSION:
+                    print(f"[FATAL] Line {line_num}: Unsupported schema version {sample['event_version']}", file=sys.stderr)
+                    sys.exit(1)
+
+            yield sample
+
+
+def load_jsonl(path: str, is_journal: bool = False) -> List[Dict[str, Any]]:
+    """
+    Load samples from JSONL file (see iter_jsonl).
+    If is_journal=True, enforces Phase 6 Zero-Trust Journal validation (12 keys).
+    """
+    return list(iter_jsonl(path, is_journal))
+
+
+def iter_jsonl_records(path: str, start: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yield (end_offset, record) for each complete JSONL line from byte offset start.
+
+    HOW IT WORKS:
+        - Maps the file read-only and finds line ends with mmap.find, so each
+          line is sliced straight from the page cache (no Python line buffering)
+        - A last line without its newline is left alone: a writer may still be
+          appending it, and the next call from end_offset picks it up
+        - Blank and unparsable lines are skipped
+        - Falls back to plain binary line reads where the file can't be mapped
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file, or a file type/platform that can't be mapped
+            f.seek(start)
+            pos = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                pos += len(line)
+                if line.strip():
+                    try:
+                        yield pos, _loads(line)
+                    except ValueError:
+                        pass
+            return
+
+        with mm:
+            pos = start
+            while True:
+                end = mm.find(b"\n", pos)
+                if end < 0:
+                    return
+                line = mm[pos:end]
+                pos = end + 1
+                if line.strip():
+                    try:
+                        yield pos, _loads(line)
+                    except ValueError:
+                        pass
 
 
 def save_jsonl(samples: List[Dict[str, Any]], path: str) -> None:
@@ -55,12 +131,13 @@ def save_jsonl(samples: List[Dict[str, Any]], path: str) -> None:
 
     HOW IT WORKS:
         - Writes one JSON object per line
+        - Lines go through one writelines call into a 1 MiB buffer, so large
+          files take a write syscall per MiB rather than per few records
         - Creates parent directories if needed
     """
     dirname = os.path.dirname(path)
     if dirname:
         os.makedirs(dirname, exist_ok=True)
 
-    with open(path, "w") as f:
-        for sample in samples:
-            f.write(json.dumps(sample) + "\n")
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.writelines(_dumps(sample) for sample in samples)
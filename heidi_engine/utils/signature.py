@@ -1,4 +1,3 @@
-import hashlib
 import hmac
 import json
 from typing import Any, Dict
@@ -10,12 +9,9 @@ class SignatureUtil:
         """
         Compute HMAC-SHA256 over input string given a key.
         Matches C++ SignatureUtil implementation.
+        One-shot hmac.digest runs entirely in OpenSSL (no HMAC object).
         """
-        return hmac.new(
-            key.encode("utf-8"),
-            data.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
+        return hmac.digest(key.encode("utf-8"), data.encode("utf-8"), "sha256").hex()
 
     @staticmethod
     def verify(data: str, signature: str, key: str) -> bool:
@@ -45,4 +41,6 @@ def canonicalize_manifest(manifest: Dict[str, Any]) -> str:
                     raise TypeError(f"Manifest Hard-Lock: Floating point value detected in nested key '{k}.{sub_k}'.")
 
     # Phase 6 Requirement: Sorted keys, stable formatting, allow_nan=False for fail-closed safety
+    # Kept on stdlib json: signatures cover these exact bytes (ASCII-escaped),
+    # which orjson would not reproduce for non-ASCII text or NaN
     return json.dumps(manifest, sort_keys=True, separators=(",", ":"), allow_nan=False)
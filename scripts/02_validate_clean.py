@@ -66,7 +66,7 @@ try:
 except ImportError:
     HAS_SECURITY_VALIDATOR = False
 
-from heidi_engine.utils.io_jsonl import load_jsonl, save_jsonl
+from heidi_engine.utils.io_jsonl import iter_jsonl, save_jsonl
 from heidi_engine.utils.security_util import enforce_containment
 
 # Lane B: Boundary Control
@@ -427,15 +427,13 @@ def main():
     enforce_containment(args.input, allowed_base)
     enforce_containment(args.output, allowed_base)
 
-    # Load raw samples
-    raw_samples = load_jsonl(args.input)
-    print(f"[INFO] Loaded {len(raw_samples)} raw samples")
-
-    # Process samples
+    # Stream raw samples: only the cleaned ones are kept in memory
+    num_raw = 0
     valid_samples = []
     dropped_reasons: dict = {}
 
-    for sample in raw_samples:
+    for sample in iter_jsonl(args.input):
+        num_raw += 1
         try:
             enforce_strict_clean_schema(sample)
         except ValueError as e:
@@ -457,6 +455,7 @@ def main():
             reason_type = reason.split(":")[0]
             dropped_reasons[reason_type] = dropped_reasons.get(reason_type, 0) + 1
 
+    print(f"[INFO] Loaded {num_raw} raw samples")
     print(f"[INFO] After validation: {len(valid_samples)} samples")
 
     # Report dropped samples
@@ -479,9 +478,9 @@ def main():
 
     # Summary
     print("[OK] Cleaning complete!")
-    print(f"  - Input: {len(raw_samples)} samples")
+    print(f"  - Input: {num_raw} samples")
     print(f"  - Output: {len(valid_samples)} samples")
-    print(f"  - Dropped: {len(raw_samples) - len(valid_samples)} samples")
+    print(f"  - Dropped: {num_raw - len(valid_samples)} samples")
 
     return 0
 
@@ -252,19 +252,21 @@ def list_runs() -> List[Dict[str, Any]]:
     """
     runs_dir = get_runs_dir()
 
-    if not runs_dir.exists():
+    # scandir gives is_dir() from the directory listing; one stat per run
+    try:
+        with os.scandir(runs_dir) as it:
+            run_dirs = [(entry.stat().st_mtime, entry.name) for entry in it if entry.is_dir()]
+    except OSError:
         return []
+    run_dirs.sort(key=lambda item: item[0], reverse=True)
 
     runs = []
-    for run_path in sorted(runs_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
-        if not run_path.is_dir():
-            continue
-
-        state = get_run_state(run_path.name)
+    for _mtime, run_id in run_dirs:
+        state = get_run_state(run_id)
         if state:
             runs.append(
                 {
-                    "run_id": run_path.name,
+                    "run_id": run_id,
                     "status": state.get("status", "unknown"),
                     "current_round": state.get("current_round", 0),
                     "current_stage": state.get("current_stage", "unknown"),
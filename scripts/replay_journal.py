@@ -48,8 +48,10 @@ def verify_journal(filepath):
 
         # 2. Schema Validation (Lane D: Zero-Trust Hard Lock)
         from heidi_engine.utils.io_jsonl import REQUIRED_KEYS, SCHEMA_VERSION
-        missing = REQUIRED_KEYS - set(evt.keys())
-        assert not missing, f"Line {i+1}: Missing required schema keys {missing}"
+        # issubset probes the dict directly; the diff is only built to report it
+        if not REQUIRED_KEYS.issubset(evt):
+            missing = {key for key in REQUIRED_KEYS if key not in evt}
+            raise AssertionError(f"Line {i+1}: Missing required schema keys {missing}")
         assert evt["event_version"] == SCHEMA_VERSION, f"Line {i+1}: Unsupported schema version {evt['event_version']}"
 
         # 3. Deterministic State Progression Simulation
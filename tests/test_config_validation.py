@@ -0,0 +1,35 @@
+"""
+Unit tests for telemetry config validation.
+"""
+
+import pytest
+
+from heidi_engine import telemetry
+from heidi_engine.telemetry import validate_config
+
+
+def test_accepts_known_fields_in_range():
+    validate_config({"SAMPLES_PER_ROUND": 10, "VAL_RATIO": 0.2, "RUN_UNIT_TESTS": "1"})
+    validate_config({})
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        ({"NOPE": 1}, "Unknown config field: NOPE"),
+        ({"ROUNDS": "3"}, "Invalid type for ROUNDS"),
+        ({"SEQ_LEN": 64}, "Value for SEQ_LEN too small"),
+        ({"BATCH_SIZE": 65}, "Value for BATCH_SIZE too large"),
+        ({"RUN_UNIT_TESTS": "yes"}, "Invalid value for RUN_UNIT_TESTS"),
+    ],
+)
+def test_rejects_invalid_config(config, message):
+    with pytest.raises(ValueError, match=message):
+        validate_config(config)
+
+
+def test_reports_missing_required_fields(monkeypatch):
+    monkeypatch.setattr(telemetry, "_REQUIRED_CONFIG_FIELDS", ("BASE_MODEL",))
+
+    with pytest.raises(ValueError, match="Missing required config field: BASE_MODEL"):
+        validate_config({"ROUNDS": 3})
@@ -4,7 +4,7 @@ Unit tests for JSONL IO utilities.
 
 import os
 import pytest
-from heidi_engine.utils.io_jsonl import load_jsonl, save_jsonl
+from heidi_engine.utils.io_jsonl import iter_jsonl, iter_jsonl_records, load_jsonl, save_jsonl
 
 class TestJSONLUtils:
     """Test JSONL loading and saving utilities."""
@@ -25,6 +25,25 @@ class TestJSONLUtils:
         loaded = load_jsonl(str(test_file))
         assert samples == loaded
 
+    def test_save_writes_utf8_lines(self, test_file):
+        """Test that non-ASCII text is written as UTF-8 and reads back unchanged."""
+        samples = [{"text": "café ✓"}, {"n": 1.5}]
+        save_jsonl(samples, str(test_file))
+
+        assert "café ✓" in test_file.read_text(encoding="utf-8")
+        assert len(test_file.read_bytes().splitlines()) == 2
+        assert load_jsonl(str(test_file)) == samples
+
+    def test_iter_jsonl_is_lazy(self, test_file):
+        """Test that iter_jsonl yields records as it reads instead of loading the file."""
+        test_file.write_text('{"id": 1}\n{"id": 2}\n')
+
+        records = iter_jsonl(str(test_file))
+        assert next(records) == {"id": 1}
+        with test_file.open("a") as f:
+            f.write('{"id": 3}\n')
+        assert list(records) == [{"id": 2}, {"id": 3}]
+
     def test_save_creates_directories(self, tmp_path):
         """Test that save_jsonl automatically creates missing parent directories."""
         nested_path = tmp_path / "subdir" / "nested.jsonl"
@@ -74,3 +93,30 @@ class TestJSONLUtils:
         # but we can explicitly remove the file if we want to be clean within the test.
         if os.path.exists(local_name):
             os.remove(local_name)
+
+    def test_iter_records_resumes_from_offset(self, test_file):
+        """Test that iter_jsonl_records yields end offsets usable as the next start."""
+        test_file.write_bytes(b'{"id": 1}\n\n{bad}\n{"id": 2}\n')
+
+        records = list(iter_jsonl_records(str(test_file)))
+        assert [r["id"] for _, r in records] == [1, 2]
+        assert records[-1][0] == test_file.stat().st_size
+
+        with open(test_file, "ab") as f:
+            f.write(b'{"id": 3}\n')
+        resumed = list(iter_jsonl_records(str(test_file), records[-1][0]))
+        assert [r["id"] for _, r in resumed] == [3]
+
+    def test_iter_records_leaves_partial_last_line(self, test_file):
+        """Test that a line still being written is not consumed."""
+        test_file.write_bytes(b'{"id": 1}\n{"id": ')
+
+        records = list(iter_jsonl_records(str(test_file)))
+        assert [r["id"] for _, r in records] == [1]
+        assert records[-1][0] == len(b'{"id": 1}\n')
+
+    def test_iter_records_empty_file(self, test_file):
+        """Test that an empty file (which can't be mapped) yields nothing."""
+        test_file.write_bytes(b"")
+
+        assert list(iter_jsonl_records(str(test_file))) == []
@@ -133,3 +133,15 @@ def test_loop_runner_with_tests(mock_run, temp_out_dir, mock_telemetry, monkeypa
         assert mock_run.call_count == 5
         tests_call = str(mock_run.mock_calls[2])
         assert "03_unit_test_gate.py" in tests_call
+
+@patch('subprocess.run')
+def test_loop_runner_reports_decoded_stderr_on_failure(mock_run, temp_out_dir, mock_telemetry):
+    import subprocess
+
+    mock_run.side_effect = subprocess.CalledProcessError(1, ["x"], output=b"", stderr=b"boom \xff")
+
+    runner = PythonLoopRunner()
+    runner.start(mode="full")
+    with pytest.raises(RuntimeError, match="Teacher generation failed: boom �"):
+        runner.tick()
+    assert runner.get_status()["state"] == "ERROR"
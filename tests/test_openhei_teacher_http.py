@@ -0,0 +1,298 @@
+import json
+import socket
+import struct
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from heidi_engine.teacher import openhei_teacher as mod
+
+
+class _FakeOpenHei(BaseHTTPRequestHandler):
+    """Minimal OpenHei attach API: /doc, /session, /event (SSE), /message."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def _send_json(self, obj, status=200):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self):
+        self.server.requests.append((self.command, self.path.split("?")[0], self.client_address))
+
+    def do_GET(self):
+        self._record()
+        if self.path.startswith("/doc"):
+            self._send_json({"ok": True})
+            return
+        if self.path.startswith("/event"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.flush()
+            self.server.message_posted.wait(5)
+            if self.server.hold_stream:
+                # Stay connected and silent, like a server whose run never starts.
+                self.server.stream_released.wait(30)
+                return
+            for event in self.server.events:
+                self.wfile.write(b": keepalive\n\n")
+                self.wfile.write(b"data: " + json.dumps(event).encode("utf-8") + b"\n\n")
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        self._record()
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.startswith("/session/") and "/message" in self.path:
+            self.server.messages.append(payload)
+            self.server.message_posted.set()
+            if self.server.reset_message:
+                # Drop the connection with a RST after taking the message.
+                self.connection.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                )
+                self.connection.close()
+                self.close_connection = True
+                return
+            if self.server.fail_message:
+                self._send_json({"error": "model unavailable"}, status=500)
+                return
+            self._send_json({})
+            return
+        if self.path.startswith("/session"):
+            self.server.message_posted.clear()
+            self._send_json({"id": "sess1"})
+            return
+        self._send_json({"error": "not found"}, status=404)
+
+
+def _delta(text, part_id="p1"):
+    return {
+        "type": "message.part.delta",
+        "properties": {
+            "sessionID": "sess1",
+            "messageID": "mid1",
+            "partID": part_id,
+            "field": "text",
+            "delta": text,
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def _isolated_attach_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    mod.validate_openhei_attach_url.cache_clear()
+
+
+def _make_server(port=0):
+    server = ThreadingHTTPServer(("127.0.0.1", port), _FakeOpenHei)
+    server.requests = []
+    server.messages = []
+    server.message_posted = threading.Event()
+    server.fail_message = False
+    server.reset_message = False
+    server.hold_stream = False
+    server.stream_released = threading.Event()
+    server.events = [
+        _delta("Hello "),
+        _delta("world"),
+        {
+            "type": "message.part.updated",
+            "properties": {
+                "part": {
+                    "id": "p1",
+                    "sessionID": "sess1",
+                    "messageID": "mid1",
+                    "type": "text",
+                    "text": "Hello world",
+                    "time": {"end": "t"},
+                }
+            },
+        },
+    ]
+    return server
+
+
+@pytest.fixture
+def fake_openhei():
+    server = _make_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _run_once(url, tmp_path):
+    return mod._api_run_once(
+        attach_url=url,
+        repo_dir=str(tmp_path),
+        prompt="hello",
+        model_id="openai/gpt-5-mini",
+        agent="",
+        timeout_sec=10.0,
+    )
+
+
+def test_api_run_once_collects_streamed_text(fake_openhei, tmp_path):
+    server, url = fake_openhei
+
+    assert _run_once(url, tmp_path) == "Hello world"
+    assert server.messages[0]["model"] == {"providerID": "openai", "modelID": "gpt-5-mini"}
+    assert server.messages[0]["parts"] == [{"type": "text", "text": "hello"}]
+
+
+def test_api_requests_reuse_keepalive_connections(fake_openhei, tmp_path):
+    server, url = fake_openhei
+
+    assert _run_once(url, tmp_path) == "Hello world"
+    assert _run_once(url, tmp_path) == "Hello world"
+
+    posts = [addr for method, _path, addr in server.requests if method == "POST"]
+    assert len(posts) == 4
+    # The second run's session POST goes over the first run's message connection.
+    assert posts[2] == posts[1]
+
+
+def test_http_json_raises_on_error_status(fake_openhei):
+    _server, url = fake_openhei
+
+    with pytest.raises(mod.OpenHeiTeacherError, match="404"):
+        mod._http_json("GET", url + "/missing", None, timeout_sec=5.0)
+
+
+def test_attach_validation_warms_connection_pool(fake_openhei, tmp_path):
+    server, url = fake_openhei
+
+    mod.validate_openhei_attach_url(url)
+    assert _run_once(url, tmp_path) == "Hello world"
+
+    doc_addr = server.requests[0][2]
+    session_addr = server.requests[1][2]
+    assert server.requests[0][1] == "/doc"
+    assert session_addr == doc_addr
+
+
+def test_api_run_once_surfaces_message_post_failure(fake_openhei, tmp_path):
+    server, url = fake_openhei
+    server.fail_message = True
+    server.events = []
+
+    with pytest.raises(mod.OpenHeiTeacherError, match="500"):
+        _run_once(url, tmp_path)
+
+
+def test_reset_after_message_post_is_not_retried(fake_openhei):
+    server, url = fake_openhei
+    server.reset_message = True
+
+    # Leaves a keep-alive connection in the pool for the message POST to reuse.
+    mod._http_json("POST", f"{url}/session", {}, timeout_sec=5)
+    with pytest.raises(mod.OpenHeiTeacherError, match="request failed"):
+        mod._http_json("POST", f"{url}/session/sess1/message", {"n": 1}, timeout_sec=5)
+
+    assert server.messages == [{"n": 1}]
+
+
+def test_message_post_failure_wakes_reader_on_idle_stream(fake_openhei, tmp_path):
+    import time
+
+    server, url = fake_openhei
+    server.fail_message = True
+    server.hold_stream = True
+
+    t0 = time.monotonic()
+    try:
+        with pytest.raises(mod.OpenHeiTeacherError, match="500"):
+            mod._api_run_once(
+                attach_url=url,
+                repo_dir=str(tmp_path),
+                prompt="hello",
+                model_id="openai/gpt-5-mini",
+                agent="",
+                # read_timeout is 20s at this budget
+                timeout_sec=100.0,
+            )
+    finally:
+        server.stream_released.set()
+    assert time.monotonic() - t0 < 5
+
+
+def test_serve_worker_handles_runs_without_per_call_spawns(monkeypatch, tmp_path):
+    # Stand-in for `openhei serve`: the fake API above, on the requested port.
+    starts = tmp_path / "starts.log"
+    script = tmp_path / "fake_openhei.py"
+    script.write_text(
+        "import sys\n"
+        f"sys.path.insert(0, {str(Path(__file__).resolve().parents[1])!r})\n"
+        "from tests.test_openhei_teacher_http import _make_server\n"
+        "assert sys.argv[1] == 'serve'\n"
+        f"open({str(starts)!r}, 'a').write('start\\n')\n"
+        "_make_server(int(sys.argv[sys.argv.index('--port') + 1])).serve_forever()\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("OPENHEI_CLI", f"{sys.executable} {script}")
+    monkeypatch.setenv("OPENHEI_SERVE", "1")
+
+    # Distinct configurations share the one worker process.
+    teachers = [
+        mod.OpenHeiTeacher(timeout_sec=10, retries=0),
+        mod.OpenHeiTeacher(timeout_sec=20, retries=1),
+    ]
+    try:
+        for teacher in teachers:
+            for _ in range(2):
+                out = teacher.run(
+                    repo_dir=str(tmp_path), prompt="hello", model_id="openai/gpt-5-mini", agent=""
+                )
+                assert out == "Hello world"
+        assert teachers[0]._worker is teachers[1]._worker
+        proc = teachers[0]._worker._proc
+        for teacher in teachers:
+            teacher.close()
+        assert proc.poll() is None
+    finally:
+        mod._shutdown_workers()
+
+    assert starts.read_text().splitlines() == ["start"]
+    assert proc.poll() is not None
+    # The worker's own URL leaves no attach validation markers behind.
+    assert not (tmp_path / "cache").exists()
+
+
+def test_attach_validation_is_cached_on_disk(fake_openhei):
+    server, url = fake_openhei
+
+    mod.validate_openhei_attach_url(url)
+    mod.validate_openhei_attach_url.cache_clear()
+    mod.validate_openhei_attach_url(url)
+
+    assert [path for _m, path, _a in server.requests] == ["/doc"]
+    assert mod._attach_cache_marker(mod._doc_url(url)).exists()
+
+
+def test_attach_validation_failure_is_not_cached(tmp_path):
+    url = "http://127.0.0.1:9"
+
+    for _ in range(2):
+        with pytest.raises(mod.OpenHeiTeacherError, match="validation failed"):
+            mod.validate_openhei_attach_url(url, timeout_sec=0.5)
+    assert not mod._attach_cache_marker(mod._doc_url(url)).exists()
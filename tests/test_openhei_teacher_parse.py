@@ -1,4 +1,6 @@
+import io
 import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -26,14 +28,91 @@ def test_parse_openhei_jsonl_events_fails_closed_on_non_json_line():
         parse_openhei_jsonl_events("not json\n")
 
 
+def test_parse_openhei_jsonl_stream_accepts_crlf_and_blank_lines():
+    from heidi_engine.teacher.openhei_teacher import parse_openhei_jsonl_stream
+
+    lines = [
+        b'{"type":"text","part":{"text":"a","time":{"end":"t"}}}\r\n',
+        b"  \r\n",
+        b"\n",
+        b'  {"type":"text","part":{"text":"b","time":{"end":"t"}}}',
+    ]
+    assert parse_openhei_jsonl_stream(lines) == "ab"
+
+
+@pytest.mark.parametrize("text", ["", "a", "a\n", "a\nb", "a\r\n\nb\n", "\n\n"])
+def test_iter_lines_matches_splitlines_keepends(text):
+    from heidi_engine.teacher.openhei_teacher import _iter_lines
+
+    assert list(_iter_lines(text)) == text.splitlines(keepends=True)
+    assert list(_iter_lines(text.encode())) == text.encode().splitlines(keepends=True)
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        [],
+        [""],
+        ["  ", "\n"],
+        [" a "],
+        ["  ", " a", "b ", " c  ", "\n"],
+        ["\ta", "", " ", "b\n"],
+    ],
+)
+def test_join_stripped_matches_join_then_strip(parts):
+    from heidi_engine.teacher.openhei_teacher import _join_stripped
+
+    assert _join_stripped(parts) == "".join(parts).strip()
+
+
+def _patch_popen(monkeypatch, mod, fake_run):
+    """Replace subprocess.Popen with a stand-in driven by fake_run(cmd, env).
+
+    fake_run returns an object with returncode/stdout/stderr; the prompt written
+    to stdin is recorded in the returned dict under "input".
+    """
+
+    seen = {}
+
+    class _Stdin(io.BytesIO):
+        def close(self):
+            seen["input"] = self.getvalue()
+            super().close()
+
+    class FakePopen:
+        def __init__(self, cmd, *, stdin, stdout, stderr, env):
+            res = fake_run(cmd, env)
+            self.returncode = res.returncode
+            self.stdin = _Stdin()
+            self.stdout = io.BytesIO(res.stdout.encode("utf-8"))
+            self.stderr = io.BytesIO(res.stderr.encode("utf-8"))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def poll(self):
+            return self.returncode
+
+        def wait(self, timeout=None):
+            return self.returncode
+
+        def kill(self):
+            pass
+
+    monkeypatch.setattr(mod.subprocess, "Popen", FakePopen)
+    return seen
+
+
 def test_openhei_teacher_sends_prompt_via_stdin(monkeypatch, tmp_path):
     from heidi_engine.teacher import openhei_teacher as mod
 
     seen = {}
 
-    def fake_run(cmd, *, input, capture_output, text, timeout, env):
+    def fake_run(cmd, env):
         seen["cmd"] = cmd
-        seen["input"] = input
         seen["env"] = env
 
         class R:
@@ -43,7 +122,7 @@ def test_openhei_teacher_sends_prompt_via_stdin(monkeypatch, tmp_path):
 
         return R()
 
-    monkeypatch.setattr(mod.subprocess, "run", fake_run)
+    stdin = _patch_popen(monkeypatch, mod, fake_run)
 
     teacher = mod.OpenHeiTeacher(timeout_sec=5, retries=0)
     out = teacher.run(
@@ -57,7 +136,7 @@ def test_openhei_teacher_sends_prompt_via_stdin(monkeypatch, tmp_path):
     assert out == '{"instruction":"x","input":"y","output":"z"}'
     assert "--agent" not in seen["cmd"]
     assert "--prompt" not in seen["cmd"]
-    assert seen["input"] == "hello\n"
+    assert stdin["input"] == b"hello\n"
 
 
 def test_openhei_teacher_falls_back_when_attach_session_not_found(monkeypatch, tmp_path, capsys):
@@ -77,7 +156,7 @@ def test_openhei_teacher_falls_back_when_attach_session_not_found(monkeypatch, t
             self.stdout = stdout
             self.stderr = stderr
 
-    def fake_run(cmd, *, input, capture_output, text, timeout, env):
+    def fake_run(cmd, env):
         calls["n"] += 1
         calls["cmds"].append(cmd)
 
@@ -92,7 +171,7 @@ def test_openhei_teacher_falls_back_when_attach_session_not_found(monkeypatch, t
             stderr="",
         )
 
-    monkeypatch.setattr(mod.subprocess, "run", fake_run)
+    _patch_popen(monkeypatch, mod, fake_run)
 
     teacher = mod.OpenHeiTeacher(timeout_sec=5, retries=0)
     out = teacher.run(
@@ -124,10 +203,10 @@ def test_openhei_teacher_strict_attach_fails_closed_on_session_not_found(monkeyp
         stdout = ""
         stderr = "Session not found"
 
-    def fake_run(cmd, *, input, capture_output, text, timeout, env):
+    def fake_run(cmd, env):
         return R()
 
-    monkeypatch.setattr(mod.subprocess, "run", fake_run)
+    _patch_popen(monkeypatch, mod, fake_run)
 
     teacher = mod.OpenHeiTeacher(timeout_sec=5, retries=0)
     with pytest.raises(mod.OpenHeiTeacherError):
@@ -140,6 +219,292 @@ def test_openhei_teacher_strict_attach_fails_closed_on_session_not_found(monkeyp
         )
 
 
+def _fake_cli(tmp_path, monkeypatch, body):
+    """Point OPENHEI_CLI at a Python script standing in for the openhei binary."""
+
+    script = tmp_path / "fake_openhei.py"
+    script.write_text("import sys, time\nprompt = sys.stdin.read()\n" + body, encoding="utf-8")
+    monkeypatch.setenv("OPENHEI_CLI", f"{sys.executable} {script}")
+
+
+def test_openhei_teacher_streams_real_process_stdout(monkeypatch, tmp_path):
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json\n"
+        "print(json.dumps({'type': 'step', 'n': 1}), flush=True)\n"
+        "print(json.dumps({'type': 'text', 'part': {'text': prompt.strip(), 'time': {'end': 1}}}))\n",
+    )
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=10, retries=0)
+    out = teacher.run(
+        repo_dir=str(tmp_path), prompt="echo me", model_id="openai/gpt-5-mini", agent=""
+    )
+    assert out == "echo me"
+
+
+def test_openhei_teacher_run_batch_returns_texts_in_order(monkeypatch, tmp_path):
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json\n"
+        "print(json.dumps({'type': 'text', 'part': {'text': prompt.upper(), 'time': {'end': 1}}}))\n",
+    )
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=10, retries=0)
+    outs = teacher.run_batch(
+        repo_dir=str(tmp_path), prompts=["a", "b", "c"], model_id="openai/gpt-5-mini", agent=""
+    )
+    assert list(outs) == ["A", "B", "C"]
+
+
+def test_openhei_collect_stops_at_first_invalid_sample(monkeypatch, tmp_path):
+    from heidi_engine.collect import openhei_collect
+
+    log = tmp_path / "calls.log"
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json\n"
+        f"open({str(log)!r}, 'a').write(prompt)\n"
+        "print(json.dumps({'type': 'text', 'part': {'text': '{}', 'time': {'end': 1}}}))\n",
+    )
+    prompts = tmp_path / "prompts.txt"
+    prompts.write_text("a\nb\nc\n", encoding="utf-8")
+    out = tmp_path / "out.jsonl"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "openhei_collect",
+            "--repo-dir",
+            str(tmp_path),
+            "--prompt-file",
+            str(prompts),
+            "--output",
+            str(out),
+            "--model",
+            "openai/gpt-5-mini",
+        ],
+    )
+    monkeypatch.delenv("OPENHEI_ATTACH", raising=False)
+
+    with pytest.raises(ValueError, match="Invalid sample"):
+        openhei_collect.main()
+    assert log.read_text().splitlines() == ["a"]
+
+
+def test_openhei_teacher_builds_cli_env_once(monkeypatch, tmp_path):
+    import pickle
+
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    calls = []
+    real_cli_env = mod._cli_env
+    monkeypatch.setattr(mod, "_cli_env", lambda: calls.append(1) or real_cli_env())
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json\n"
+        "print(json.dumps({'type': 'text', 'part': {'text': 'ok', 'time': {'end': 1}}}))\n",
+    )
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=10, retries=0)
+    for _ in range(2):
+        teacher.run(repo_dir=str(tmp_path), prompt="x", model_id="openai/gpt-5-mini", agent="")
+    assert len(calls) == 1
+
+    clone = pickle.loads(pickle.dumps(teacher))
+    assert clone._env_cache is None
+    assert clone == teacher
+
+
+def test_cmd_prefix_is_cached_and_omits_subagents():
+    from heidi_engine.teacher.openhei_teacher import _cmd_prefix
+
+    prefix = _cmd_prefix(("openhei",), "/repo", "openai/gpt-5-mini", "general")
+    assert prefix == ("openhei", "run", "--format", "json", "--dir", "/repo", "--model", "openai/gpt-5-mini")
+    assert _cmd_prefix(("openhei",), "/repo", "openai/gpt-5-mini", "general") is prefix
+    assert _cmd_prefix(("openhei",), "/repo", "openai/gpt-5-mini", "build")[-2:] == ("--agent", "build")
+
+
+def test_compute_backoff_is_exponential_jittered_and_capped(monkeypatch):
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    monkeypatch.setattr(mod.random, "uniform", lambda a, b: b)
+    assert mod._compute_backoff(0, 1.0) == 1.5
+    assert mod._compute_backoff(3, 1.0) == 12.0
+    assert mod._compute_backoff(20, 1.0) == 45.0
+
+    monkeypatch.setattr(mod.random, "uniform", lambda a, b: a)
+    assert mod._compute_backoff(2, 0.5) == 2.0
+
+
+def test_openhei_teacher_stops_cli_at_first_error_event(monkeypatch, tmp_path):
+    import time
+
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json\n"
+        "print(json.dumps({'type': 'error', 'message': 'boom'}), flush=True)\n"
+        "time.sleep(30)\n",
+    )
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=20, retries=0)
+    t0 = time.monotonic()
+    with pytest.raises(mod.OpenHeiTeacherError, match="openhei stream error: boom"):
+        teacher.run(repo_dir=str(tmp_path), prompt="x", model_id="openai/gpt-5-mini", agent="")
+    assert time.monotonic() - t0 < 10
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_openhei_teacher_prefers_stderr_when_cli_exits_on_its_own(monkeypatch, tmp_path, use_async):
+    import asyncio
+
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    # The CLI reports a stale session on stderr and exits 1 by itself; a child
+    # holding its stdout emits the error event only after that, so the runner
+    # sees the event without having to terminate anything.
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json, subprocess\n"
+        "event = json.dumps({'type': 'error', 'message': 'boom'})\n"
+        "subprocess.Popen([sys.executable, '-c', "
+        "f'import time; time.sleep(0.5); print({event!r})'], stderr=subprocess.DEVNULL)\n"
+        "sys.stderr.write('Session not found\\n')\n"
+        "sys.exit(1)\n",
+    )
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=20, retries=0)
+    kwargs = dict(repo_dir=str(tmp_path), prompt="x", model_id="openai/gpt-5-mini", agent="")
+    with pytest.raises(mod.OpenHeiTeacherError, match="Session not found"):
+        if use_async:
+            asyncio.run(teacher.arun(**kwargs))
+        else:
+            teacher.run(**kwargs)
+
+
+def test_openhei_teacher_kills_process_at_timeout(monkeypatch, tmp_path):
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    _fake_cli(tmp_path, monkeypatch, "time.sleep(30)\n")
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=1, retries=0)
+    with pytest.raises(mod.OpenHeiTeacherError, match="timeout"):
+        teacher.run(repo_dir=str(tmp_path), prompt="x", model_id="openai/gpt-5-mini", agent="")
+
+
+def test_openhei_teacher_enforces_stdout_limit(monkeypatch, tmp_path):
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "for _ in range(1000):\n    print('{\"type\": \"step\"}')\n",
+    )
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=10, retries=0, max_stdout_chars=100)
+    with pytest.raises(mod.OpenHeiTeacherError, match="exceeded limit"):
+        teacher.run(repo_dir=str(tmp_path), prompt="x", model_id="openai/gpt-5-mini", agent="")
+
+
+def test_openhei_teacher_arun_runs_processes_concurrently(monkeypatch, tmp_path):
+    import asyncio
+    import time
+
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json\n"
+        "time.sleep(1)\n"
+        "print(json.dumps({'type': 'text', 'part': {'text': prompt.strip(), 'time': {'end': 1}}}))\n",
+    )
+    teacher = mod.OpenHeiTeacher(timeout_sec=10, retries=0)
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                teacher.arun(
+                    repo_dir=str(tmp_path), prompt=p, model_id="openai/gpt-5-mini", agent=""
+                )
+                for p in ("a", "b", "c")
+            )
+        )
+
+    t0 = time.monotonic()
+    assert asyncio.run(main()) == ["a", "b", "c"]
+    assert time.monotonic() - t0 < 2.5
+
+
+def test_openhei_teacher_arun_enforces_timeout_and_stdout_limit(monkeypatch, tmp_path):
+    import asyncio
+
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    kwargs = dict(repo_dir=str(tmp_path), prompt="x", model_id="openai/gpt-5-mini", agent="")
+
+    _fake_cli(tmp_path, monkeypatch, "time.sleep(30)\n")
+    teacher = mod.OpenHeiTeacher(timeout_sec=1, retries=0)
+    with pytest.raises(mod.OpenHeiTeacherError, match="timeout"):
+        asyncio.run(teacher.arun(**kwargs))
+
+    _fake_cli(tmp_path, monkeypatch, "print('x' * 1000)\n")
+    teacher = mod.OpenHeiTeacher(timeout_sec=10, retries=0, max_stdout_chars=100)
+    with pytest.raises(mod.OpenHeiTeacherError, match="exceeded limit"):
+        asyncio.run(teacher.arun(**kwargs))
+
+
+def test_openhei_teacher_arun_falls_back_when_attach_session_not_found(
+    monkeypatch, tmp_path, capsys
+):
+    import asyncio
+
+    from heidi_engine.teacher import openhei_teacher as mod
+
+    monkeypatch.setenv("OPENHEI_ATTACH_HTTP", "0")
+    monkeypatch.setattr(mod, "validate_openhei_attach_url", lambda *_a, **_k: None)
+    log = tmp_path / "attempts.log"
+    _fake_cli(
+        tmp_path,
+        monkeypatch,
+        "import json\n"
+        "attach = '--attach' in sys.argv\n"
+        f"open({str(log)!r}, 'a').write(('attach' if attach else 'plain') + '\\n')\n"
+        "if attach:\n"
+        "    sys.stderr.write('Session not found\\n')\n"
+        "    sys.exit(1)\n"
+        "print(json.dumps({'type': 'text', 'part': {'text': 'ok', 'time': {'end': 1}}}))\n",
+    )
+
+    teacher = mod.OpenHeiTeacher(timeout_sec=10, retries=0)
+    out = asyncio.run(
+        teacher.arun(
+            repo_dir=str(tmp_path),
+            prompt="x",
+            model_id="openai/gpt-5-mini",
+            agent="",
+            attach_url="http://127.0.0.1:4100",
+        )
+    )
+
+    assert out == "ok"
+    assert log.read_text().splitlines() == ["attach", "attach", "plain"]
+    err = capsys.readouterr().err
+    assert "retrying once" in err
+    assert "falling back to non-attach" in err
+
+
 @pytest.mark.skipif(os.environ.get("OPENHEI_INTEGRATION") != "1", reason="integration test")
 def test_openhei_integration_smoke(tmp_path):
     # Requires local credentials and model availability.
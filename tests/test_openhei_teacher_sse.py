@@ -1,4 +1,6 @@
-from heidi_engine.teacher.openhei_teacher import _AssistantTextCollector
+import io
+
+from heidi_engine.teacher.openhei_teacher import _AssistantTextCollector, _iter_sse_json_events
 
 
 def test_assistant_text_collector_nested_props_completion():
@@ -82,3 +84,34 @@ def test_assistant_text_collector_flat_event_shape():
 
     assert c.completed
     assert c.text() == "AB"
+
+
+def test_iter_sse_json_events_frames_data_lines():
+    stream = io.BytesIO(
+        b": keepalive\n\n"
+        b"event: message\n"
+        b'data: {"type": "a",\r\n'
+        b'data:  "n": 1}\r\n'
+        b"\r\n"
+        b"data: not json\n\n"
+        b'data: {"type": "b"}'
+    )
+
+    assert list(_iter_sse_json_events(stream)) == [{"type": "a", "n": 1}, {"type": "b"}]
+
+
+def test_assistant_text_collector_ignores_event_type_of_flat_part():
+    c = _AssistantTextCollector(session_id="sess3")
+
+    # No `part` object: the event's `type` is not a part type.
+    c.feed({
+        "type": "message.part.updated",
+        "id": "p3",
+        "sessionID": "sess3",
+        "messageID": "mid3",
+        "text": "ignored",
+        "time": {"end": "t"},
+    })
+
+    assert not c.completed
+    assert c.text() == ""
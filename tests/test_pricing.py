@@ -0,0 +1,50 @@
+"""
+Unit tests for pricing config loading and cost estimation in telemetry.
+"""
+
+import json
+import os
+
+import pytest
+
+from heidi_engine import telemetry
+
+
+@pytest.fixture
+def pricing_file(tmp_path, monkeypatch):
+    path = tmp_path / "pricing.json"
+    monkeypatch.setattr(telemetry, "PRICING_CONFIG_PATH", str(path))
+    return path
+
+
+def test_estimate_cost_uses_defaults_without_file(pricing_file):
+    assert telemetry.estimate_cost(1_000_000, 1_000_000, "gpt-4o-mini") == pytest.approx(0.75)
+    assert telemetry.estimate_cost(1_000_000, 1_000_000, "unknown-model") == 0.0
+
+
+def test_pricing_file_is_parsed_once(pricing_file, monkeypatch):
+    pricing_file.write_text(json.dumps({"my-model": {"input": 1.0, "output": 2.0}}))
+
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(telemetry.json, "load", lambda f: loads.append(1) or real_load(f))
+
+    for _ in range(5):
+        assert telemetry.estimate_cost(1_000_000, 500_000, "my-model") == pytest.approx(2.0)
+    assert "my-model" in telemetry.load_pricing_config()
+    assert len(loads) == 1
+
+
+def test_edited_pricing_file_is_reloaded(pricing_file):
+    pricing_file.write_text(json.dumps({"my-model": {"input": 1.0, "output": 0.0}}))
+    assert telemetry.estimate_cost(1_000_000, 0, "my-model") == pytest.approx(1.0)
+
+    pricing_file.write_text(json.dumps({"my-model": {"input": 3.0, "output": 0.0}}))
+    st = pricing_file.stat()
+    os.utime(pricing_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert telemetry.estimate_cost(1_000_000, 0, "my-model") == pytest.approx(3.0)
+
+
+def test_load_pricing_config_returns_a_copy(pricing_file):
+    telemetry.load_pricing_config()["gpt-4o"] = {"input": 0.0, "output": 0.0}
+    assert telemetry.estimate_cost(1_000_000, 0, "gpt-4o") == pytest.approx(2.5)
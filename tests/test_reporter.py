@@ -0,0 +1,96 @@
+"""
+Unit tests for the dashboard state reporter.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from heidi_engine import telemetry
+
+
+class _Stop(BaseException):
+    pass
+
+
+class _FakeSession:
+    def __init__(self):
+        self.headers = {}
+        self.posts = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def post(self, url, data, timeout):
+        self.posts.append(data)
+        return SimpleNamespace(ok=True)
+
+
+def _fake_requests(monkeypatch):
+    session = _FakeSession()
+    fake_requests = SimpleNamespace(
+        Session=lambda: session,
+        adapters=SimpleNamespace(HTTPAdapter=lambda **kwargs: None),
+    )
+    monkeypatch.setattr(telemetry, "requests", fake_requests)
+    return session
+
+
+def _run_reporter(monkeypatch, states, clock):
+    session = _fake_requests(monkeypatch)
+    pending = iter(states)
+
+    def get_state():
+        try:
+            return next(pending)
+        except StopIteration:
+            raise _Stop from None
+
+    monkeypatch.setattr(telemetry, "get_state", get_state)
+    ticks = iter(clock)
+    monkeypatch.setattr(telemetry, "time", SimpleNamespace(monotonic=lambda: next(ticks)))
+    monkeypatch.setattr(
+        telemetry, "_reporter_stop", SimpleNamespace(is_set=lambda: False, wait=lambda t: False)
+    )
+    with pytest.raises(_Stop):
+        telemetry._reporter_loop("http://dashboard")
+    return session.posts
+
+
+def test_reporter_skips_unchanged_state(monkeypatch):
+    running = {"run_id": "r1", "status": "running"}
+    done = {"run_id": "r1", "status": "completed"}
+
+    posts = _run_reporter(monkeypatch, [running, dict(running), done], [0.0, 5.0, 10.0])
+
+    assert [telemetry._loads(p)["status"] for p in posts] == ["running", "completed"]
+
+
+def test_reporter_resends_unchanged_state_as_heartbeat(monkeypatch):
+    monkeypatch.setattr(telemetry, "REPORTER_HEARTBEAT_SEC", 60.0)
+    state = {"run_id": "r1", "status": "running"}
+
+    posts = _run_reporter(monkeypatch, [state] * 3, [0.0, 30.0, 60.0])
+
+    assert len(posts) == 2
+
+
+def test_stop_reporter_ends_the_thread_without_waiting_out_the_interval(monkeypatch):
+    session = _fake_requests(monkeypatch)
+    monkeypatch.setattr(telemetry, "get_state", lambda: {"run_id": "r1"})
+
+    telemetry.start_reporter("http://dashboard")
+    thread = telemetry._reporter
+    telemetry.start_reporter("http://dashboard")
+    assert telemetry._reporter is thread
+    deadline = time.monotonic() + 5
+    while not session.posts and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    telemetry.stop_reporter()
+
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 2
+    assert len(session.posts) == 1
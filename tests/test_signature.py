@@ -54,3 +54,29 @@ def test_signature_tamper_detection():
     
     # Tamper with key
     assert not SignatureUtil.verify(data, sig, "wrong")
+
+def test_canonical_bytes_are_pinned():
+    # Existing signatures were computed over exactly these bytes (stdlib json,
+    # ensure_ascii escaping); a faster encoder must not change them.
+    manifest = {
+        "run_id": "r1",
+        "engine_version": "v1",
+        "created_at": "2026-02-20T10:00:00Z",
+        "schema_version": "1.0",
+        "dataset_hash": "sha256:abc",
+        "record_count": 100,
+        "replay_hash": "sha256:replay",
+        "signing_key_id": "k1",
+        "final_state": "VERIFIED",
+        "total_runtime_sec": 42,
+        "event_count": 1000,
+        "guardrail_snapshot": {"note": "café", "max_cpu": "80"}
+    }
+
+    assert canonicalize_manifest(manifest) == (
+        '{"created_at":"2026-02-20T10:00:00Z","dataset_hash":"sha256:abc",'
+        '"engine_version":"v1","event_count":1000,"final_state":"VERIFIED",'
+        '"guardrail_snapshot":{"max_cpu":"80","note":"caf\\u00e9"},'
+        '"record_count":100,"replay_hash":"sha256:replay","run_id":"r1",'
+        '"schema_version":"1.0","signing_key_id":"k1","total_runtime_sec":42}'
+    )
@@ -206,3 +206,63 @@ class TestCountersAndUsage:
         usage = sm.get_state()["usage"]
         assert usage["requests_sent"] == 1
         assert usage["input_tokens"] == 100
+
+    def test_update_usage_cost_is_float(self):
+        from heidi_engine.state_machine import StateMachine
+
+        sm = StateMachine(run_id=f"test-cost-{uuid.uuid4().hex[:8]}")
+        sm.update_usage({"estimated_cost_usd": 0.25, "unknown_key": 3})
+        sm.update_usage({"estimated_cost_usd": 0.5})
+        usage = sm.get_state()["usage"]
+        assert usage["estimated_cost_usd"] == pytest.approx(0.75)
+        assert "unknown_key" not in usage
+
+
+class TestStateViews:
+    def test_get_state_is_read_only(self):
+        from heidi_engine.state_machine import StateMachine
+
+        sm = StateMachine(run_id=f"test-view-{uuid.uuid4().hex[:8]}")
+        state = sm.get_state()
+        with pytest.raises(TypeError):
+            state["phase"] = "ERROR"
+
+    def test_snapshot_is_independent(self):
+        from heidi_engine.state_machine import StateMachine
+
+        sm = StateMachine(run_id=f"test-snap-{uuid.uuid4().hex[:8]}")
+        snap = sm.snapshot()
+        snap["counters"]["teacher_generated"] = 99
+        assert sm.get_state()["counters"]["teacher_generated"] == 0
+
+
+class TestNoOpRequests:
+    def test_repeated_pause_does_not_persist(self):
+        from heidi_engine.state_machine import StateMachine, Event
+
+        run_id = f"test-noop-{uuid.uuid4().hex[:8]}"
+        sm = StateMachine(run_id=run_id, autotrain_dir=Path(TEST_DIR))
+        sm.apply(Event.START_FULL)
+        sm.apply(Event.REQUEST_PAUSE)
+        state_file = Path(TEST_DIR) / "runs" / run_id / "state.json"
+        state_file.unlink()
+
+        sm.apply(Event.REQUEST_PAUSE)
+        assert not state_file.exists()
+        assert sm.get_status().name == "PAUSED"
+
+        sm.apply(Event.REQUEST_RESUME)
+        assert state_file.exists()
+        assert sm.get_status().name == "RUNNING"
+
+
+class TestCanTrainCache:
+    def test_can_train_tracks_mode_changes(self):
+        from heidi_engine.state_machine import StateMachine, Mode
+
+        sm = StateMachine(run_id=f"test-cantrain-{uuid.uuid4().hex[:8]}")
+        assert sm.can_train() is False
+        sm.set_mode(Mode.TRAIN)
+        assert sm.can_train() is True
+        sm.set_mode(Mode.IDLE)
+        assert sm.can_train() is False
@@ -0,0 +1,192 @@
+"""
+Unit tests for telemetry state write-behind and WAL recovery.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from heidi_engine import telemetry
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    monkeypatch.setattr(telemetry, "get_state_path", lambda run_id=None: path)
+    monkeypatch.setattr(telemetry, "STATE_FLUSH_SEC", 3600.0)
+    monkeypatch.setattr(telemetry, "_state_flushed_at", telemetry.time.monotonic())
+    monkeypatch.setattr(telemetry, "_pending_state", {})
+    monkeypatch.setattr(telemetry, "_wal_fds", {})
+    monkeypatch.setattr(telemetry, "_wal_seqs", {})
+    telemetry.save_state({"run_id": "r1", "status": "running"}, "r1")
+    yield path
+    telemetry._shutdown_state()
+
+
+def _on_disk(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_updates_are_held_until_flush(state_file):
+    telemetry.update_counters({"teacher_generated": 2}, "r1")
+    telemetry.update_counters({"teacher_generated": 3, "train_loss": 0.5}, "r1")
+    telemetry.update_usage({"requests_sent": 1}, run_id="r1")
+
+    assert "counters" not in _on_disk(state_file)
+    state = telemetry.get_state("r1")
+    assert state["counters"]["teacher_generated"] == 5
+    assert state["counters"]["train_loss"] == 0.5
+    assert state["usage"]["requests_sent"] == 1
+    assert len(telemetry._wal_path("r1").read_bytes().splitlines()) == 3
+
+    telemetry.flush_state()
+
+    assert _on_disk(state_file)["counters"]["teacher_generated"] == 5
+    assert telemetry._wal_path("r1").read_bytes() == b""
+    assert telemetry.get_state("r1")["counters"]["teacher_generated"] == 5
+
+
+def test_flush_keeps_other_writers_changes(state_file):
+    telemetry.update_counters({"teacher_generated": 2}, "r1")
+    # Another process bumps a counter and requests a stop meanwhile.
+    other = telemetry._load_state("r1")
+    other["counters"] = {"teacher_generated": 10}
+    other["stop_requested"] = True
+    telemetry.save_state(other, "r1")
+
+    telemetry.flush_state()
+
+    state = _on_disk(state_file)
+    assert state["counters"]["teacher_generated"] == 12
+    assert state["stop_requested"] is True
+
+
+def test_control_flags_are_written_immediately(state_file):
+    telemetry.update_counters({"teacher_generated": 1}, "r1")
+    telemetry.request_pause("r1")
+
+    state = _on_disk(state_file)
+    assert state["pause_requested"] is True
+    assert state["counters"]["teacher_generated"] == 1
+    assert "r1" not in telemetry._pending_state
+
+
+def test_recovers_wal_of_exited_process(state_file):
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    wal = state_file.with_name(f"state.{proc.pid}.wal")
+    wal.write_bytes(
+        b'{"kind":"counters","delta":{"teacher_generated":4},"model":null}\n'
+        b'{"kind":"usage","delta":{"requests_sent":2},"model":null}\n'
+        b'{"kind":"counters","delta":{"teacher_'
+    )
+
+    telemetry._recover_state_wals("r1")
+
+    state = _on_disk(state_file)
+    assert state["counters"]["teacher_generated"] == 4
+    assert state["usage"]["requests_sent"] == 2
+    assert not wal.exists()
+
+
+def test_wal_replay_skips_deltas_already_flushed(state_file, monkeypatch):
+    telemetry.update_counters({"teacher_generated": 2}, "r1")
+    telemetry.flush_state()
+    telemetry.update_counters({"teacher_generated": 3}, "r1")
+
+    # Crash after state.json is replaced but before the WAL is truncated.
+    def crash(fd, length):
+        raise OSError("crashed")
+
+    with monkeypatch.context() as m:
+        m.setattr(telemetry.os, "ftruncate", crash)
+        telemetry.flush_state()
+    assert _on_disk(state_file)["counters"]["teacher_generated"] == 5
+
+    wal = telemetry._wal_path("r1")
+    assert len(wal.read_bytes().splitlines()) == 1
+    for fd in telemetry._wal_fds.values():
+        telemetry.os.close(fd)
+    telemetry._wal_fds.clear()
+
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    dead = wal.with_name(wal.name.replace(f".{telemetry.os.getpid()}.", f".{proc.pid}."))
+    wal.rename(dead)
+    state = _on_disk(state_file)
+    state["wal_seq"][dead.name] = state["wal_seq"].pop(wal.name)
+    telemetry.save_state(state, "r1")
+    dead.write_bytes(
+        dead.read_bytes()
+        + b'{"seq":3,"kind":"counters","delta":{"teacher_generated":7},"model":null}\n'
+    )
+
+    telemetry._recover_state_wals("r1")
+
+    state = _on_disk(state_file)
+    assert state["counters"]["teacher_generated"] == 12
+    assert state["wal_seq"] == {dead.name: 3}
+    assert not dead.exists()
+
+
+def test_wal_seq_entries_of_removed_wals_are_dropped(state_file):
+    telemetry.update_counters({"teacher_generated": 1}, "r1")
+    telemetry.flush_state()
+    name = telemetry._wal_path("r1").name
+    assert _on_disk(state_file)["wal_seq"] == {name: 1}
+
+    # A clean exit removes the empty WAL; the next save drops its entry.
+    telemetry._shutdown_state()
+    telemetry.request_pause("r1")
+
+    assert _on_disk(state_file)["wal_seq"] == {}
+
+
+def test_only_control_writes_are_fsynced(state_file, monkeypatch):
+    synced = []
+    monkeypatch.setattr(telemetry.os, "fsync", synced.append)
+
+    telemetry.update_counters({"teacher_generated": 1}, "r1")
+    telemetry.flush_state()
+    assert synced == []
+
+    telemetry.request_stop("r1")
+    assert len(synced) == 2  # state file and its directory
+
+
+def test_non_numeric_delta_is_rejected_before_queueing(state_file):
+    with pytest.raises(TypeError, match="numeric"):
+        telemetry.update_counters({"teacher_generated": "3"}, "r1")
+
+    assert "r1" not in telemetry._pending_state
+    assert telemetry.get_state("r1")["status"] == "running"
+
+
+def test_run_paths_are_cached_per_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(telemetry, "AUTOTRAIN_DIR", str(tmp_path / "a"))
+    first = telemetry.get_state_path("r1")
+    assert telemetry.get_state_path("r1") is first
+    assert first == tmp_path / "a" / "runs" / "r1" / "state.json"
+
+    monkeypatch.setattr(telemetry, "AUTOTRAIN_DIR", str(tmp_path / "b"))
+    assert telemetry.get_state_path("r1") == tmp_path / "b" / "runs" / "r1" / "state.json"
+    assert telemetry.get_run_dir("r1") == tmp_path / "b" / "runs" / "r1"
+
+
+def test_status_polls_parse_only_changed_state(state_file, monkeypatch):
+    parses = []
+    real_read = telemetry._read_json_file
+    monkeypatch.setattr(telemetry, "_read_json_file", lambda p: parses.append(p) or real_read(p))
+    monkeypatch.setattr(telemetry, "_status_cache", {})
+
+    assert telemetry.check_stop_requested("r1") is False
+    assert telemetry.check_pause_requested("r1") is False
+    assert len(parses) == 1
+
+    telemetry.request_stop("r1")
+    parses.clear()
+    assert telemetry.check_stop_requested("r1") is True
+    assert telemetry.read_status_only("r1")["status"] == "stopped"
+    assert len(parses) == 1
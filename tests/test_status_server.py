@@ -0,0 +1,136 @@
+"""
+Unit tests for the helpers behind the HTTP status server.
+"""
+
+import json
+import os
+from types import SimpleNamespace
+
+from heidi_engine import telemetry
+
+
+def test_gpu_summary_is_cached_between_polls(monkeypatch):
+    queries = []
+    clock = iter([100.0, 101.0, 106.0])
+    monkeypatch.setattr(telemetry, "_gpu_cache", (0.0, {}))
+    monkeypatch.setattr(telemetry, "GPU_POLL_INTERVAL_SECONDS", 5.0)
+    monkeypatch.setattr(telemetry.time, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(
+        telemetry, "_query_gpu_summary", lambda: queries.append(1) or {"util_pct": len(queries)}
+    )
+
+    summaries = [telemetry.get_gpu_summary() for _ in range(3)]
+
+    assert summaries == [{"util_pct": 1}, {"util_pct": 1}, {"util_pct": 2}]
+    assert len(queries) == 2
+
+
+def test_gpu_summary_reads_nvml_handle(monkeypatch):
+    calls = []
+    fake_nvml = SimpleNamespace(
+        nvmlInit=lambda: calls.append("init"),
+        nvmlShutdown=lambda: None,
+        nvmlDeviceGetHandleByIndex=lambda index: f"gpu{index}",
+        nvmlDeviceGetMemoryInfo=lambda handle: SimpleNamespace(
+            used=512 * 1024 * 1024, total=8192 * 1024 * 1024
+        ),
+        nvmlDeviceGetUtilizationRates=lambda handle: SimpleNamespace(gpu=42),
+    )
+    monkeypatch.setattr(telemetry, "pynvml", fake_nvml)
+    telemetry._nvml_handle.cache_clear()
+    try:
+        for _ in range(2):
+            assert telemetry._query_gpu_summary() == {
+                "vram_used_mb": 512,
+                "vram_total_mb": 8192,
+                "util_pct": 42,
+            }
+    finally:
+        telemetry._nvml_handle.cache_clear()
+    assert calls == ["init"]
+
+
+def test_list_runs_parses_only_changed_state_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(telemetry, "AUTOTRAIN_DIR", str(tmp_path))
+    monkeypatch.setattr(telemetry, "_runs_cache", {})
+    for i, run_id in enumerate(["old", "new"]):
+        run_dir = tmp_path / "runs" / run_id
+        run_dir.mkdir(parents=True)
+        (run_dir / "state.json").write_text(json.dumps({"run_id": run_id, "status": "running"}))
+        os.utime(run_dir, (1000 + i, 1000 + i))
+    (tmp_path / "runs" / "stray.txt").write_text("x")
+
+    reads = []
+    read_json_file = telemetry._read_json_file
+    monkeypatch.setattr(
+        telemetry,
+        "_read_json_file",
+        lambda path: reads.append(path.parent.name) or read_json_file(path),
+    )
+
+    assert [run["run_id"] for run in telemetry.list_runs()] == ["new", "old"]
+    (tmp_path / "runs" / "old" / "state.json").write_text(
+        json.dumps({"run_id": "old", "status": "completed"})
+    )
+    runs = telemetry.list_runs()
+
+    assert [run["status"] for run in runs] == ["running", "completed"]
+    assert sorted(reads) == ["new", "old", "old"]
+    assert telemetry.get_latest_run() == "new"
+
+
+def test_last_event_ts_comes_from_memory_for_the_current_run(tmp_path, monkeypatch):
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text(json.dumps({"ts": "2026-01-01T00:00:00"}) + "\n")
+    monkeypatch.setattr(telemetry, "get_events_path", lambda run_id=None: events_file)
+    monkeypatch.setattr(telemetry, "get_run_id", lambda: "r1")
+
+    # Cold start: read from the tail of a (short) events file
+    monkeypatch.setattr(telemetry, "_last_event", (None, None))
+    assert telemetry.get_last_event_ts() == "2026-01-01T00:00:00"
+
+    monkeypatch.setattr(telemetry, "_last_event", ("r1", "2026-01-02T00:00:00"))
+    assert telemetry.get_last_event_ts() == "2026-01-02T00:00:00"
+
+    monkeypatch.setattr(telemetry, "_last_event", ("r0", "2026-01-02T00:00:00"))
+    assert telemetry.get_last_event_ts() == "2026-01-01T00:00:00"
+
+
+def test_remote_states_evict_least_recently_reported(monkeypatch):
+    monkeypatch.setattr(telemetry, "_remote_states", telemetry.OrderedDict())
+    monkeypatch.setattr(telemetry, "MAX_REMOTE_STATES", 2)
+
+    for run_id in ["a", "b", "a", "c"]:
+        telemetry._store_remote_state(run_id, {"run_id": run_id})
+
+    assert list(telemetry._remote_states) == ["a", "c"]
+
+
+def test_status_does_not_modify_stored_remote_state(monkeypatch):
+    import socket
+    import time
+    import urllib.request
+
+    monkeypatch.setattr(telemetry, "_remote_states", telemetry.OrderedDict())
+    monkeypatch.setattr(telemetry, "get_gpu_summary", lambda: {"available": False})
+    telemetry._store_remote_state("remote1", {"run_id": "remote1", "status": "running"})
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    telemetry.start_http_server(port)
+
+    url = f"http://127.0.0.1:{port}/status?run_id=remote1"
+    for _ in range(50):
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = json.loads(response.read())
+            break
+        except OSError:
+            time.sleep(0.1)
+    else:
+        raise AssertionError("status server did not start")
+
+    assert body["health"] == "ok"
+    assert "gpu_summary" in body
+    assert telemetry._remote_states["remote1"] == {"run_id": "remote1", "status": "running"}